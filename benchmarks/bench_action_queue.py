@@ -0,0 +1,82 @@
+"""
+Benchmark for a frame in which many mages each cast a spell: immediate Mage.cast_spell calls against
+intents submitted to an ActionQueue and resolved as one batch. Submission and resolution are timed
+separately, since submission can be spread across the AI threads that produce the intents.
+
+Run from the repository root:
+
+    python benchmarks/bench_action_queue.py [mages]
+
+Console output is redirected to os.devnull and the log file is written to a
+temporary directory so that terminal speed does not dominate the numbers.
+"""
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from rpg_world import (  # noqa: E402
+    ActionQueue,
+    Character,
+    CharacterStats,
+    Mage,
+    SimpleChangeFormula,
+    Spell,
+    SpellEffect,
+)
+
+FRAMES = 20
+
+
+def run(count):
+    bolt = Spell("Bolt", 1, 0, [SpellEffect("health", SimpleChangeFormula(-1))])
+    mages = [Mage(f"Mage {i}", mana=10 ** 9, spells=[bolt]) for i in range(count)]
+    targets = [Character(f"Goblin {i}", CharacterStats(health=10 ** 9), id=f"goblin-{i}") for i in range(count)]
+    for obj in mages + targets + [bolt] + bolt.effects:
+        obj.logger.logger.setLevel(logging.WARNING)
+    queue = ActionQueue()
+    queue.logger.logger.setLevel(logging.WARNING)
+    pairs = list(zip(mages, targets))
+
+    immediate = submit = resolve = float("inf")
+    for frame in range(FRAMES):
+        start = time.perf_counter()
+        for mage, target in pairs:
+            mage.cast_spell("Bolt", target, current_time=frame)
+        immediate = min(immediate, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for mage, target in pairs:
+            queue.cast(mage, "Bolt", target)
+        middle = time.perf_counter()
+        queue.resolve(current_time=frame)
+        end = time.perf_counter()
+        submit = min(submit, middle - start)
+        resolve = min(resolve, end - middle)
+    return immediate, submit, resolve
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    real_stderr = sys.stderr
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        os.chdir(tmp)
+        sys.stderr = devnull
+        try:
+            immediate, submit, resolve = run(count)
+        finally:
+            sys.stderr = real_stderr
+
+    per = 1e6 / count
+    print(f"immediate cast_spell   {immediate * per:8.2f} us/action ({count} mages, 1 cast each, logging at WARNING)")
+    print(f"queue submit           {submit * per:8.2f} us/action")
+    print(f"queue resolve          {resolve * per:8.2f} us/action")
+    print(f"queue total            {(submit + resolve) * per:8.2f} us/action")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark for applying a batch of limited stat changes to many characters, e.g. an area spell that
+drains health, mana and focus.
+
+Run from the repository root:
+
+    python benchmarks/bench_apply_deltas.py [count]
+
+Compares one Formula.apply_limits + Stats.modify call per change, Stats.apply_deltas,
+and the vectorized StatsStore.apply_deltas (requires NumPy).
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from rpg_world import CharacterStats, SimpleChangeFormulaWithStatLimits, Stats, StatsStore  # noqa: E402
+
+DELTAS = (("health", -25), ("mana", -10), ("focus", 15))
+
+
+class Target:
+    """Stands in for a Character, which only needs a `stats` attribute here, to keep construction cheap."""
+
+    def __init__(self, stats):
+        self.stats = stats
+
+
+def make_population(count):
+    return [Target(CharacterStats(health=100, mana=50, focus=20)) for _ in range(count)]
+
+
+def per_change(population):
+    formula = SimpleChangeFormulaWithStatLimits(0)
+    for character in population:
+        for attribute, amount in DELTAS:
+            character.stats.modify(attribute, formula.apply_limits(amount, character, attribute))
+
+
+def batch(population):
+    return [(character, attribute, amount) for character in population for attribute, amount in DELTAS]
+
+
+def run(count):
+    population = make_population(count)
+    results = [("modify per change", min(timeit.repeat(lambda: per_change(population), number=3, repeat=3)) / 3)]
+
+    triples = batch(population)
+    results.append(("Stats.apply_deltas", min(timeit.repeat(lambda: Stats.apply_deltas(triples), number=3, repeat=3)) / 3))
+
+    store = StatsStore(count)
+    population = make_population(count)
+    for character in population:
+        store.attach(character.stats)
+    triples = batch(population)
+    results.append(("StatsStore.apply_deltas", min(timeit.repeat(lambda: store.apply_deltas(triples), number=3, repeat=3)) / 3))
+    return results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    results = run(count)
+    print(f"{'method':<26}{'ms/batch':>10}{'M changes/s':>13}  (n={count} characters x {len(DELTAS)} stats)")
+    for label, elapsed in results:
+        print(f"{label:<26}{elapsed * 1e3:>10.2f}{count * len(DELTAS) / elapsed / 1e6:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
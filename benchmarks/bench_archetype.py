@@ -0,0 +1,81 @@
+"""
+Benchmark for populating a world with many similar characters: memory and time per character for
+mages created through Mage(...), each with its own three spells, against mages spawned from an Archetype
+that shares its spells and base stats.
+
+Run from the repository root:
+
+    python benchmarks/bench_archetype.py [count]
+
+Console output is redirected to os.devnull and the log file is written to a
+temporary directory so that terminal speed does not dominate the numbers.
+"""
+import logging
+import os
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from rpg_world import AbilityRegistry, Archetype, Mage, SimpleChangeFormula, Spell, SpellEffect  # noqa: E402
+
+
+def make_spells():
+    return [
+        Spell(f"Spell {i}", 10, 5, [SpellEffect("health", SimpleChangeFormula(-5 - i))])
+        for i in range(3)
+    ]
+
+
+def run(count):
+    logging.getLogger("rpg_world").setLevel(logging.WARNING)
+    # Archetypes share their spells between spawned characters, so they must be shared definitions
+    definitions = [AbilityRegistry.define(spell) for spell in make_spells()]
+    archetype = Archetype("Acolyte", character_class=Mage, stats={"health": 100, "mana": 100, "focus": 100, "armor": 0},
+                          spells=definitions)
+
+    def with_init(index):
+        return Mage(f"Acolyte {index}", spells=make_spells())
+
+    def with_archetype(index):
+        return archetype.spawn()
+
+    results = {}
+    for label, create in (("Mage(...)", with_init), ("spawn()", with_archetype)):
+        create(0)  # Warm up caches (loggers, stat properties) outside the measurement
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        characters = [create(index) for index in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del characters
+
+        elapsed = min(timeit.repeat(lambda: [create(index) for index in range(count)], number=1, repeat=5))
+        results[label] = ((after - before) / count, elapsed / count * 1e6)
+    for definition in definitions:
+        AbilityRegistry.remove(definition.name)
+    return results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    real_stderr = sys.stderr
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        os.chdir(tmp)
+        sys.stderr = devnull
+        try:
+            results = run(count)
+        finally:
+            sys.stderr = real_stderr
+
+    for label, (per_bytes, per_us) in results.items():
+        print(f"{label:<10} {per_bytes:8.0f} bytes/character {per_us:8.2f} us/character (n={count}, 3 spells)")
+    print(f"memory: {results['Mage(...)'][0] / results['spawn()'][0]:.1f}x less, "
+          f"time: {results['Mage(...)'][1] / results['spawn()'][1]:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
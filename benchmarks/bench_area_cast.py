@@ -0,0 +1,83 @@
+"""
+Benchmark for an area-of-effect spell hitting many enemies: one Mage.cast_spell per target against
+a single Mage.cast_spell_area, with plain stats and with the targets' stats kept in a StatsStore.
+The spell has three effects on the target: a fixed change, a limited change and a formula reading
+the target's focus and armor.
+
+Run from the repository root:
+
+    python benchmarks/bench_area_cast.py [targets]
+
+Console output is redirected to os.devnull and the log file is written to a
+temporary directory so that terminal speed does not dominate the numbers.
+"""
+import logging
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from rpg_world import (  # noqa: E402
+    Character,
+    CharacterStats,
+    Mage,
+    MultiEffectTargetFormula,
+    SimpleChangeFormula,
+    SimpleChangeFormulaWithStatLimits,
+    Spell,
+    SpellEffect,
+    StatsStore,
+)
+
+
+def run(count, stored):
+    spell = Spell("Fireball", 1, 0, [
+        SpellEffect("health", SimpleChangeFormula(-1)),
+        SpellEffect("health", SimpleChangeFormulaWithStatLimits(-1)),
+        SpellEffect("health", MultiEffectTargetFormula()),
+    ])
+    mage = Mage("Caster", mana=10 ** 12, spells=[spell])
+    targets = [Character(f"Goblin {i}", CharacterStats(health=10 ** 12, focus=i % 50, armor=i % 20)) for i in range(count)]
+    if stored:
+        store = StatsStore(capacity=count + 1)
+        for character in [mage] + targets:
+            store.attach(character.stats)
+    for obj in [mage, spell] + targets + spell.effects:
+        obj.logger.logger.setLevel(logging.WARNING)
+
+    def one_by_one():
+        for target in targets:
+            mage.cast_spell("Fireball", target, current_time=1)
+
+    def area():
+        mage.cast_spell_area("Fireball", targets, current_time=1)
+
+    results = {}
+    for label, cast in (("one by one", one_by_one), ("area", area)):
+        results[label] = min(timeit.repeat(cast, number=20, repeat=5)) / 20 * 1e6
+    return results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+
+    real_stderr = sys.stderr
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        os.chdir(tmp)
+        sys.stderr = devnull
+        try:
+            results = {stored: run(count, stored) for stored in (False, True)}
+        finally:
+            sys.stderr = real_stderr
+
+    for stored, timings in results.items():
+        storage = "StatsStore" if stored else "plain stats"
+        for label, per_cast in timings.items():
+            print(f"{storage:<12} {label:<11} {per_cast:10.1f} us per {count} targets (3 effects, logging at WARNING)")
+        print(f"{storage:<12} speedup: {timings['one by one'] / timings['area']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
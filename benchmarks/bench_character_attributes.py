@@ -0,0 +1,63 @@
+"""
+Benchmark for stat access through a character: reading and writing `character.health`, reading an
+additional stat, assigning a plain (non-stat) attribute, and sorting a party by focus, both with a
+key reading `character.focus` and through TurnOrder with SimpleFocusTurnOrderFormula.
+
+Run from the repository root:
+
+    python benchmarks/bench_character_attributes.py [count]
+
+Console output is redirected to os.devnull and the log file is written to a
+temporary directory so that terminal speed does not dominate the numbers.
+"""
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from rpg_world import Mage, SimpleFocusTurnOrderFormula, TurnOrder  # noqa: E402
+
+
+def run(count):
+    mage = Mage("Mage")
+    mage.stats.set("wisdom", 12)
+    party = [Mage(f"Member {i}", focus=(i * 37) % 100) for i in range(100)]
+    turn_order = TurnOrder(party, SimpleFocusTurnOrderFormula)
+    logger = mage.logger
+
+    cases = {
+        "read health": ("mage.health", count),
+        "write health": ("mage.health = 90", count),
+        "read extra stat": ("mage.wisdom", count),
+        "write non-stat": ("mage.logger = logger", count),
+        "sort 100 by .focus": ("sorted(party, key=lambda c: c.focus)", count // 100),
+        "TurnOrder 100": ("turn_order.calculate_turn_order()", count // 100),
+    }
+    namespace = {"mage": mage, "party": party, "turn_order": turn_order, "logger": logger}
+    return {
+        label: (min(timeit.repeat(statement, globals=namespace, number=number, repeat=5)) / number * 1e9, number)
+        for label, (statement, number) in cases.items()
+    }
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    real_stderr = sys.stderr
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        os.chdir(tmp)
+        sys.stderr = devnull
+        try:
+            results = run(count)
+        finally:
+            sys.stderr = real_stderr
+
+    print(f"{'case':<22}{'ns/call':>12}")
+    for label, (per_call, number) in results.items():
+        print(f"{label:<22}{per_call:>12.1f}  (n={number})")
+
+
+if __name__ == "__main__":
+    main()
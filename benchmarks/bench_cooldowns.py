@@ -0,0 +1,96 @@
+"""
+Benchmark for finding the abilities that came off cooldown in each game tick: polling
+is_on_cooldown() on every ability of every caster, against CooldownTracker.pop_ready().
+
+Every caster knows three spells with cooldowns between 2 and 10 seconds and recasts each spell as
+soon as it is ready, so the number of running cooldowns stays constant.
+
+Run from the repository root:
+
+    python benchmarks/bench_cooldowns.py [casters]
+
+Console output is redirected to os.devnull and the log file is written to a
+temporary directory so that terminal speed does not dominate the numbers.
+"""
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from rpg_world import CooldownTracker, SimpleChangeFormula, Spell, SpellEffect  # noqa: E402
+
+TICK = 0.1
+TICKS = 200
+
+
+def make_casters(count):
+    rng = random.Random(7)
+    casters = []
+    for index in range(count):
+        spells = [
+            Spell(f"Spell {i}", 0, rng.choice((2, 3, 5, 7, 10)), [SpellEffect("health", SimpleChangeFormula(-1))])
+            for i in range(3)
+        ]
+        for spell in spells:
+            spell.logger.logger.setLevel(logging.WARNING)
+            spell.last_cast_time = rng.uniform(0.01, spell.cooldown)
+        casters.append((f"caster {index}", spells))
+    return casters
+
+
+def with_polling(casters):
+    ready_count = 0
+    start = time.perf_counter()
+    for tick in range(1, TICKS + 1):
+        now = 10 + tick * TICK
+        for caster, spells in casters:
+            for spell in spells:
+                if not spell.is_on_cooldown(now):
+                    ready_count += 1
+                    spell.last_cast_time = now
+    return time.perf_counter() - start, ready_count
+
+
+def with_tracker(casters):
+    tracker = CooldownTracker()
+    for caster, spells in casters:
+        for spell in spells:
+            tracker.add(caster, spell, spell.last_cast_time)
+    ready_count = 0
+    start = time.perf_counter()
+    for tick in range(1, TICKS + 1):
+        now = 10 + tick * TICK
+        for caster, spell in tracker.pop_ready(now):
+            ready_count += 1
+            spell.last_cast_time = now
+            tracker.add(caster, spell, now)
+    return time.perf_counter() - start, ready_count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    real_stderr = sys.stderr
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        os.chdir(tmp)
+        sys.stderr = devnull
+        try:
+            results = {}
+            for label, run in (("polling", with_polling), ("tracker", with_tracker)):
+                runs = [run(make_casters(count)) for _ in range(3)]
+                results[label] = (min(elapsed for elapsed, _ in runs), runs[0][1])
+        finally:
+            sys.stderr = real_stderr
+
+    for label, (elapsed, ready_count) in results.items():
+        print(f"{label:<8} {elapsed / TICKS * 1e3:8.3f} ms/tick ({ready_count} spells became ready, "
+              f"{count} casters x 3 spells, {TICKS} ticks)")
+    print(f"speedup: {results['polling'][0] / results['tracker'][0]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Microbenchmark for Effect.apply with the effect logger enabled (INFO) and disabled (WARNING).
+
+Run from the repository root:
+
+    python benchmarks/bench_effect.py [count]
+
+Console output is redirected to os.devnull and the log file is written to a
+temporary directory so that terminal speed does not dominate the numbers.
+"""
+import logging
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from rpg_world import (  # noqa: E402
+    Character,
+    CharacterStats,
+    Effect,
+    SimpleChangeFormula
+)
+
+
+class Dummy(Character):
+    def __init__(self, name):
+        super().__init__(name, CharacterStats(health=100))
+
+
+def run(count):
+    target = Dummy("Target")
+    effect = Effect("health", SimpleChangeFormula(0))
+    results = []
+    for level in (logging.INFO, logging.WARNING):
+        effect.logger.logger.setLevel(level)
+        elapsed = min(timeit.repeat(lambda: effect.apply(target), number=count, repeat=3))
+        results.append((logging.getLevelName(level), elapsed / count * 1e6))
+    return results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    real_stderr = sys.stderr
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        os.chdir(tmp)
+        sys.stderr = devnull
+        try:
+            results = run(count)
+        finally:
+            sys.stderr = real_stderr
+
+    print(f"{'level':<8} {'us/apply':>9}  (n={count})")
+    for level, per_call in results:
+        print(f"{level:<8} {per_call:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
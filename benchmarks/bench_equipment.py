@@ -0,0 +1,68 @@
+"""
+Benchmark for swapping equipment: one equip + unequip cycle of an item with three effects.
+
+Run from the repository root:
+
+    python benchmarks/bench_equipment.py [count]
+
+Console output is redirected to os.devnull and the log file is written to a
+temporary directory so that terminal speed does not dominate the numbers.
+"""
+import logging
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from rpg_world import (  # noqa: E402
+    Character,
+    CharacterStats,
+    Effect,
+    Equipment,
+    SimpleChangeFormula
+)
+
+
+class Knight(Character):
+    def __init__(self, name):
+        super().__init__(name, CharacterStats(health=100, armor=10, strength=12))
+
+
+def run(count):
+    knight = Knight("Knight")
+    effects = [
+        Effect("health", SimpleChangeFormula(20)),
+        Effect("armor", SimpleChangeFormula(5)),
+        Effect("strength", SimpleChangeFormula(3)),
+    ]
+    plate = Equipment("Plate", "Heavy armor.", 500, effects)
+    for logger in (knight.logger, plate.logger, effects[0].logger):
+        logger.logger.setLevel(logging.WARNING)
+
+    def swap():
+        plate.equip(knight)
+        plate.unequip(knight)
+
+    elapsed = min(timeit.repeat(swap, number=count, repeat=5))
+    return elapsed / count * 1e6
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    real_stderr = sys.stderr
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        os.chdir(tmp)
+        sys.stderr = devnull
+        try:
+            per_swap = run(count)
+        finally:
+            sys.stderr = real_stderr
+
+    print(f"equip + unequip: {per_swap:.2f} us (n={count}, 3 effects, logging at WARNING)")
+
+
+if __name__ == "__main__":
+    main()
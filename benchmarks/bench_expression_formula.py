@@ -0,0 +1,66 @@
+"""
+Benchmark for ExpressionFormula against the equivalent Formula subclass (MultiEffectTargetFormula):
+calculate() calls with keyword arguments, and the compiled functions used by spell casts.
+
+Run from the repository root:
+
+    python benchmarks/bench_expression_formula.py [count]
+
+Character logging goes to os.devnull and the log file is written to a temporary directory.
+"""
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from rpg_world import (  # noqa: E402
+    Character,
+    CharacterStats,
+    ExpressionFormula,
+    MultiEffectTargetFormula,
+    StatSchema,
+)
+
+
+def measure(function, count):
+    return min(timeit.repeat(function, number=count, repeat=5)) / count * 1e6
+
+
+def run(count):
+    target = Character("Target", CharacterStats(focus=40, armor=20))
+    health = StatSchema.id("health")
+    formulas = {
+        "MultiEffectTargetFormula": MultiEffectTargetFormula(),
+        "ExpressionFormula": ExpressionFormula("-(50 + target.focus * 0.5) * (1 - target.armor / 100)"),
+    }
+    results = []
+    for name, formula in formulas.items():
+        compiled = formula.compile("health", health)
+        results.append((
+            name,
+            measure(lambda: formula.calculate(target=target, attribute="health", stat_id=health), count),
+            measure(lambda: compiled(None, target, target, None), count),
+        ))
+    return results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    real_stderr = sys.stderr
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        os.chdir(tmp)
+        sys.stderr = devnull
+        try:
+            results = run(count)
+        finally:
+            sys.stderr = real_stderr
+
+    for name, calculate, compiled in results:
+        print(f"{name:26} calculate {calculate:6.3f} us   compiled {compiled:6.3f} us   (n={count})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmarks for writing and filtering the binary telemetry journal.
+
+Run from the repository root:
+
+    python benchmarks/bench_journal.py [count]
+
+Filtering is measured with NumPy (when installed) and with the pure-Python fallback.
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from rpg_world import Journal, JournalEvent, JournalReader  # noqa: E402
+from rpg_world.telemetry import journal_reader  # noqa: E402
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    targets = [f"Goblin {i}" for i in range(1000)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.journal")
+
+        start = time.perf_counter()
+        with Journal(path) as journal:
+            for i in range(count):
+                journal.record(JournalEvent.SPELL_EFFECT_APPLIED, "Merlin", targets[i % 1000], "health", -1.0)
+        elapsed = time.perf_counter() - start
+        print(f"write          {count / elapsed / 1e6:8.2f} M records/s  ({os.path.getsize(path) / 2**20:.1f} MiB)")
+
+        backends = [("numpy", journal_reader.np), ("struct", None)]
+        for label, backend in backends:
+            if label == "numpy" and backend is None:
+                continue
+            journal_reader.np = backend
+            reader = JournalReader(path)
+            start = time.perf_counter()
+            matched = reader.count(target="Goblin 7", attribute="health")
+            elapsed = time.perf_counter() - start
+            print(f"filter {label:<7} {count / elapsed / 1e6:8.2f} M records/s  ({matched} matched)")
+
+
+if __name__ == "__main__":
+    main()
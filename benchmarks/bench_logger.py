@@ -0,0 +1,89 @@
+"""
+Benchmarks for the cost that logging adds to object construction.
+
+Run from the repository root:
+
+    python benchmarks/bench_logger.py [count]
+
+Every constructed object gets a unique name, mirroring procedurally named entities.
+Console output is redirected to os.devnull and the log file is written to a
+temporary directory so that terminal speed does not dominate the numbers.
+"""
+import os
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from rpg_world import (  # noqa: E402
+    Character,
+    CharacterStats,
+    Consumable,
+    Equipment,
+    Location,
+    Position,
+    World
+)
+
+
+class Goblin(Character):
+    def __init__(self, name):
+        super().__init__(name, CharacterStats(health=30, focus=10))
+
+
+FACTORIES = {
+    "Character": lambda i: Goblin(f"Goblin {i}"),
+    "Consumable": lambda i: Consumable(f"Potion {i}", "Restores health.", 5, []),
+    "Equipment": lambda i: Equipment(f"Sword {i}", "A sharp blade.", 10, []),
+    "Position": lambda i: Position(f"Position {i}", i, i),
+    "Location": lambda i: Location(f"Location {i}", "A place."),
+    "World": lambda i: World(f"World {i}"),
+}
+
+
+def open_fd_count():
+    """Return the number of file descriptors currently open by this process."""
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except OSError:
+        return -1
+
+
+def run(count):
+    results = []
+    for label, factory in FACTORIES.items():
+        fds_before = open_fd_count()
+        keep = []
+        start = time.perf_counter()
+        for i in range(count):
+            keep.append(factory(i))
+        elapsed = time.perf_counter() - start
+        results.append((label, elapsed / count * 1e6, open_fd_count() - fds_before))
+    return results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    # Make sure the benchmark measures handler creation rather than the fd limit.
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+    real_stderr = sys.stderr
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        os.chdir(tmp)
+        sys.stderr = devnull
+        try:
+            results = run(count)
+        finally:
+            sys.stderr = real_stderr
+
+    print(f"{'class':<12} {'us/object':>10} {'fds opened':>11}  (n={count})")
+    for label, per_object, fds in results:
+        print(f"{label:<12} {per_object:>10.1f} {fds:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark for what-if simulation: evaluating one spell cast on copies of the caster and target,
+made with copy.deepcopy against copy-on-write overlays (Character.overlay).
+
+Run from the repository root:
+
+    python benchmarks/bench_snapshot.py [count]
+
+Console output is redirected to os.devnull and the log file is written to a
+temporary directory so that terminal speed does not dominate the numbers.
+"""
+import copy
+import logging
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from rpg_world import Mage, SimpleChangeFormula, Spell, SpellEffect  # noqa: E402
+
+
+def run(count):
+    spells = [
+        Spell(f"Spell {i}", 10, 5, [SpellEffect("health", SimpleChangeFormula(-5 - i))])
+        for i in range(4)
+    ]
+    caster = Mage("Caster", spells=spells)
+    target = Mage("Target")
+    for obj in [caster, target] + spells + [effect for spell in spells for effect in spell.effects]:
+        obj.logger.logger.setLevel(logging.WARNING)
+
+    def with_deepcopy():
+        what_if_caster, what_if_target = copy.deepcopy((caster, target))
+        what_if_caster.cast_spell("Spell 0", what_if_target, current_time=1)
+        return what_if_target.health
+
+    def with_overlay():
+        what_if_caster, what_if_target = caster.overlay(), target.overlay()
+        what_if_caster.cast_spell("Spell 0", what_if_target, current_time=1)
+        return what_if_target.health
+
+    assert with_deepcopy() == with_overlay() == 95
+    results = {}
+    for label, evaluate in (("deepcopy", with_deepcopy), ("overlay", with_overlay)):
+        elapsed = min(timeit.repeat(evaluate, number=count, repeat=5))
+        results[label] = elapsed / count * 1e6
+    return results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    real_stderr = sys.stderr
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        os.chdir(tmp)
+        sys.stderr = devnull
+        try:
+            results = run(count)
+        finally:
+            sys.stderr = real_stderr
+
+    for label, per_eval in results.items():
+        print(f"{label:<10} copy + cast: {per_eval:8.2f} us (n={count}, 4 spells, logging at WARNING)")
+    print(f"speedup: {results['deepcopy'] / results['overlay']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
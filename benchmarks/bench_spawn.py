@@ -0,0 +1,68 @@
+"""
+Benchmark for populating a game state with many monsters: characters created one by one through
+Character.__init__ and GameState.add_character, against GameState.spawn_many with an Archetype.
+
+Run from the repository root:
+
+    python benchmarks/bench_spawn.py [count]
+
+Console output is redirected to os.devnull and the log file is written to a
+temporary directory so that terminal speed does not dominate the numbers.
+The 'rpg_world' loggers are left at their default INFO level, as in a game that keeps its log.
+"""
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from rpg_world import Archetype, Character, CharacterStats, GameState  # noqa: E402
+
+
+class Goblin(Character):
+    pass
+
+
+def run(count):
+    archetype = Archetype("Goblin", character_class=Goblin, stats={"health": 30, "mana": 0, "strength": 4})
+
+    def one_by_one():
+        game_state = GameState()
+        for index in range(count):
+            stats = CharacterStats(health=30, mana=0, strength=4)
+            game_state.add_character(Goblin(f"Goblin {index}", stats, id=f"Goblin-{index}"))
+        return game_state
+
+    def spawn_many():
+        game_state = GameState()
+        game_state.spawn_many(archetype, count)
+        return game_state
+
+    assert len(one_by_one().characters) == len(spawn_many().characters) == count
+    results = {}
+    for label, populate in (("one by one", one_by_one), ("spawn_many", spawn_many)):
+        elapsed = min(timeit.repeat(populate, number=1, repeat=5))
+        results[label] = count / elapsed
+    return results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    real_stderr = sys.stderr
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        os.chdir(tmp)
+        sys.stderr = devnull
+        try:
+            results = run(count)
+        finally:
+            sys.stderr = real_stderr
+
+    for label, rate in results.items():
+        print(f"{label:<12} {rate:12,.0f} characters/s (n={count})")
+    print(f"speedup: {results['spawn_many'] / results['one by one']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
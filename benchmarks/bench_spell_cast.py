@@ -0,0 +1,63 @@
+"""
+Benchmark for Spell.cast with a three-effect spell: a fixed change, a limited change on the caster
+and a formula reading the target's stats. Reports casts per second with ability and effect logging
+at WARNING, the hot-path configuration, and with journaling off.
+
+Run from the repository root:
+
+    python benchmarks/bench_spell_cast.py [count]
+
+Console output is redirected to os.devnull and the log file is written to a
+temporary directory so that terminal speed does not dominate the numbers.
+"""
+import logging
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from rpg_world import (  # noqa: E402
+    Character,
+    CharacterStats,
+    MultiEffectTargetFormula,
+    SimpleChangeFormula,
+    SimpleChangeFormulaWithStatLimits,
+    Spell,
+    SpellEffect,
+)
+
+
+def run(count):
+    spell = Spell("Mystic Blast", 0, 0, [
+        SpellEffect("health", SimpleChangeFormula(-1)),
+        SpellEffect("mana", SimpleChangeFormulaWithStatLimits(-1), recipient="caster"),
+        SpellEffect("health", MultiEffectTargetFormula()),
+    ])
+    caster = Character("Caster", CharacterStats(health=100, mana=10 ** 12))
+    target = Character("Target", CharacterStats(health=10 ** 12, mana=10 ** 12))
+    for obj in [spell, caster, target] + spell.effects:
+        obj.logger.logger.setLevel(logging.WARNING)
+
+    elapsed = min(timeit.repeat(lambda: spell.cast(caster, target, 1), number=count, repeat=5))
+    return count / elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+
+    real_stderr = sys.stderr
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        os.chdir(tmp)
+        sys.stderr = devnull
+        try:
+            rate = run(count)
+        finally:
+            sys.stderr = real_stderr
+
+    print(f"Spell.cast: {rate:12,.0f} casts/s ({1e6 / rate:.2f} us/cast, n={count}, 3 effects, logging at WARNING)")
+
+
+if __name__ == "__main__":
+    main()
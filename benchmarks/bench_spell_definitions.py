@@ -0,0 +1,72 @@
+"""
+Benchmark for the memory held by mages that know the same spells: one Spell instance per mage per
+spell, against shared definitions from AbilityRegistry with per-caster cooldowns. Every mage casts
+each of its spells once, so the per-caster cooldown state is included.
+
+Run from the repository root:
+
+    python benchmarks/bench_spell_definitions.py [mages] [spells]
+
+Console output is redirected to os.devnull and the log file is written to a
+temporary directory so that terminal speed does not dominate the numbers.
+"""
+import logging
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from rpg_world import AbilityRegistry, Character, CharacterStats, Mage, SimpleChangeFormula, Spell, SpellEffect  # noqa: E402
+
+
+def make_spells(count):
+    return [Spell(f"Spell {i}", 0, 5, [SpellEffect("health", SimpleChangeFormula(-1))]) for i in range(count)]
+
+
+def measure(mage_count, spell_count, shared):
+    target = Character("Dummy", CharacterStats(health=10 ** 9))
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    if shared:
+        definitions = [AbilityRegistry.define(spell) for spell in make_spells(spell_count)]
+        mages = [Mage(f"Mage {i}", spells=definitions) for i in range(mage_count)]
+    else:
+        mages = [Mage(f"Mage {i}", spells=make_spells(spell_count)) for i in range(mage_count)]
+    for mage in mages:
+        for name in mage.spells:
+            mage.cast_spell(name, target, current_time=1)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    if shared:
+        for definition in definitions:
+            AbilityRegistry.remove(definition.name)
+    return (after - before) / mage_count
+
+
+def main():
+    mage_count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    spell_count = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    real_stderr = sys.stderr
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        os.chdir(tmp)
+        sys.stderr = devnull
+        logging.getLogger("rpg_world").setLevel(logging.WARNING)
+        try:
+            Mage("Warm-up", spells=make_spells(1))
+            results = {
+                "per mage": measure(mage_count, spell_count, shared=False),
+                "shared": measure(mage_count, spell_count, shared=True),
+            }
+        finally:
+            sys.stderr = real_stderr
+
+    for label, per_mage in results.items():
+        print(f"{label:<9} {per_mage:10.0f} bytes/mage ({mage_count} mages x {spell_count} spells, all cast once)")
+    print(f"memory: {results['per mage'] / results['shared']:.1f}x less")
+
+
+if __name__ == "__main__":
+    main()
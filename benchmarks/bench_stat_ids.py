@@ -0,0 +1,72 @@
+"""
+Benchmark for the stat-addressing hot paths: Formula.apply_limits, Effect.apply with a limited formula,
+and sorting a party by focus with SimpleFocusTurnOrderFormula.
+
+Run from the repository root:
+
+    python benchmarks/bench_stat_ids.py [count]
+
+Console output is redirected to os.devnull and the log file is written to a
+temporary directory so that terminal speed does not dominate the numbers.
+"""
+import logging
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from rpg_world import (  # noqa: E402
+    Character,
+    CharacterStats,
+    Effect,
+    SimpleChangeFormulaWithStatLimits,
+    SimpleFocusTurnOrderFormula
+)
+
+
+class Dummy(Character):
+    def __init__(self, name, focus=100):
+        super().__init__(name, CharacterStats(health=100, focus=focus))
+
+
+def run(count):
+    target = Dummy("Target")
+    formula = SimpleChangeFormulaWithStatLimits(0)
+    effect = Effect("health", formula)
+    party = [Dummy(f"Member {i}", focus=(i * 37) % 100) for i in range(20)]
+    turn_order = SimpleFocusTurnOrderFormula(party)
+    for obj in [target, effect] + party:
+        obj.logger.logger.setLevel(logging.WARNING)
+
+    cases = {
+        "apply_limits": lambda: formula.apply_limits(5, target, "health"),
+        "Effect.apply": lambda: effect.apply(target),
+        "turn order (20)": turn_order.calculate,
+    }
+    return {
+        label: min(timeit.repeat(case, number=count, repeat=5)) / count * 1e6
+        for label, case in cases.items()
+    }
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+
+    real_stderr = sys.stderr
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        os.chdir(tmp)
+        sys.stderr = devnull
+        try:
+            results = run(count)
+        finally:
+            sys.stderr = real_stderr
+
+    print(f"{'case':<18}{'us/call':>9}  (n={count}, logging at WARNING)")
+    for label, per_call in results.items():
+        print(f"{label:<18}{per_call:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
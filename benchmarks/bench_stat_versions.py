@@ -0,0 +1,60 @@
+"""
+Benchmark for the overhead of per-attribute version tracking on stat writes, and the cost of reading it.
+
+Run from the repository root:
+
+    python benchmarks/bench_stat_versions.py [count]
+
+Reports nanoseconds per call for writes (set, modify) on the dict-backed Stats and the slotted
+CharacterStats, and for the tracking queries (version, drain_dirty).
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from rpg_world import CharacterStats, Stats  # noqa: E402
+
+
+FACTORIES = {
+    "Stats": lambda: Stats(health=100, max_health=100, mana=80, max_mana=80, focus=50, max_focus=50, armor=10),
+    "CharacterStats": lambda: CharacterStats(health=100, mana=80, focus=50, armor=10),
+}
+
+OPERATIONS = {
+    "set": "stats.set('health', 90)",
+    "modify": "stats.modify('health', -1)",
+    "version": "stats.version('health')",
+    "drain_dirty": "stats.modify('health', -1); stats.drain_dirty()",
+}
+
+
+def run(count):
+    results = []
+    for label, factory in FACTORIES.items():
+        timings = []
+        for name, statement in OPERATIONS.items():
+            stats = factory()
+            if not hasattr(stats, name):
+                timings.append(None)
+                continue
+            elapsed = min(timeit.repeat(statement, globals={"stats": stats}, number=count, repeat=7))
+            timings.append(elapsed / count * 1e9)
+        results.append((label, timings))
+    return results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    results = run(count)
+    header = "".join(f"{name:>13}" for name in OPERATIONS)
+    print(f"{'class':<16}{header}  (ns/call, n={count})")
+    for label, timings in results:
+        row = "".join(f"{'-':>13}" if ns is None else f"{ns:>13.1f}" for ns in timings)
+        print(f"{label:<16}{row}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmarks for stat reads, writes and memory: the slotted CharacterStats against the dict-backed Stats.
+
+Run from the repository root:
+
+    python benchmarks/bench_stats.py [count]
+
+Both objects hold the same seven core fields (health, max_health, mana, max_mana, focus, max_focus, armor).
+Memory is measured with tracemalloc over `count` instances, so it includes any per-instance dictionaries.
+"""
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from rpg_world import CharacterStats, Stats  # noqa: E402
+
+
+FACTORIES = {
+    "Stats": lambda: Stats(health=100, max_health=100, mana=80, max_mana=80, focus=50, max_focus=50, armor=10),
+    "CharacterStats": lambda: CharacterStats(health=100, mana=80, focus=50, armor=10),
+}
+
+OPERATIONS = {
+    "attr read": "stats.health",
+    "get": "stats.get('health')",
+    "set": "stats.set('health', 90)",
+    "modify": "stats.modify('health', -1)",
+}
+
+
+def bytes_per_instance(factory, count):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Discount the list that holds the instances
+    return (after - before - sys.getsizeof(keep)) / len(keep)
+
+
+def run(count):
+    results = []
+    for label, factory in FACTORIES.items():
+        stats = factory()
+        timings = []
+        for statement in OPERATIONS.values():
+            elapsed = min(timeit.repeat(statement, globals={"stats": stats}, number=count, repeat=5))
+            timings.append(count / elapsed / 1e6)
+        results.append((label, timings, bytes_per_instance(factory, 10000)))
+    return results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    results = run(count)
+    header = "".join(f"{name:>12}" for name in OPERATIONS)
+    print(f"{'class':<16}{header}{'bytes/inst':>12}  (M ops/s, n={count})")
+    for label, timings, size in results:
+        row = "".join(f"{ops:>12.2f}" for ops in timings)
+        print(f"{label:<16}{row}{size:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
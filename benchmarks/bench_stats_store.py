@@ -0,0 +1,69 @@
+"""
+Benchmark for a population-wide stat update: per-object CharacterStats against the columnar StatsStore.
+
+Run from the repository root:
+
+    python benchmarks/bench_stats_store.py [count]
+
+Each tick regenerates 5 mana for every living character, clamps health, mana and focus
+to [0, max] and counts the characters that are still alive. Requires NumPy.
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from rpg_world import CharacterStats, StatsStore  # noqa: E402
+
+
+def make_population(count):
+    population = [CharacterStats(health=100, mana=50, focus=20) for _ in range(count)]
+    for i, stats in enumerate(population):
+        stats.health = i % 120 - 10
+        stats.mana = i % 60
+    return population
+
+
+def tick_objects(population):
+    alive = 0
+    for stats in population:
+        if stats.health > 0:
+            stats.mana += 5
+            alive += 1
+        for field in ("health", "mana", "focus"):
+            stats.set(field, min(max(stats.get(field), 0), stats.get(f"max_{field}")))
+    return alive
+
+
+def tick_store(store):
+    store.regenerate("mana", 5, clamp=False)
+    store.clamp_to_max()
+    return int(store.alive_mask().sum())
+
+
+def run(count):
+    population = make_population(count)
+    objects = min(timeit.repeat(lambda: tick_objects(population), number=5, repeat=3)) / 5
+
+    store = StatsStore(count)
+    for stats in make_population(count):
+        store.attach(stats)
+    vectorized = min(timeit.repeat(lambda: tick_store(store), number=50, repeat=3)) / 50
+
+    assert tick_objects(make_population(count)) == tick_store(store)
+    return objects, vectorized
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    objects, vectorized = run(count)
+    print(f"{'storage':<16}{'ms/tick':>10}  (n={count} characters)")
+    print(f"{'CharacterStats':<16}{objects * 1e3:>10.3f}")
+    print(f"{'StatsStore':<16}{vectorized * 1e3:>10.3f}")
+    print(f"speedup: {objects / vectorized:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
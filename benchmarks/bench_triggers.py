@@ -0,0 +1,77 @@
+"""
+Benchmark for stat triggers: one EventManager.check_events pass over many events whose triggers poll
+a character's health (HealthBelowThresholdTrigger) against triggers pushed updates by threshold
+watchers (StatThresholdTrigger), and the cost of a write that crosses no watched threshold.
+
+Run from the repository root:
+
+    python benchmarks/bench_triggers.py [events]
+
+Console output is redirected to os.devnull and the log file is written to a
+temporary directory so that terminal speed does not dominate the numbers.
+"""
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+from rpg_world import (  # noqa: E402
+    Character,
+    CharacterStats,
+    EventManager,
+    GameState,
+    HealEvent,
+    HealthBelowThresholdTrigger,
+    StatThresholdTrigger
+)
+
+
+def build(events, make_trigger):
+    game_state = GameState()
+    characters = [Character(f"Hero {i}", CharacterStats(health=100), id=f"hero_{i}") for i in range(10)]
+    for character in characters:
+        game_state.add_character(character)
+    manager = EventManager()
+    for i in range(events):
+        character_id = f"hero_{i % 10}"
+        manager.add_event(HealEvent(f"Heal {i}", "", [make_trigger(character_id, 1 + i % 50)], character_id))
+    return game_state, manager, characters
+
+
+def run(events):
+    makers = {
+        "polling": lambda character_id, threshold: HealthBelowThresholdTrigger(character_id, threshold),
+        "watchers": lambda character_id, threshold: StatThresholdTrigger(character_id, "health", threshold),
+    }
+    results = {}
+    for label, make_trigger in makers.items():
+        game_state, manager, characters = build(events, make_trigger)
+        manager.check_events(game_state)  # Triggers register their watchers on the first pass
+        check = min(timeit.repeat(lambda: manager.check_events(game_state), number=20, repeat=5)) / 20
+        stats = characters[0].stats
+        write = min(timeit.repeat(lambda: stats.modify("health", 0.5) or stats.modify("health", -0.5), number=20000, repeat=5)) / 40000
+        results[label] = (check * 1e6, write * 1e9)
+    return results
+
+
+def main():
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    real_stderr = sys.stderr
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        os.chdir(tmp)
+        sys.stderr = devnull
+        try:
+            results = run(events)
+        finally:
+            sys.stderr = real_stderr
+
+    print(f"{'triggers':<10}{'check_events us':>17}{'modify ns':>12}  ({events} events over 10 characters)")
+    for label, (check, write) in results.items():
+        print(f"{label:<10}{check:>17.1f}{write:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
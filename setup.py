@@ -34,6 +34,7 @@ setup(
     package_dir={'': 'src'},  # Point to the 'src' folder
     packages=find_packages(where='src'),  # Automatically find all packages in the 'src' directory
     install_requires=get_requirements(),  # Dynamically get install_requires from requirements.txt
+    extras_require={'numpy': ['numpy']},  # Optional: StatsStore and vectorized area casts
     python_requires=get_python_version(),  # Dynamically get python_requires from the active environment
     classifiers=[            # Optional metadata for better project categorization
         'Development Status :: 3 - Alpha',
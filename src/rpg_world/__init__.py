@@ -3,48 +3,109 @@
 # Version of the package
 from .__version__ import __version__
 
-# Exposing core classes and functions
-from .character.character import Character
-from .character.mage import Mage
-from .stats.stats import Stats
-from .stats.character_stats import CharacterStats
-from .ability.ability import Ability
-from .ability.spell import Spell
-from .effect.effect import Effect
-from .effect.spell_effect import SpellEffect
-from .formula.formula import Formula
-from .formula.effect_formula import (
-    SimpleChangeFormula,
-    MultiEffectTargetFormula,
-    MultiEffectRecipientFormula,
-    SimpleChangeFormulaWithStatLimits
-)
-from .formula.turn_order_formula import SimpleFocusTurnOrderFormula
-from .utils.logger import Logger
-from .game.game import Game
-from .game.game_state import GameState
-from .place.place import Place
-from .place.world import World
-from .place.location import Location
-from .place.position import Position
-from .item.item import Item
-from .item.equipment import Equipment
-from .item.consumable import Consumable
-from .item.inventory import Inventory
-from .quest.quest import Quest
-from .quest.quest_objective import QuestObjective
-from .quest.quest_manager import QuestManager
-from .event.trigger import (
-    Trigger,
-    HealthBelowThresholdTrigger,
-    PlayerInLocationTrigger,
-    QuestCompletedTrigger
-)
-from .event.event import Event, HealEvent
-from .event.event_manager import EventManager
-from .save_load.save_manager import SaveManager
-from .save_load.load_manager import LoadManager
-from .combat.turn_order import TurnOrder
-from .combat.battle_manager import BattleManager
+# Exposing core classes and functions. Each public name maps to the submodule that defines it,
+# and submodules are only imported when one of their names is first accessed, so importing
+# rpg_world stays cheap for tools that only need a few classes.
+_EXPORTS = {
+    "Character": ".character.character",
+    "Mage": ".character.mage",
+    "Archetype": ".character.archetype",
+    "Stats": ".stats.stats",
+    "CharacterStats": ".stats.character_stats",
+    "StatsStore": ".stats.stats_store",
+    "StatsSnapshot": ".stats.stats_snapshot",
+    "StatSchema": ".stats.stat_schema",
+    "StatWatcher": ".stats.stat_watchers",
+    "Ability": ".ability.ability",
+    "Spell": ".ability.spell",
+    "AbilityRegistry": ".ability.ability_registry",
+    "CooldownTracker": ".ability.cooldown_tracker",
+    "Effect": ".effect.effect",
+    "SpellEffect": ".effect.spell_effect",
+    "Formula": ".formula.formula",
+    "SimpleChangeFormula": ".formula.effect_formula",
+    "MultiEffectTargetFormula": ".formula.effect_formula",
+    "MultiEffectRecipientFormula": ".formula.effect_formula",
+    "SimpleChangeFormulaWithStatLimits": ".formula.effect_formula",
+    "ExpressionFormula": ".formula.expression_formula",
+    "SimpleFocusTurnOrderFormula": ".formula.turn_order_formula",
+    "Logger": ".utils.logger",
+    "AsyncLogBackend": ".utils.async_log_backend",
+    "RingBufferHandler": ".utils.ring_buffer_handler",
+    "Game": ".game.game",
+    "GameState": ".game.game_state",
+    "Place": ".place.place",
+    "World": ".place.world",
+    "Location": ".place.location",
+    "Position": ".place.position",
+    "Item": ".item.item",
+    "Equipment": ".item.equipment",
+    "Consumable": ".item.consumable",
+    "Inventory": ".item.inventory",
+    "Quest": ".quest.quest",
+    "QuestObjective": ".quest.quest_objective",
+    "QuestManager": ".quest.quest_manager",
+    "Trigger": ".event.trigger",
+    "HealthBelowThresholdTrigger": ".event.trigger",
+    "StatThresholdTrigger": ".event.trigger",
+    "PlayerInLocationTrigger": ".event.trigger",
+    "QuestCompletedTrigger": ".event.trigger",
+    "Event": ".event.event",
+    "HealEvent": ".event.event",
+    "EventManager": ".event.event_manager",
+    "SaveManager": ".save_load.save_manager",
+    "LoadManager": ".save_load.load_manager",
+    "TurnOrder": ".combat.turn_order",
+    "BattleManager": ".combat.battle_manager",
+    "ActionQueue": ".combat.action_queue",
+    "ActionIntent": ".combat.action_queue",
+    "Journal": ".telemetry.journal",
+    "JournalEvent": ".telemetry.journal",
+    "JournalReader": ".telemetry.journal_reader",
+    "JournalRecord": ".telemetry.journal_reader",
+}
+
+__all__ = ["__version__", *_EXPORTS]
+
+
+def __getattr__(name):
+    """
+    Import and return a public name on first access, then cache it in the package namespace.
+    Subpackages (rpg_world.stats, ...) are imported on first access too, as eager imports made them
+    available before.
+
+    Args:
+        name (str): The name being accessed.
+
+    Returns:
+        Any: The class or object exported under that name, or the subpackage.
+
+    Raises:
+        AttributeError: If the name is neither part of the public API nor a subpackage.
+    """
+    from importlib import import_module
+
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        try:
+            # Importing a submodule also sets it as an attribute of the package
+            return import_module(f".{name}", __name__)
+        except ModuleNotFoundError as error:
+            if error.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """
+    List the package attributes, including public names that have not been imported yet.
+
+    Returns:
+        list: The sorted attribute names.
+    """
+    return sorted(set(globals()) | set(_EXPORTS))
 
 # Any other core imports or package-wide initialization can go here.
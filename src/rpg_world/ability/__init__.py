@@ -2,6 +2,8 @@
 
 from .ability import Ability
 from .spell import Spell
+from .ability_registry import AbilityRegistry
+from .cooldown_tracker import CooldownTracker
 
 # By including this, users can import characters like this:
 # from rpg_world.ability import Ability
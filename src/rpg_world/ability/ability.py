@@ -2,6 +2,16 @@ from abc import ABC, abstractmethod
 from ..utils.logger import Logger
 
 class Ability(ABC):
+    """
+    Base class for abilities. An ability normally tracks its own cooldown in last_cast_time, so each
+    caster needs its own instance. Abilities registered with AbilityRegistry.define() become shared,
+    read-only definitions instead: any number of casters can know the same instance, and the cooldown
+    is kept per caster in the caster's `cooldowns` dictionary (see Character.cooldowns).
+    """
+
+    # True for read-only definitions shared between casters, see AbilityRegistry
+    shared = False
+
     def __init__(self, name, attributes, effects=None):
         """
         Initialize the base Ability class with dynamic attributes.
@@ -20,27 +30,79 @@ class Ability(ABC):
         if 'cooldown' not in self.attributes:
             self.attributes['cooldown'] = 0
 
-        # Initialize logger for this ability
-        self.logger = Logger(f"Ability-{self.name}")
-        self.logger.info(f"Ability '{self.name}' initialized with attributes: {self.attributes}")
+        # Initialize logger for this ability, identified by its class and name
+        self.logger = Logger("rpg_world.ability", context={"entity": self.__class__.__name__, "name": self.name})
+        self.logger.info("Ability '%s' initialized with attributes: %s", self.name, self.attributes)
 
-    def is_on_cooldown(self, current_time):
+    def is_on_cooldown(self, current_time, caster=None):
         """
         Check if the ability is currently on cooldown.
 
         Args:
             current_time (float): The current time (in seconds as a timestamp).
+            caster (object, optional): The caster whose cooldown to check. Required for shared abilities,
+                                       which are never on cooldown without one. Defaults to None.
 
         Returns:
             bool: True if the ability is on cooldown, False otherwise.
         """
-        if self.last_cast_time and self.cooldown:
-            remaining_time = self.cooldown - (current_time - self.last_cast_time)
-            if remaining_time > 0:
-                self.logger.info(f"Ability '{self.name}' is on cooldown for another {remaining_time:.2f} seconds.")
-                return True
+        remaining_time = self.cooldown_remaining(current_time, caster)
+        if remaining_time:
+            self.logger.info("Ability '%s' is on cooldown for another %.2f seconds.", self.name, remaining_time, rate_limit=Logger.HOT_PATH_RATE_LIMIT)
+            return True
         return False
 
+    def cooldown_remaining(self, current_time, caster=None) -> float:
+        """
+        Return how long the ability stays on cooldown, without logging.
+
+        Args:
+            current_time (float): The current time (in seconds as a timestamp).
+            caster (object, optional): The caster whose cooldown to check, for shared abilities. Defaults to None.
+
+        Returns:
+            float: The seconds left on the cooldown, or 0 if the ability can be cast.
+        """
+        last_cast_time = self.last_cast(caster)
+        # Read from the attributes directly, skipping __getattr__ on the hot path
+        cooldown = self.attributes['cooldown']
+        if last_cast_time and cooldown:
+            remaining_time = cooldown - (current_time - last_cast_time)
+            if remaining_time > 0:
+                return remaining_time
+        return 0
+
+    def last_cast(self, caster=None):
+        """
+        Return the last time the ability was cast: by the given caster for shared abilities, or by
+        its only caster otherwise.
+
+        Args:
+            caster (object, optional): The caster, for shared abilities. Defaults to None.
+
+        Returns:
+            float or None: The time of the last cast, or None if the ability has not been cast.
+        """
+        if not self.shared:
+            return self.last_cast_time
+        if caster is None:
+            return None
+        return caster.cooldowns.get(self.name)
+
+    def record_cast(self, caster, current_time):
+        """
+        Record that the caster cast the ability, starting its cooldown.
+
+        Args:
+            caster (object): The entity casting the ability.
+            current_time (float): The time of the cast.
+        """
+        if self.shared:
+            caster.cooldowns[self.name] = current_time
+        else:
+            # Written directly, as a hot path; last_cast_time is a plain instance attribute
+            self.__dict__['last_cast_time'] = current_time
+
     @abstractmethod
     def cast(self, caster, target, current_time):
         """
@@ -69,7 +131,8 @@ class Ability(ABC):
         Raises:
             AttributeError: If the attribute does not exist in the attributes dictionary.
         """
-        if attr_name in self.attributes:
+        # 'attributes' itself is only missing while the object is being copied or unpickled
+        if attr_name != 'attributes' and attr_name in self.attributes:
             return self.attributes[attr_name]
         raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{attr_name}'")
 
@@ -81,11 +144,26 @@ class Ability(ABC):
             attr_name (str): The name of the attribute to set.
             value (Any): The value to set for the attribute.
         """
+        if self.shared:
+            raise AttributeError(f"Ability '{self.name}' is a shared definition and cannot be modified.")
         if attr_name in ['name', 'attributes', 'effects', 'last_cast_time', 'logger']:
             super().__setattr__(attr_name, value)
+            if attr_name == 'effects':
+                # Compiled casts (see Spell.compile) are built from the effects
+                self.__dict__.pop('_pipeline', None)
         else:
             self.attributes[attr_name] = value
-            self.logger.debug(f"Attribute '{attr_name}' of ability '{self.name}' set to {value}")
+            self.logger.debug("Attribute '%s' of ability '%s' set to %s", attr_name, self.name, value)
+
+    def __reduce_ex__(self, protocol):
+        """
+        Pickle and copy shared abilities by name, so they resolve to the registered definition.
+        Other abilities are pickled and copied as usual.
+        """
+        if self.shared:
+            from .ability_registry import AbilityRegistry
+            return AbilityRegistry.get, (self.name,)
+        return super().__reduce_ex__(protocol)
 
     def __str__(self):
         """
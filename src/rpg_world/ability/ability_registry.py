@@ -0,0 +1,80 @@
+from types import MappingProxyType
+from .ability import Ability
+
+class AbilityRegistry:
+    """
+    Process-wide registry of shared ability definitions, keyed by name. A definition is a read-only
+    Ability that any number of casters can know at once: its attributes and effects cannot change,
+    and the runtime state of each caster (the time of its last cast) is kept in the caster's
+    `cooldowns` dictionary instead of on the ability. A server with 50k mages knowing the same 200 spells
+    then holds 200 Spell objects instead of one per mage per spell.
+
+    Shared abilities are pickled by name and resolve to the registered definition when loaded, so the
+    definitions must be registered again (e.g. from game data) before saved characters are loaded.
+    """
+
+    _definitions = {}
+
+    @classmethod
+    def define(cls, ability: Ability) -> Ability:
+        """
+        Register an ability as a shared definition, making it read-only.
+
+        Args:
+            ability (Ability): The ability to share. It should not have been cast yet.
+
+        Returns:
+            Ability: The registered definition (the ability itself).
+
+        Raises:
+            ValueError: If a different ability is already registered under the same name.
+        """
+        existing = cls._definitions.get(ability.name)
+        if existing is ability:
+            return ability
+        if existing is not None:
+            raise ValueError(f"An ability named '{ability.name}' is already defined.")
+        # Written around Ability.__setattr__, which refuses writes once the ability is shared
+        object.__setattr__(ability, 'attributes', MappingProxyType(dict(ability.attributes)))
+        object.__setattr__(ability, 'effects', tuple(ability.effects))
+        object.__setattr__(ability, 'last_cast_time', None)
+        object.__setattr__(ability, 'shared', True)
+        cls._definitions[ability.name] = ability
+        return ability
+
+    @classmethod
+    def get(cls, name: str) -> Ability:
+        """
+        Return a shared definition by name.
+
+        Args:
+            name (str): The name of the ability.
+
+        Returns:
+            Ability: The registered definition.
+
+        Raises:
+            KeyError: If no ability with this name is defined.
+        """
+        return cls._definitions[name]
+
+    @classmethod
+    def remove(cls, name: str):
+        """
+        Remove a definition from the registry, e.g. when reloading game data. Casters that know it keep
+        using it, but it can no longer be looked up or unpickled by name.
+
+        Args:
+            name (str): The name of the ability.
+        """
+        cls._definitions.pop(name, None)
+
+    @classmethod
+    def names(cls) -> tuple:
+        """
+        Return the names of every defined ability.
+
+        Returns:
+            tuple: The names in definition order.
+        """
+        return tuple(cls._definitions)
@@ -0,0 +1,178 @@
+import heapq
+from itertools import count
+
+class CooldownTracker:
+    """
+    Keeps every running cooldown in a min-heap ordered by the time it ends, so the game loop can ask
+    which (caster, ability) pairs became ready since the last tick without polling every ability of
+    every caster: pop_ready() costs O(k log n) for k cooldowns ending among n running ones.
+
+    Spells register their cooldowns with the tracker in CooldownTracker.current when they are cast,
+    which is None (and costs a single check) until a tracker is started with CooldownTracker.start().
+    Abilities keep their own last_cast_time as before, so is_on_cooldown() works with or without a tracker.
+    """
+
+    # The tracker casting registers cooldowns with, or None when tracking is off
+    current = None
+
+    def __init__(self):
+        """
+        Initialize an empty tracker.
+        """
+        self._heap = []  # (ready_time, sequence, caster, ability)
+        self._ready = {}  # (caster, ability) -> (ready_time, sequence) of the live heap entry
+        self._sequence = count()
+
+    @classmethod
+    def start(cls):
+        """
+        Create a tracker and make it the one casting registers cooldowns with, replacing any current tracker.
+
+        Returns:
+            CooldownTracker: The started tracker.
+        """
+        cls.current = cls()
+        return cls.current
+
+    @classmethod
+    def stop(cls):
+        """
+        Stop tracking cooldowns.
+        """
+        cls.current = None
+
+    def __len__(self):
+        """
+        Return the number of running cooldowns.
+
+        Returns:
+            int: The number of (caster, ability) pairs on cooldown.
+        """
+        return len(self._ready)
+
+    def add(self, caster, ability, current_time: float):
+        """
+        Start the cooldown of an ability cast by a caster. A cooldown already running for the pair is replaced.
+        Abilities without a cooldown are not tracked.
+
+        Args:
+            caster (object): The entity that cast the ability.
+            ability (Ability): The ability that was cast.
+            current_time (float): The time of the cast.
+        """
+        cooldown = ability.cooldown
+        if cooldown is None or cooldown <= 0:
+            self.cancel(caster, ability)
+            return
+        ready_time = current_time + cooldown
+        sequence = next(self._sequence)
+        self._ready[(caster, ability)] = (ready_time, sequence)
+        heapq.heappush(self._heap, (ready_time, sequence, caster, ability))
+        # Replaced and cancelled cooldowns leave stale entries behind; drop them once they dominate the heap
+        if len(self._heap) > 2 * len(self._ready) + 64:
+            self._compact()
+
+    def cancel(self, caster, ability) -> bool:
+        """
+        Stop tracking the cooldown of an ability for a caster. Its stale heap entry is skipped later.
+
+        Args:
+            caster (object): The entity that cast the ability.
+            ability (Ability): The ability.
+
+        Returns:
+            bool: True if a cooldown was running, False otherwise.
+        """
+        return self._ready.pop((caster, ability), None) is not None
+
+    def ready_time(self, caster, ability):
+        """
+        Return the time the cooldown of an ability ends for a caster.
+
+        Args:
+            caster (object): The entity that cast the ability.
+            ability (Ability): The ability.
+
+        Returns:
+            float or None: The time the ability becomes ready, or None if it is not on cooldown.
+        """
+        entry = self._ready.get((caster, ability))
+        return None if entry is None else entry[0]
+
+    def is_on_cooldown(self, caster, ability, current_time: float) -> bool:
+        """
+        Check whether an ability is on cooldown for a caster.
+
+        Args:
+            caster (object): The entity that cast the ability.
+            ability (Ability): The ability.
+            current_time (float): The current time.
+
+        Returns:
+            bool: True if the ability's cooldown has not ended yet, False otherwise.
+        """
+        entry = self._ready.get((caster, ability))
+        return entry is not None and entry[0] > current_time
+
+    def next_ready_time(self):
+        """
+        Return the time the next cooldown ends, for example to decide how long the game loop can sleep.
+
+        Returns:
+            float or None: The earliest end of a running cooldown, or None if there are none.
+        """
+        heap = self._heap
+        while heap and not self._is_live(heap[0]):
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def pop_ready(self, current_time: float) -> list:
+        """
+        Remove and return the cooldowns that have ended by the given time, i.e. the (caster, ability)
+        pairs that became ready since the previous call.
+
+        Args:
+            current_time (float): The current time.
+
+        Returns:
+            list: (caster, ability) tuples in the order their cooldowns ended.
+        """
+        heap = self._heap
+        ready = self._ready
+        pairs = []
+        while heap and heap[0][0] <= current_time:
+            ready_time, sequence, caster, ability = heapq.heappop(heap)
+            key = (caster, ability)
+            entry = ready.get(key)
+            if entry is not None and entry[1] == sequence:
+                del ready[key]
+                pairs.append(key)
+        return pairs
+
+    def clear(self):
+        """
+        Stop tracking every cooldown.
+        """
+        self._heap.clear()
+        self._ready.clear()
+
+    def _is_live(self, heap_entry) -> bool:
+        """
+        Check whether a heap entry belongs to a cooldown that is still running.
+
+        Args:
+            heap_entry (tuple): A (ready_time, sequence, caster, ability) heap entry.
+
+        Returns:
+            bool: False if the cooldown was replaced or cancelled.
+        """
+        entry = self._ready.get((heap_entry[2], heap_entry[3]))
+        return entry is not None and entry[1] == heap_entry[1]
+
+    def _compact(self):
+        """
+        Rebuild the heap from the running cooldowns only.
+        """
+        self._heap = [(ready_time, sequence, caster, ability)
+                      for (caster, ability), (ready_time, sequence) in self._ready.items()]
+        heapq.heapify(self._heap)
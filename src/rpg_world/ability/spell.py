@@ -1,5 +1,12 @@
-from .ability import Ability
 import logging
+from .ability import Ability
+from .cooldown_tracker import CooldownTracker
+from ..telemetry.journal import Journal, JournalEvent
+from ..utils.logger import Logger
+
+# Reasons a caster cannot cast a spell, see Spell.check_cast
+NOT_ENOUGH_MANA = "not enough mana"
+ON_COOLDOWN = "on cooldown"
 
 class Spell(Ability):
     def __init__(self, name, mana_cost, cooldown, effects):
@@ -37,24 +44,254 @@ class Spell(Ability):
         Returns:
             bool: True if the spell was successfully cast, False otherwise.
         """
-        if self.is_on_cooldown(current_time):
-            self.logger.warning(f"{self.name} is on cooldown and cannot be cast yet.")
+        if self.is_on_cooldown(current_time, caster):
+            self.logger.warning("%s is on cooldown and cannot be cast yet.", self.name, rate_limit=Logger.HOT_PATH_RATE_LIMIT)
             return False
+        self.perform(caster, target, current_time)
+        return True
+
+    def check_cast(self, caster, current_time):
+        """
+        Check, without logging, whether the caster can cast the spell: it must have enough mana and the
+        spell must be off cooldown. Mage.cast_spell and ActionQueue validate casts with this check.
+
+        Args:
+            caster (object): The entity casting the spell, which must have a mana stat.
+            current_time (float): The current time (timestamp) used to check for spell cooldowns.
+
+        Returns:
+            str or None: None if the spell can be cast, otherwise NOT_ENOUGH_MANA or ON_COOLDOWN.
+        """
+        if caster.mana < self.attributes['mana_cost']:
+            return NOT_ENOUGH_MANA
+        if self.cooldown_remaining(current_time, caster):
+            return ON_COOLDOWN
+        return None
+
+    def perform(self, caster, target, current_time):
+        """
+        Cast the spell on the target without checking its cooldown, for callers that have validated
+        the cast already (see ActionQueue). Starts the cooldown and applies the effects like cast().
+
+        Args:
+            caster (object): The entity casting the spell (e.g., a player or character).
+            target (object): The entity receiving the spell (e.g., an enemy or target).
+            current_time (float): The current time (timestamp), which starts the cooldown.
+        """
+        # Checked once per cast; debug logging implies info logging
+        logger = self.logger
+        info_enabled = logger.is_enabled_for(logging.INFO)
 
         # Log the spell casting event
-        self.logger.info(f"{caster.name} casts {self.name} on {target.name}!")
+        if info_enabled:
+            logger.info("%s casts %s on %s!", caster.name, self.name, target.name)
 
         # Update the last cast time to the current time
-        self.last_cast_time = current_time
+        self.record_cast(caster, current_time)
+        tracker = CooldownTracker.current
+        # What-if copies (see Character.overlay) keep their cooldowns to themselves
+        if tracker is not None and not getattr(caster, "what_if", False):
+            tracker.add(caster, self, current_time)
+
+        journal = Journal.current
+        if journal is not None:
+            journal.record(JournalEvent.SPELL_CAST, caster, target, self.name)
 
         # Perform effect calculation and apply effects
+        self._apply_effects(caster, target, info_enabled and logger.is_enabled_for(logging.DEBUG))
+
+        if info_enabled:
+            logger.info("Spell %s cast successfully.", self.name)
+
+    def _apply_effects(self, caster, target, debug_enabled: bool):
+        """
+        Apply every effect of the spell for one target, through the compiled effects unless debug
+        logging is enabled.
+
+        Args:
+            caster (object): The entity casting the spell.
+            target (object): The entity receiving the spell.
+            debug_enabled (bool): Whether debug logging is enabled, logging each effect as it is applied.
+        """
+        if debug_enabled:
+            for effect in self.effects:
+                self.logger.debug("Applying effect: %s", effect)
+                effect.apply(
+                    caster=caster,
+                    target=target,
+                    ability=self
+                )
+        else:
+            compiled = self.__dict__.get('_pipeline')
+            if compiled is None or _is_stale(compiled, self.effects):
+                pipeline = self.compile()
+            else:
+                pipeline = compiled[0]
+            pipeline(caster, target, self)
+
+    def cast_area(self, caster, targets, current_time):
+        """
+        Cast the spell on several targets at once, e.g. a fireball on a group of enemies. The cooldown is
+        checked and started once, and each effect is evaluated for all targets in a batch and applied
+        in one bulk stat update (see SpellEffect.apply_area). The result is the same as casting the
+        spell on each target in turn, except that the spell goes on cooldown only once. Spells with
+        effects on the caster, and target lists repeating a target or including the caster, are applied
+        target by target instead, since a character changed twice must see its first change.
+
+        Args:
+            caster (object): The entity casting the spell (e.g., a player or character).
+            targets (iterable): The entities receiving the spell.
+            current_time (float): The current time (timestamp) used to check for spell cooldowns.
+
+        Returns:
+            bool: True if the spell was successfully cast, False if it is on cooldown or there are no targets.
+        """
+        targets = list(targets)
+        if not targets:
+            self.logger.info("%s has no targets for %s.", caster.name, self.name, rate_limit=Logger.HOT_PATH_RATE_LIMIT)
+            return False
+        if self.is_on_cooldown(current_time, caster):
+            self.logger.warning("%s is on cooldown and cannot be cast yet.", self.name, rate_limit=Logger.HOT_PATH_RATE_LIMIT)
+            return False
+        self.perform_area(caster, targets, current_time)
+        return True
+
+    def perform_area(self, caster, targets: list, current_time):
+        """
+        Cast the spell on several targets without checking its cooldown, for callers that have validated
+        the cast already (see ActionQueue). Otherwise the same as cast_area().
+
+        Args:
+            caster (object): The entity casting the spell (e.g., a player or character).
+            targets (list): The entities receiving the spell, at least one.
+            current_time (float): The current time (timestamp), which starts the cooldown.
+        """
+        logger = self.logger
+        info_enabled = logger.is_enabled_for(logging.INFO)
+        if info_enabled:
+            logger.info("%s casts %s on %d targets!", caster.name, self.name, len(targets))
+
+        self.record_cast(caster, current_time)
+        tracker = CooldownTracker.current
+        # What-if copies (see Character.overlay) keep their cooldowns to themselves
+        if tracker is not None and not getattr(caster, "what_if", False):
+            tracker.add(caster, self, current_time)
+
+        journal = Journal.current
+        if journal is not None:
+            for target in targets:
+                journal.record(JournalEvent.SPELL_CAST, caster, target, self.name)
+
+        if not _has_distinct_recipients(caster, targets, self.effects):
+            # A character receiving the spell more than once must see its earlier changes (limits
+            # included), so the effects are applied target by target, as separate casts would
+            debug_enabled = info_enabled and logger.is_enabled_for(logging.DEBUG)
+            for target in targets:
+                self._apply_effects(caster, target, debug_enabled)
+        else:
+            for effect in self.effects:
+                apply_area = getattr(effect, 'apply_area', None)
+                if apply_area is not None:
+                    apply_area(caster, targets, ability=self)
+                else:
+                    for target in targets:
+                        effect.apply(caster=caster, target=target, ability=self)
+
+        if info_enabled:
+            logger.info("Spell %s cast successfully.", self.name)
+
+    def compile(self):
+        """
+        Compile the spell's effects into a single function, with each effect's recipient, attribute id
+        and formula resolved ahead of time (see SpellEffect.compile). cast() compiles the spell on its
+        first cast and uses the compiled function unless debug logging, which logs every effect, is enabled.
+
+        The compiled function is rebuilt when the effects change: when effects are added, removed or
+        replaced, or an effect is assigned a new formula, attribute or recipient. Formulas are called
+        as compiled, so a formula changed in place must be assigned to its effect again.
+
+        Returns:
+            callable: A function called as function(caster, target, ability) applying every effect in order.
+        """
+        steps = []
         for effect in self.effects:
-            self.logger.debug(f"Applying effect: {effect}")
-            effect.apply(
-                caster=caster,
-                target=target,
-                ability=self
-            )
-        
-        self.logger.info(f"Spell {self.name} cast successfully.")
+            compile_effect = getattr(effect, 'compile', None)
+            if compile_effect is not None:
+                step = compile_effect()
+                if step is not None:
+                    steps.append(step)
+            else:
+                steps.append(_apply_step(effect))
+        steps = tuple(steps)
+
+        def pipeline(caster, target, ability):
+            for step in steps:
+                step(caster, target, ability)
+
+        # Written around Ability.__setattr__: the compiled function is a cache, also kept for shared spells.
+        # It is stored with the effects and revision it was built from, see _is_stale
+        revision = max((getattr(effect, 'revision', 0) for effect in self.effects), default=0)
+        object.__setattr__(self, '_pipeline', (pipeline, tuple(self.effects), revision))
+        return pipeline
+
+    def __getstate__(self):
+        """
+        Pickle and copy without the compiled effects, which are rebuilt on the next cast.
+        """
+        state = self.__dict__.copy()
+        state.pop('_pipeline', None)
+        return state
+
+
+def _is_stale(compiled, effects) -> bool:
+    """
+    Check whether a compiled spell was built from other effects than the spell's current ones.
+
+    Args:
+        compiled (tuple): The (pipeline, effects, revision) stored by Spell.compile.
+        effects (list): The spell's current effects.
+
+    Returns:
+        bool: True if an effect was added, removed, replaced or changed since the spell was compiled.
+    """
+    _, compiled_effects, revision = compiled
+    if len(compiled_effects) != len(effects):
         return True
+    for compiled_effect, effect in zip(compiled_effects, effects):
+        if compiled_effect is not effect or getattr(effect, 'revision', 0) > revision:
+            return True
+    return False
+
+
+def _has_distinct_recipients(caster, targets: list, effects) -> bool:
+    """
+    Check whether an area cast changes every character at most once, so its effects can be
+    evaluated for all targets from their stats before the cast.
+
+    Args:
+        caster (object): The entity casting the spell.
+        targets (list): The entities receiving the spell.
+        effects (list): The spell's effects.
+
+    Returns:
+        bool: False if a target repeats, the caster is a target or an effect changes the caster.
+    """
+    target_ids = {id(target) for target in targets}
+    if len(target_ids) != len(targets) or id(caster) in target_ids:
+        return False
+    return all(getattr(effect, 'recipient', 'target') != 'caster' for effect in effects)
+
+
+def _apply_step(effect):
+    """
+    Wrap an effect that cannot be compiled into a pipeline step calling its apply() method.
+
+    Args:
+        effect (Effect): The effect.
+
+    Returns:
+        callable: A function called as function(caster, target, ability).
+    """
+    def step(caster, target, ability):
+        effect.apply(caster=caster, target=target, ability=ability)
+    return step
@@ -2,6 +2,7 @@
 
 from .character import Character
 from .mage import Mage
+from .archetype import Archetype
 
 # By including this, users can import characters like this:
 # from rpg_world.character import Character
@@ -0,0 +1,143 @@
+from types import MappingProxyType
+from ..stats.character_stats import CharacterStats
+from .character import Character
+
+class Archetype:
+    """
+    A template for spawning many similar characters, such as a horde of goblins. The immutable data
+    (name pattern, base stats, known spells, default loot) is stored once on the archetype and shared
+    by every character spawned from it; each character only holds its own id, name and stats.
+
+    Spawned characters skip their class's __init__: they get an inventory (holding the default loot)
+    and a logger on first use, and share the archetype's spells, as a read-only mapping, until they
+    learn or forget one.
+    The character class must therefore not rely on other attributes set in __init__. Spells that keep
+    their own cooldown would be on cooldown for every spawned character at once, so archetypes only
+    accept shared definitions from AbilityRegistry, whose cooldowns are kept per caster.
+    """
+
+    def __init__(self, name: str, character_class: type = Character, stats: dict = None, spells: list = None,
+                 loot: list = None, name_pattern: str = "{archetype} {index}"):
+        """
+        Initialize the archetype.
+
+        Args:
+            name (str): The name of the archetype, e.g. 'Goblin'.
+            character_class (type): The Character subclass to spawn. Defaults to Character.
+            stats (dict, optional): Base stats of every spawned character, passed to CharacterStats
+                                    (e.g. {'health': 30, 'mana': 0, 'strength': 4}). Defaults to None.
+            spells (list, optional): Spells every spawned character knows, for Mage-like classes. They must be
+                                     shared definitions (see AbilityRegistry.define). Defaults to None.
+            loot (list, optional): Items every spawned character carries by default. Defaults to None.
+            name_pattern (str): Format string for the names of spawned characters, with the fields
+                                'archetype' and 'index'. Defaults to '{archetype} {index}'.
+
+        Raises:
+            ValueError: If a spell is not a shared definition.
+        """
+        for spell in spells or ():
+            if not spell.shared:
+                raise ValueError(f"Spell '{spell.name}' of archetype '{name}' keeps its own cooldown, which every spawned "
+                                 f"character would share. Register it with AbilityRegistry.define() first.")
+        self.name = name
+        self.character_class = character_class
+        self.stats = dict(stats or {})
+        # Read-only, since every spawned character shares it; characters copy it before changing their spells
+        self.spells = MappingProxyType({spell.name: spell for spell in spells or ()})
+        self.loot = tuple(loot or ())
+        self.name_pattern = name_pattern
+        self.spawned = 0  # Number of characters spawned so far, used as the index in their names
+
+    def spawn(self, id: str = None, name: str = None, **stats) -> Character:
+        """
+        Create a character from this archetype.
+
+        Args:
+            id (str, optional): The character's ID. Defaults to None.
+            name (str, optional): The character's name. Defaults to a name built from the name pattern.
+            **stats: Stats overriding the archetype's base stats for this character.
+
+        Returns:
+            Character: A new instance of the archetype's character class.
+        """
+        index = self.spawned
+        self.spawned = index + 1
+        if name is None:
+            name = self.name_pattern.format(archetype=self.name, index=index)
+        return self._build(id, name, self.stats if not stats else {**self.stats, **stats})
+
+    def spawn_many(self, count: int, ids=None) -> list:
+        """
+        Create many characters from this archetype, all with the archetype's base stats and
+        with names built from the name pattern.
+
+        Args:
+            count (int): The number of characters to create.
+            ids (iterable, optional): The IDs of the characters, one per character. Defaults to None for no IDs.
+
+        Returns:
+            list: The new characters, in spawn order.
+
+        Raises:
+            ValueError: If the number of IDs does not match the count.
+        """
+        if ids is None:
+            ids = [None] * count
+        elif len(ids := list(ids)) != count:
+            raise ValueError(f"Expected {count} IDs for archetype '{self.name}', got {len(ids)}.")
+        start = self.spawned
+        self.spawned = start + count
+        name_format = self.name_pattern.format
+        archetype_name = self.name
+        build = self._build
+        stats = self.stats
+        return [
+            build(id, name_format(archetype=archetype_name, index=index), stats)
+            for id, index in zip(ids, range(start, start + count))
+        ]
+
+    def _build(self, id, name: str, stats: dict) -> Character:
+        """
+        Create a character without calling its class's __init__.
+
+        Args:
+            id (str): The character's ID.
+            name (str): The character's name.
+            stats (dict): The character's stats, passed to CharacterStats.
+
+        Returns:
+            Character: A new instance of the archetype's character class.
+        """
+        character = self.character_class.__new__(self.character_class)
+        state = character.__dict__
+        state['id'] = id
+        state['name'] = name
+        state['stats'] = CharacterStats(**stats)
+        state['archetype'] = self
+        if self.spells:
+            state['spells'] = self.spells
+        return character
+
+    def __getstate__(self):
+        """
+        Pickle and copy the spells as a plain dictionary, since mapping proxies cannot be pickled.
+        """
+        state = self.__dict__.copy()
+        state['spells'] = dict(self.spells)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restore the archetype, making its spells read-only again.
+        """
+        self.__dict__.update(state)
+        self.spells = MappingProxyType(dict(self.spells))
+
+    def __str__(self):
+        """
+        Provides a string representation of the archetype.
+
+        Returns:
+            str: The archetype's name, character class and base stats.
+        """
+        return f"Archetype {self.name} ({self.character_class.__name__}): {self.stats}"
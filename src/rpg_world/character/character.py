@@ -1,9 +1,27 @@
 from abc import ABC
+from functools import cached_property
 from ..stats.character_stats import CharacterStats
 from ..item.inventory import Inventory
 from ..utils.logger import Logger
 
 class Character(ABC):
+    """
+    Base class for characters. The core stats (CharacterStats.CORE_FIELDS) are exposed as generated
+    properties that read and write the character's stats, so `character.health` is an ordinary attribute
+    lookup. Additional stats are read through __getattr__ and written through __setattr__, which only
+    consults the stats for names that are not core stats.
+
+    A character's inventory and logger are created on first use, so characters spawned in bulk that
+    never carry items or log cost nothing for them. Characters spawned from an Archetype skip __init__
+    and share the archetype's immutable data.
+    """
+
+    # The Archetype this character was spawned from, if any
+    archetype = None
+
+    # True for what-if copies made by overlay(), whose actions are kept out of cooldown tracking and telemetry
+    what_if = False
+
     def __init__(self, name: str, stats: CharacterStats, id: str = None):
         """
         Initialize a base character with character statistics, an inventory, and an optional ID.
@@ -16,11 +34,8 @@ class Character(ABC):
         self.id = id
         self.name = name
         self.stats = stats
-        self.inventory = Inventory()
-
-        # Initialize logger for this character
-        self.logger = Logger(f"Character-{self.name}")
-        self.logger.info(f"Character '{self.name}' initialized with stats: {self.stats}")
+        # The inventory is created on first use, see the inventory property
+        self.logger.info("Character '%s' initialized with stats: %s", self.name, self.stats)
 
     def is_alive(self) -> bool:
         """
@@ -31,9 +46,66 @@ class Character(ABC):
         """
         return self.stats.is_alive()
 
+    @cached_property
+    def inventory(self):
+        """
+        The character's inventory, created on first use. Spawned characters start with their archetype's default loot.
+
+        Returns:
+            Inventory: The character's inventory.
+        """
+        inventory = Inventory()
+        if self.archetype is not None:
+            inventory.items.extend(self.archetype.loot)
+        return inventory
+
+    @cached_property
+    def logger(self):
+        """
+        The character's logger, identified by its class and name, created on first use.
+
+        Returns:
+            Logger: The character's logger.
+        """
+        return Logger("rpg_world.character", context={"entity": self.__class__.__name__, "name": self.name})
+
+    @cached_property
+    def cooldowns(self) -> dict:
+        """
+        The times this character last cast each shared ability (see AbilityRegistry), by ability name,
+        created on its first cast.
+
+        Returns:
+            dict: Ability name -> time of the last cast.
+        """
+        return {}
+
+    def overlay(self):
+        """
+        Create a what-if copy of this character for simulating actions. The copy shares everything with
+        this character except its stats, which are a copy-on-write snapshot, and its cooldowns: changes
+        made through the copy are kept in the snapshot until `overlay.stats.commit()` writes them back, or
+        `overlay.stats.discard()` drops them. Containers such as the inventory are still shared.
+
+        Nothing done through the copy is reported globally: its casts are not registered with
+        CooldownTracker.current, and the journal does not record events involving it.
+
+        Returns:
+            Character: A copy of this character, of the same class, with snapshot stats.
+        """
+        overlay = self.__class__.__new__(self.__class__)
+        overlay.__dict__.update(self.__dict__)
+        overlay.__dict__['stats'] = self.stats.snapshot()
+        overlay.__dict__['what_if'] = True
+        # Casting shared abilities through the overlay must not start this character's cooldowns
+        if 'cooldowns' in self.__dict__:
+            overlay.__dict__['cooldowns'] = dict(self.cooldowns)
+        return overlay
+
     def __getattr__(self, attr_name):
         """
-        Dynamically return attributes from CharacterStats if they exist.
+        Dynamically return attributes from CharacterStats if they exist. Core stats are served by their
+        generated property and only get here if it raised.
 
         Args:
             attr_name (str): The name of the attribute to retrieve from the character's stats.
@@ -44,24 +116,26 @@ class Character(ABC):
         Raises:
             AttributeError: If the attribute does not exist in CharacterStats.
         """
-        if attr_name in self.stats.attributes:
+        # 'stats' itself is only missing while the object is being copied or unpickled
+        if attr_name != 'stats' and attr_name in self.stats:
             return self.stats.get(attr_name)
         raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{attr_name}'")
 
     def __setattr__(self, attr_name, value):
         """
-        Dynamically set attributes in CharacterStats if they exist in the stats dictionary.
+        Set an additional stat in CharacterStats if the stats have it, otherwise set the attribute as usual.
+        Core stats go through their generated property.
 
         Args:
             attr_name (str): The name of the attribute to set.
             value (Any): The value to set for the attribute.
         """
-        if attr_name in ['name', 'stats', 'inventory', 'id']:
-            super().__setattr__(attr_name, value)
-        elif attr_name in self.stats.attributes:
-            self.stats.set(attr_name, value)
-        else:
-            super().__setattr__(attr_name, value)
+        if attr_name not in _CORE_FIELDS:
+            stats = self.__dict__.get('stats')
+            if stats is not None and attr_name in stats:
+                stats.set(attr_name, value)
+                return
+        object.__setattr__(self, attr_name, value)
 
     def __str__(self):
         """
@@ -71,3 +145,25 @@ class Character(ABC):
             str: A string containing the character's name and their stats.
         """
         return f"{self.name}: {self.stats}"
+
+
+def _stat_property(attr_name):
+    """
+    Build a property that reads and writes one core stat of the character's stats.
+    """
+    def fget(self):
+        # A slot on CharacterStats, so attribute access is the fastest read
+        return getattr(self.stats, attr_name)
+
+    def fset(self, value):
+        self.stats.set(attr_name, value)
+
+    return property(fget, fset, doc=f"The '{attr_name}' stat, stored in the character's stats.")
+
+
+# Only the core stats every character has get a property; other stats are read through __getattr__
+# and written through __setattr__, so stats registered elsewhere never shadow instance attributes
+_CORE_FIELDS = frozenset(CharacterStats.CORE_FIELDS)
+for _attr_name in CharacterStats.CORE_FIELDS:
+    setattr(Character, _attr_name, _stat_property(_attr_name))
+del _attr_name
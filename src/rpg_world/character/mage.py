@@ -1,8 +1,14 @@
+import copy
+from types import MappingProxyType
 from .character import Character
 from ..stats.character_stats import CharacterStats
-from ..ability.spell import Spell
+from ..ability.spell import NOT_ENOUGH_MANA, Spell
+from ..utils.logger import Logger
 
 class Mage(Character):
+    # Spells of mages that have not learned any of their own, e.g. spawned mages whose archetype has none
+    spells = MappingProxyType({})
+
     def __init__(self, name: str, health: float = 100, mana: float = 100, focus: float = 100, armor: float = 0, spells: list = None):
         """
         Initialize a Mage character with specific attributes, including health, mana, focus, armor, and spells.
@@ -36,8 +42,8 @@ class Mage(Character):
         Args:
             spell (Spell): The spell object that the mage learns.
         """
-        self.spells[spell.name] = spell
-        self.logger.info(f"{self.name} learned the spell: {spell.name}.")
+        self._own_spells()[spell.name] = spell
+        self.logger.info("%s learned the spell: %s.", self.name, spell.name)
 
     def forget_spell(self, spell_name: str):
         """
@@ -47,10 +53,55 @@ class Mage(Character):
             spell_name (str): The name of the spell the mage wants to forget.
         """
         if spell_name in self.spells:
-            del self.spells[spell_name]
-            self.logger.info(f"{self.name} forgot the spell: {spell_name}.")
+            del self._own_spells()[spell_name]
+            self.logger.info("%s forgot the spell: %s.", self.name, spell_name)
         else:
-            self.logger.info(f"{self.name} doesn't know the spell: {spell_name}.")
+            self.logger.info("%s doesn't know the spell: %s.", self.name, spell_name)
+
+    def _own_spells(self) -> dict:
+        """
+        Return this mage's spell dictionary for modification, copying it first if it is shared with an archetype.
+
+        Returns:
+            dict: The spells owned by this mage.
+        """
+        spells = self.__dict__.get('spells')
+        if type(spells) is not dict:
+            # Missing, or the read-only spells of the archetype: copy on write
+            spells = self.__dict__['spells'] = dict(self.spells)
+        return spells
+
+    def __getstate__(self):
+        """
+        Pickle and copy spawned mages without the spells they share with their archetype, which are
+        shared again when they are loaded.
+        """
+        state = self.__dict__.copy()
+        if self.archetype is not None and state.get('spells') is self.archetype.spells:
+            del state['spells']
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restore the mage, sharing its archetype's spells again if it had not changed them.
+        """
+        self.__dict__.update(state)
+        archetype = state.get('archetype')
+        if 'spells' not in state and archetype is not None and archetype.spells:
+            self.__dict__['spells'] = archetype.spells
+
+    def overlay(self):
+        """
+        Create a what-if copy of this mage (see Character.overlay). Spells that keep their own cooldown are
+        copied too, so casting through the overlay does not put the mage's own spells on cooldown; shared
+        spells keep their cooldowns in the overlay's copy of `cooldowns`.
+
+        Returns:
+            Mage: A copy of this mage with snapshot stats and its own spell cooldowns.
+        """
+        overlay = super().overlay()
+        overlay.__dict__['spells'] = {name: spell if spell.shared else copy.copy(spell) for name, spell in self.spells.items()}
+        return overlay
 
     def cast_spell(self, spell_name: str, target, current_time: float):
         """
@@ -64,23 +115,60 @@ class Mage(Character):
         Returns:
             None
         """
-        # Find the spell by name in the mage's spell list
-        spell = self.spells.get(spell_name)
-        if not spell:
-            self.logger.info(f"{self.name} doesn't know the spell: {spell_name}.")
+        spell = self._castable_spell(spell_name, current_time)
+        if spell is None:
             return
 
-        mana_cost = spell.mana_cost
-        current_mana = self.mana
-        if current_mana < mana_cost:
-            self.logger.info(f"{self.name} doesn't have enough mana to cast {spell.name} (Required: {mana_cost}, Available: {current_mana}).")
+        # Cast through cast(), which Spell subclasses may override
+        if spell.cast(self, target, current_time):
+            self.stats.modify('mana', -spell.attributes['mana_cost'])
+            self.logger.info("%s successfully cast %s. Mana remaining: %s", self.name, spell_name, self.mana)
+
+    def cast_spell_area(self, spell_name: str, targets, current_time: float):
+        """
+        Cast a spell on several targets at once (see Spell.cast_area). Mana is checked and spent once,
+        as for a single target.
+
+        Args:
+            spell_name (str): The name of the spell to cast.
+            targets (iterable): The targets of the spell (other characters).
+            current_time (float): The current time (as a timestamp) used to check for spell cooldowns.
+
+        Returns:
+            None
+        """
+        spell = self._castable_spell(spell_name, current_time)
+        if spell is None:
             return
 
-        # Cast the spell if enough mana and cooldown is valid
-        spell_cast_success = spell.cast(self, target, current_time)
-        if spell_cast_success:
-            self.stats.modify('mana', -mana_cost)
-            self.logger.info(f"{self.name} successfully cast {spell_name}. Mana remaining: {self.mana}")
+        if spell.cast_area(self, targets, current_time):
+            self.stats.modify('mana', -spell.attributes['mana_cost'])
+            self.logger.info("%s successfully cast %s. Mana remaining: %s", self.name, spell_name, self.mana)
+
+    def _castable_spell(self, spell_name: str, current_time: float):
+        """
+        Look up a spell and check that the mage can cast it now (see Spell.check_cast), logging why not.
+
+        Args:
+            spell_name (str): The name of the spell to cast.
+            current_time (float): The current time (as a timestamp) used to check for spell cooldowns.
+
+        Returns:
+            Spell or None: The spell, or None if the mage doesn't know it or cannot cast it yet.
+        """
+        spell = self.spells.get(spell_name)
+        if not spell:
+            self.logger.info("%s doesn't know the spell: %s.", self.name, spell_name, rate_limit=Logger.HOT_PATH_RATE_LIMIT)
+            return None
+
+        reason = spell.check_cast(self, current_time)
+        if reason is None:
+            return spell
+        if reason == NOT_ENOUGH_MANA:
+            self.logger.info("%s doesn't have enough mana to cast %s (Required: %s, Available: %s).", self.name, spell.name, spell.attributes['mana_cost'], self.mana, rate_limit=Logger.HOT_PATH_RATE_LIMIT)
+        else:
+            self.logger.info("%s cannot cast %s yet: %s.", self.name, spell.name, reason, rate_limit=Logger.HOT_PATH_RATE_LIMIT)
+        return None
 
     def __str__(self):
         """
@@ -2,6 +2,7 @@
 
 from .battle_manager import BattleManager
 from .turn_order import TurnOrder
+from .action_queue import ActionIntent, ActionQueue
 
 # By including this, users can import characters like this:
 # from rpg_world.combat.battle_manager import BattleManager
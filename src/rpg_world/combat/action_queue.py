@@ -0,0 +1,338 @@
+import threading
+from itertools import count
+from ..utils.logger import Logger
+
+CAST = "cast"
+CAST_AREA = "cast_area"
+USE = "use"
+EQUIP = "equip"
+UNEQUIP = "unequip"
+
+class ActionIntent:
+    """
+    An action a character wants to take this frame, submitted to an ActionQueue. Rejected intents
+    get the reason in `reason`.
+    """
+
+    __slots__ = ("kind", "actor", "subject", "targets", "priority", "sequence", "reason")
+
+    def __init__(self, kind, actor, subject, targets=(), priority=0, sequence=0):
+        """
+        Initialize the intent.
+
+        Args:
+            kind (str): 'cast', 'cast_area', 'use', 'equip' or 'unequip'.
+            actor (Character): The character taking the action.
+            subject: The spell name for casts, or the item for the other kinds.
+            targets (tuple): The targets of the action. Defaults to no targets.
+            priority (int): Intents with a higher priority are resolved first. Defaults to 0.
+            sequence (int): The submission number, ordering an actor's intents of equal priority. Defaults to 0.
+        """
+        self.kind = kind
+        self.actor = actor
+        self.subject = subject
+        self.targets = targets
+        self.priority = priority
+        self.sequence = sequence
+        self.reason = None
+
+    def __repr__(self):
+        subject = getattr(self.subject, "name", self.subject)
+        return f"ActionIntent({self.kind!r}, {self.actor.name!r}, {subject!r}, reason={self.reason!r})"
+
+
+class ActionQueue:
+    """
+    Collects the actions characters want to take during a frame and resolves them together.
+
+    AI and player code submit intents (casts, area casts, item uses, equips) at any time during the
+    tick, from any thread; nothing is applied when they are submitted. resolve() then takes the whole
+    batch, orders it deterministically and validates and applies each intent in one pass: the actor and
+    targets must be alive, spells must be known, affordable and off cooldown, and items must be usable.
+    Mana spent by earlier intents of the batch counts against later ones. Rejected intents are returned
+    with a reason instead of being logged one by one.
+
+    The default order is by priority (highest first), then by actor (id, or name if it has none), then
+    in the order each actor submitted its intents, so the result does not depend on how submissions
+    from different threads interleave.
+    """
+
+    def __init__(self, key=None):
+        """
+        Initialize an empty queue.
+
+        Args:
+            key (callable, optional): A function called as key(intent) to sort the intents by, replacing
+                                      the default order. Defaults to None.
+        """
+        self.key = key or _default_order
+        self._pending = []
+        self._sequence = count()
+        self._lock = threading.Lock()
+        self.logger = Logger("rpg_world.combat")
+
+    def __len__(self):
+        """
+        Return the number of intents waiting to be resolved.
+
+        Returns:
+            int: The number of pending intents.
+        """
+        return len(self._pending)
+
+    def submit(self, kind, actor, subject, targets=(), priority=0) -> ActionIntent:
+        """
+        Submit an intent for the current frame. Safe to call from several threads.
+
+        Args:
+            kind (str): 'cast', 'cast_area', 'use', 'equip' or 'unequip'.
+            actor (Character): The character taking the action.
+            subject: The spell name for casts, or the item for the other kinds.
+            targets (iterable): The targets of the action. Defaults to no targets.
+            priority (int): Intents with a higher priority are resolved first. Defaults to 0.
+
+        Returns:
+            ActionIntent: The submitted intent.
+
+        Raises:
+            ValueError: If the kind is unknown.
+        """
+        if kind not in _VALIDATORS:
+            raise ValueError(f"Unknown action kind '{kind}'. Expected one of {tuple(_VALIDATORS)}.")
+        with self._lock:
+            intent = ActionIntent(kind, actor, subject, tuple(targets), priority, next(self._sequence))
+            self._pending.append(intent)
+        return intent
+
+    def cast(self, caster, spell_name: str, target, priority=0) -> ActionIntent:
+        """
+        Submit a spell cast on one target (see Mage.cast_spell).
+
+        Args:
+            caster (Character): The character casting the spell; it must know the spell by name.
+            spell_name (str): The name of the spell.
+            target (Character): The target of the spell.
+            priority (int): Intents with a higher priority are resolved first. Defaults to 0.
+
+        Returns:
+            ActionIntent: The submitted intent.
+        """
+        return self.submit(CAST, caster, spell_name, (target,), priority)
+
+    def cast_area(self, caster, spell_name: str, targets, priority=0) -> ActionIntent:
+        """
+        Submit a spell cast on several targets (see Mage.cast_spell_area). Targets that are dead when
+        the intent is resolved are left out.
+
+        Args:
+            caster (Character): The character casting the spell; it must know the spell by name.
+            spell_name (str): The name of the spell.
+            targets (iterable): The targets of the spell.
+            priority (int): Intents with a higher priority are resolved first. Defaults to 0.
+
+        Returns:
+            ActionIntent: The submitted intent.
+        """
+        return self.submit(CAST_AREA, caster, spell_name, targets, priority)
+
+    def use(self, character, item, target=None, priority=0) -> ActionIntent:
+        """
+        Submit the use of an item, on the character itself unless a target is given.
+
+        Args:
+            character (Character): The character using the item.
+            item (Item): The item to use.
+            target (Character, optional): The character the item is used on. Defaults to None.
+            priority (int): Intents with a higher priority are resolved first. Defaults to 0.
+
+        Returns:
+            ActionIntent: The submitted intent.
+        """
+        return self.submit(USE, character, item, (character if target is None else target,), priority)
+
+    def equip(self, character, item, priority=0) -> ActionIntent:
+        """
+        Submit equipping an item.
+
+        Args:
+            character (Character): The character equipping the item.
+            item (Equipment): The item to equip.
+            priority (int): Intents with a higher priority are resolved first. Defaults to 0.
+
+        Returns:
+            ActionIntent: The submitted intent.
+        """
+        return self.submit(EQUIP, character, item, (), priority)
+
+    def unequip(self, character, item, priority=0) -> ActionIntent:
+        """
+        Submit unequipping an item.
+
+        Args:
+            character (Character): The character unequipping the item.
+            item (Equipment): The item to unequip.
+            priority (int): Intents with a higher priority are resolved first. Defaults to 0.
+
+        Returns:
+            ActionIntent: The submitted intent.
+        """
+        return self.submit(UNEQUIP, character, item, (), priority)
+
+    def resolve(self, current_time: float):
+        """
+        Validate and apply every pending intent, in order, and empty the queue. Intents submitted while
+        this runs are kept for the next frame.
+
+        Args:
+            current_time (float): The current time, used for spell cooldowns.
+
+        Returns:
+            tuple: (applied, rejected) lists of intents, in resolution order. Rejected intents have a reason.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        pending.sort(key=self.key)
+
+        applied = []
+        rejected = []
+        for intent in pending:
+            reason = _VALIDATORS[intent.kind](intent, current_time)
+            if reason is None:
+                _APPLIERS[intent.kind](intent, current_time)
+                applied.append(intent)
+            else:
+                intent.reason = reason
+                rejected.append(intent)
+
+        if rejected:
+            self.logger.info("Resolved %d actions, rejected %d.", len(applied), len(rejected))
+        return applied, rejected
+
+
+def _default_order(intent):
+    """
+    Sort key of the default resolution order: priority, then actor, then submission order.
+    """
+    actor = intent.actor
+    return -intent.priority, str(actor.id if actor.id is not None else actor.name), intent.sequence
+
+
+def _check_spell(intent, current_time):
+    """
+    Validate a cast: the caster must be alive, know the spell, afford it and have it off cooldown
+    (see Spell.check_cast).
+    """
+    caster = intent.actor
+    if not caster.is_alive():
+        return "actor is dead"
+    spell = getattr(caster, "spells", {}).get(intent.subject)
+    if spell is None:
+        return "unknown spell"
+    return spell.check_cast(caster, current_time)
+
+
+def _check_cast(intent, current_time):
+    """
+    Validate a single-target cast, whose target must also be alive.
+    """
+    reason = _check_spell(intent, current_time)
+    if reason is None and not intent.targets[0].is_alive():
+        reason = "target is dead"
+    return reason
+
+
+def _check_cast_area(intent, current_time):
+    """
+    Validate an area cast, leaving out dead targets; at least one target must be alive.
+    """
+    reason = _check_spell(intent, current_time)
+    if reason is None:
+        intent.targets = tuple(target for target in intent.targets if target.is_alive())
+        if not intent.targets:
+            reason = "no living targets"
+    return reason
+
+
+def _check_use(intent, current_time):
+    """
+    Validate an item use: the user must be alive and single-use items must not have been used.
+    """
+    if not intent.actor.is_alive():
+        return "actor is dead"
+    if getattr(intent.subject, "is_used", False):
+        return "item already used"
+    return None
+
+
+def _check_equip(intent, current_time):
+    """
+    Validate equipping: the character must be alive and the item not equipped yet.
+    """
+    if not intent.actor.is_alive():
+        return "actor is dead"
+    if intent.subject.equipped:
+        return "item already equipped"
+    return None
+
+
+def _check_unequip(intent, current_time):
+    """
+    Validate unequipping: the item must be equipped, by the actor. Equipment saved before its wearer
+    was kept has none, and can be unequipped by anyone.
+    """
+    item = intent.subject
+    if not item.equipped:
+        return "item not equipped"
+    if item.wearer is not None and item.wearer is not intent.actor:
+        return "item equipped by another character"
+    return None
+
+
+def _apply_cast(intent, current_time):
+    """
+    Cast a validated spell and spend its mana.
+    """
+    caster = intent.actor
+    spell = caster.spells[intent.subject]
+    spell.perform(caster, intent.targets[0], current_time)
+    caster.stats.modify("mana", -spell.attributes['mana_cost'])
+
+
+def _apply_cast_area(intent, current_time):
+    """
+    Cast a validated area spell and spend its mana once.
+    """
+    caster = intent.actor
+    spell = caster.spells[intent.subject]
+    spell.perform_area(caster, list(intent.targets), current_time)
+    caster.stats.modify("mana", -spell.attributes['mana_cost'])
+
+
+def _apply_use(intent, current_time):
+    intent.subject.use(intent.targets[0])
+
+
+def _apply_equip(intent, current_time):
+    intent.subject.equip(intent.actor)
+
+
+def _apply_unequip(intent, current_time):
+    intent.subject.unequip(intent.actor)
+
+
+# Validation returns None for a valid intent, or the reason it is rejected
+_VALIDATORS = {
+    CAST: _check_cast,
+    CAST_AREA: _check_cast_area,
+    USE: _check_use,
+    EQUIP: _check_equip,
+    UNEQUIP: _check_unequip,
+}
+
+_APPLIERS = {
+    CAST: _apply_cast,
+    CAST_AREA: _apply_cast_area,
+    USE: _apply_use,
+    EQUIP: _apply_equip,
+    UNEQUIP: _apply_unequip,
+}
@@ -15,7 +15,7 @@ class BattleManager:
         self.enemy_party = enemy_party
         self.turn_order = None
         self.turn_order_formula = turn_order_formula
-        self.logger = Logger("BattleManager")
+        self.logger = Logger("rpg_world.combat")
 
     def start_battle(self):
         """
@@ -1,12 +1,27 @@
+import logging
 from abc import ABC
+from itertools import count
 from ..utils.logger import Logger
+from ..telemetry.journal import Journal, JournalEvent
+from ..stats.stat_schema import StatSchema
 
 class Effect(ABC):
     """
     Represents an effect that can be applied to a character. Effects modify the specified
-    attribute of the target based on a formula.
+    attribute of the target based on a formula. The attribute is resolved to its StatSchema id
+    once, when it is set, and applied by id.
+
+    Every assignment to an effect gives it a new `revision`, so spells compiled from it (see
+    Spell.compile) notice that it changed and compile again.
     """
 
+    # Revision of the effect, taken from a process-wide counter on every assignment
+    revision = 0
+
+    # Whether Equipment may add the effect's amount (see amount_for) as a modifier layer instead of
+    # calling apply() and unapply(); subclasses whose apply() or unapply() do more set this to False
+    as_modifier = True
+
     def __init__(self, attribute: str, formula):
         """
         Initialize the Effect with an attribute and a formula object.
@@ -15,14 +30,14 @@ class Effect(ABC):
             attribute (str): The name of the attribute to affect (e.g., 'health', 'mana').
             formula (Formula): An instance of Formula used to calculate the change in attribute value.
                                The formula should have a `calculate` method that accepts context variables
-                               like 'target' and 'attribute'.
+                               like 'target', 'attribute' and 'stat_id'.
         """
         self.attribute = attribute
         self.formula = formula
 
         # Initialize logger for this effect
-        self.logger = Logger("Effect")
-        self.logger.info(f"Effect initialized to affect attribute: {self.attribute}")
+        self.logger = Logger("rpg_world.effect")
+        self.logger.info("Effect initialized to affect attribute: %s", self.attribute)
 
     def apply(self, target, **kwargs):
         """
@@ -35,16 +50,20 @@ class Effect(ABC):
         Returns:
             None
         """
-        if not self.attribute:
-            self.logger.warning(f"No attribute specified in effect: {self}")
+        if self.stat_id is None:
+            self.logger.warning("No attribute specified in effect: %s", self)
             return
 
         # Calculate the amount to modify the attribute using the formula
-        amount = self._calculate_amount(target, **kwargs)
+        amount = self.amount_for(target, **kwargs)
 
         # Modify the target's attribute
-        target.stats.modify(self.attribute, amount)
-        self.logger.info(f"{target.name}'s {self.attribute} changed by {amount}. New value: {target.stats.get(self.attribute)}")
+        target.stats.modify_id(self.stat_id, amount)
+        journal = Journal.current
+        if journal is not None:
+            journal.record(JournalEvent.EFFECT_APPLIED, None, target, self.attribute, amount)
+        if self.logger.is_enabled_for(logging.INFO):
+            self.logger.info("%s's %s changed by %s. New value: %s", target.name, self.attribute, amount, target.stats.get(self.attribute))
 
     def unapply(self, target, **kwargs):
         """
@@ -57,20 +76,23 @@ class Effect(ABC):
         Returns:
             None
         """
-        if not self.attribute:
-            self.logger.warning(f"No attribute specified in effect: {self}")
+        if self.stat_id is None:
+            self.logger.warning("No attribute specified in effect: %s", self)
             return
 
         # Calculate the amount to reverse the attribute modification
-        amount = self._calculate_amount(target, **kwargs)
+        amount = self.amount_for(target, **kwargs)
 
         # Reverse the modification of the target's attribute
-        target.stats.modify(self.attribute, -amount)
-        self.logger.info(f"{target.name}'s {self.attribute} reversed by {amount}. New value: {target.stats.get(self.attribute)}")
+        target.stats.modify_id(self.stat_id, -amount)
+        if self.logger.is_enabled_for(logging.INFO):
+            self.logger.info("%s's %s reversed by %s. New value: %s", target.name, self.attribute, amount, target.stats.get(self.attribute))
 
-    def _calculate_amount(self, target, **kwargs):
+    def amount_for(self, target, **kwargs):
         """
         Calculate the amount of change to the target's attribute using the provided formula.
+        apply() and unapply() change the attribute by this amount, and Equipment adds it as a
+        modifier layer, so subclasses changing how the amount is calculated override this method.
 
         Args:
             target (Character): The character whose attribute is being modified.
@@ -81,12 +103,61 @@ class Effect(ABC):
         """
         amount = self.formula.calculate(
             target=target,
-            attribute=self.attribute,
+            attribute=self._attribute,
+            stat_id=self.stat_id,
             **kwargs
         )
 
         return amount
 
+    @property
+    def attribute(self):
+        """
+        The name of the attribute this effect changes.
+
+        Returns:
+            str: The attribute name.
+        """
+        return self._attribute
+
+    @attribute.setter
+    def attribute(self, attribute):
+        """
+        Set the attribute this effect changes and resolve its StatSchema id.
+
+        Args:
+            attribute (str): The attribute name, or None for an effect that does nothing.
+        """
+        self._attribute = attribute
+        self.stat_id = StatSchema.id(attribute) if attribute else None
+
+    def __setattr__(self, attr_name, value):
+        """
+        Set an attribute and give the effect a new revision.
+
+        Args:
+            attr_name (str): The name of the attribute to set.
+            value (Any): The value to set for the attribute.
+        """
+        super().__setattr__(attr_name, value)
+        self.__dict__['revision'] = next(_revisions)
+
+    def __getstate__(self):
+        """
+        Pickle without the stat id, which is only valid in the running process.
+        """
+        state = self.__dict__.copy()
+        state.pop("stat_id", None)
+        return state
+
+    def __setstate__(self, state):
+        # Effects pickled before the attribute became a property store it as 'attribute'
+        if "_attribute" not in state:
+            state = dict(state)
+            state["_attribute"] = state.pop("attribute", None)
+        self.__dict__.update(state)
+        self.attribute = self._attribute
+
     def __str__(self):
         """
         Return a string representation of the effect.
@@ -95,3 +166,7 @@ class Effect(ABC):
             str: A string describing the effect, including the attribute and formula.
         """
         return f"Effect({self.attribute}, {self.formula})"
+
+
+# Shared by every effect, so a revision is never reused after an effect is replaced
+_revisions = count(1)
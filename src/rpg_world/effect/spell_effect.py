@@ -1,4 +1,7 @@
+import logging
+from itertools import repeat
 from .effect import Effect
+from ..telemetry.journal import Journal, JournalEvent
 
 class SpellEffect(Effect):
     """
@@ -32,15 +35,15 @@ class SpellEffect(Effect):
         Returns:
             None
         """
-        if not self.attribute:
-            self.logger.warning(f"No attribute specified in effect: {self}")
+        if self.stat_id is None:
+            self.logger.warning("No attribute specified in effect: %s", self)
             return
 
         # Determine the recipient of the effect (either caster or target)
         recipient = caster if self.recipient == 'caster' else target
 
         # Calculate the amount to modify the attribute using the formula
-        amount = self._calculate_amount(
+        amount = self.amount_for(
             target=target,
             caster=caster,
             recipient=recipient,
@@ -48,8 +51,121 @@ class SpellEffect(Effect):
         )
 
         # Modify the recipient's attribute
-        recipient.stats.modify(self.attribute, amount)
-        self.logger.info(f"{recipient.name}'s {self.attribute} changed by {amount}. New value: {recipient.stats.get(self.attribute)}")
+        recipient.stats.modify_id(self.stat_id, amount)
+        journal = Journal.current
+        if journal is not None:
+            journal.record(JournalEvent.SPELL_EFFECT_APPLIED, caster, recipient, self.attribute, amount)
+        if self.logger.is_enabled_for(logging.INFO):
+            self.logger.info("%s's %s changed by %s. New value: %s", recipient.name, self.attribute, amount, recipient.stats.get(self.attribute))
+
+    def apply_area(self, caster, targets: list, **kwargs):
+        """
+        Apply the effect for every target of an area-of-effect cast (see Spell.cast_area). The formula
+        is evaluated for all targets at once with Formula.calculate_many, and the results are applied
+        in one bulk update when the recipients' stats are kept in a StatsStore (StatsStore.apply_deltas),
+        or in a single loop otherwise.
+        Effects on the caster, and effects on a target listed more than once, are applied once per target
+        with apply(), as if the spell had been cast on each target in turn.
+
+        Args:
+            caster (Character): The character casting the spell.
+            targets (list): The characters receiving the spell.
+            **kwargs: Additional context variables that can be used in the formula.
+
+        Returns:
+            None
+        """
+        if self.stat_id is None:
+            self.logger.warning("No attribute specified in effect: %s", self)
+            return
+
+        if (self.recipient == 'caster' or len({id(target) for target in targets}) != len(targets)
+                or self._overrides_apply()):
+            # A recipient changed more than once must see its earlier changes, as in separate casts, and
+            # subclasses changing how the effect is applied must be called for every target
+            for target in targets:
+                self.apply(caster, target, **kwargs)
+            return
+
+        attribute = self.attribute
+        recipients = targets
+        amounts = self.formula.calculate_many(
+            targets,
+            recipients,
+            caster=caster,
+            attribute=attribute,
+            stat_id=self.stat_id,
+            **kwargs
+        )
+
+        first = recipients[0].stats if recipients else None
+        # Checked by name, since importing StatsStore would import NumPy
+        if first.__class__.__name__ == "StoredCharacterStats":
+            # Limits are the formulas' job, as in apply()
+            first._store.apply_deltas(zip(recipients, repeat(attribute), amounts), clamp=False)
+        else:
+            stat_id = self.stat_id
+            for recipient, amount in zip(recipients, amounts):
+                recipient.stats.modify_id(stat_id, amount)
+
+        journal = Journal.current
+        if journal is not None:
+            for recipient, amount in zip(recipients, amounts):
+                journal.record(JournalEvent.SPELL_EFFECT_APPLIED, caster, recipient, attribute, amount)
+        if self.logger.is_enabled_for(logging.INFO):
+            for recipient, amount in zip(recipients, amounts):
+                self.logger.info("%s's %s changed by %s. New value: %s", recipient.name, attribute, amount, recipient.stats.get(attribute))
+
+    def compile(self):
+        """
+        Return a function applying this effect with the recipient, attribute id and formula resolved
+        ahead of time, for compiled spell casts (see Spell.compile). It behaves like apply(), including
+        journaling and logging, as long as the effect is not changed afterwards.
+
+        Subclasses that override apply() or amount_for() without overriding compile() get a function
+        calling their apply(), since the compiled function would skip their code.
+
+        Returns:
+            callable or None: A function called as function(caster, target, ability), or None if the effect
+                              has no attribute and does nothing.
+        """
+        if self._overrides_apply() and type(self).compile is SpellEffect.compile:
+            apply = self.apply
+
+            def applied(caster, target, ability):
+                apply(caster=caster, target=target, ability=ability)
+            return applied
+
+        if self.stat_id is None:
+            self.logger.warning("No attribute specified in effect: %s", self)
+            return None
+
+        attribute = self.attribute
+        stat_id = self.stat_id
+        to_caster = self.recipient == 'caster'
+        calculate = self.formula.compile(attribute, stat_id)
+        logger = self.logger
+        # The underlying logging.Logger's check, skipping the wrapper call on every cast
+        is_enabled_for = logger.logger.isEnabledFor
+
+        def compiled(caster, target, ability):
+            recipient = caster if to_caster else target
+            amount = calculate(caster, target, recipient, ability)
+            recipient.stats.modify_id(stat_id, amount)
+            journal = Journal.current
+            if journal is not None:
+                journal.record(JournalEvent.SPELL_EFFECT_APPLIED, caster, recipient, attribute, amount)
+            if is_enabled_for(logging.INFO):
+                logger.info("%s's %s changed by %s. New value: %s", recipient.name, attribute, amount, recipient.stats.get(attribute))
+        return compiled
+
+    def _overrides_apply(self) -> bool:
+        """
+        Check whether the effect's class overrides apply() or amount_for(), which the batched and
+        compiled paths do not call.
+        """
+        cls = type(self)
+        return cls.apply is not SpellEffect.apply or cls.amount_for is not SpellEffect.amount_for
 
     def __str__(self):
         """
@@ -3,6 +3,7 @@
 from .trigger import (
     Trigger,
     HealthBelowThresholdTrigger,
+    StatThresholdTrigger,
     PlayerInLocationTrigger,
     QuestCompletedTrigger
 )
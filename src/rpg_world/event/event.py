@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from ..telemetry.journal import Journal, JournalEvent
 
 class Event(ABC):
     """
@@ -41,6 +42,10 @@ class Event(ABC):
         # If all triggers are satisfied, mark the event as triggered and execute its action
         self.triggered = True
         self.execute_action(game_state)
+
+        journal = Journal.current
+        if journal is not None:
+            journal.record(JournalEvent.EVENT_TRIGGERED, self)
         return True
 
     @abstractmethod
@@ -18,7 +18,7 @@ class EventManager:
         self.name = name
         self.description = description
         self.events = []
-        self.logger = Logger("EventManager")
+        self.logger = Logger("rpg_world.event")
 
     def add_event(self, event):
         """
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from ..stats.stat_watchers import BELOW, CROSSING, DIRECTIONS
 
 class Trigger(ABC):
     """
@@ -32,6 +33,7 @@ class Trigger(ABC):
 class HealthBelowThresholdTrigger(Trigger):
     """
     A trigger that activates when a character's health drops below a specified threshold.
+    It reads the health on every evaluation; StatThresholdTrigger is the push-based alternative.
     """
 
     def __init__(self, character_id, threshold):
@@ -60,6 +62,96 @@ class HealthBelowThresholdTrigger(Trigger):
         return character.health < self.threshold
 
 
+class StatThresholdTrigger(Trigger):
+    """
+    A trigger on a character's stat that is pushed updates instead of polling. On its first evaluation it
+    registers a threshold watcher on the character's stats (see Stats.watch) and from then on only changes
+    its state when a write crosses the threshold, so evaluating it does not read the stat at all.
+
+    With direction 'below' or 'above' the trigger is active while the stat is under or over the threshold.
+    With 'crossing' it is active if the stat crossed the threshold in either direction since the last evaluation.
+    """
+
+    def __init__(self, character_id, attribute, threshold, direction="below"):
+        """
+        Initialize the trigger with the character ID, the watched stat and the threshold.
+
+        Args:
+            character_id (str): The ID of the character to monitor.
+            attribute (str): The name of the stat to monitor, e.g. 'health'.
+            threshold (float): The value to compare the stat with.
+            direction (str): 'below', 'above' or 'crossing'. Defaults to 'below'.
+
+        Raises:
+            ValueError: If the direction is unknown.
+        """
+        if direction not in DIRECTIONS:
+            raise ValueError(f"Unknown trigger direction '{direction}'. Expected one of {DIRECTIONS}.")
+        super().__init__(description=f"Trigger when {attribute} is {direction} {threshold}.")
+        self.character_id = character_id
+        self.attribute = attribute
+        self.threshold = threshold
+        self.direction = direction
+        self.active = False
+        self._stats = None
+        self._watcher = None
+
+    def evaluate(self, game_state):
+        """
+        Evaluate the trigger, registering its watcher first if the character's stats are not watched yet.
+
+        Args:
+            game_state (object): The current state of the game, including character data.
+
+        Returns:
+            bool: True if the condition is met, False otherwise.
+        """
+        stats = game_state.characters[self.character_id].stats
+        if stats is not self._stats:
+            self.arm(stats)
+        if self.direction == CROSSING:
+            active, self.active = self.active, False
+            return active
+        return self.active
+
+    def arm(self, stats):
+        """
+        Watch a Stats object, replacing any stats watched before, and take the current state from its value.
+
+        Args:
+            stats (Stats): The stats to watch.
+        """
+        self.disarm()
+        self._stats = stats
+        # A 'crossing' watcher sees every change of side, so it keeps 'below' and 'above' exact as well
+        self._watcher = stats.watch(self.attribute, self.threshold, self._on_cross, CROSSING)
+        self.active = self.direction != CROSSING and self._is_met(stats.get(self.attribute) or 0)
+
+    def disarm(self):
+        """
+        Stop watching the stats. The trigger registers again on its next evaluation.
+        """
+        if self._watcher is not None:
+            self._stats.unwatch(self._watcher)
+        self._stats = None
+        self._watcher = None
+
+    def _is_met(self, value):
+        return value < self.threshold if self.direction == BELOW else value > self.threshold
+
+    def _on_cross(self, stats, attr_name, old_value, new_value):
+        self.active = self.direction == CROSSING or self._is_met(new_value)
+
+    def __getstate__(self):
+        """
+        Pickle without the watched stats; watchers are not pickled, so the trigger registers again when evaluated.
+        """
+        state = self.__dict__.copy()
+        state["_stats"] = None
+        state["_watcher"] = None
+        return state
+
+
 class PlayerInLocationTrigger(Trigger):
     """
     A trigger that activates when the player reaches a specific location in the game world.
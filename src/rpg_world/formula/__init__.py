@@ -7,6 +7,7 @@ from .effect_formula import (
     MultiEffectRecipientFormula,
     SimpleChangeFormulaWithStatLimits
 )
+from .expression_formula import ExpressionFormula
 from .turn_order_formula import SimpleFocusTurnOrderFormula
 
 # By including this, users can import characters like this:
@@ -1,4 +1,6 @@
 from .formula import Formula
+from ..stats.stats import Stats
+from ..stats.stat_schema import max_ids, stat_names
 
 class SimpleChangeFormula(Formula):
     """
@@ -26,6 +28,35 @@ class SimpleChangeFormula(Formula):
         """
         return self.value
 
+    def calculate_many(self, targets: list, recipients: list, **kwargs) -> list:
+        """
+        Return the fixed value for every target of an area-of-effect cast.
+
+        Args:
+            targets (list): The targets of the cast.
+            recipients (list): The recipients of the effect (not used).
+            **kwargs: Additional context variables (not used in this formula).
+
+        Returns:
+            list: The fixed change value, once per target.
+        """
+        return [self.value] * len(targets)
+
+    def compile(self, attribute: str, stat_id: int):
+        """
+        Return a function returning the fixed value, for compiled spell casts.
+
+        Args:
+            attribute (str): The name of the attribute the effect changes (not used).
+            stat_id (int): The attribute's StatSchema id (not used).
+
+        Returns:
+            callable: A function called as function(caster, target, recipient, ability).
+        """
+        def compiled(caster, target, recipient, ability):
+            return self.value
+        return compiled
+
 
 class SimpleChangeFormulaWithStatLimits(Formula):
     """
@@ -47,15 +78,70 @@ class SimpleChangeFormulaWithStatLimits(Formula):
 
         Args:
             **kwargs: Must contain 'target' (the character whose attribute is being modified)
-                      and 'attribute' (the name of the attribute being modified).
+                      and 'attribute' (the name of the attribute being modified). Effects also pass
+                      'stat_id', the attribute's StatSchema id, which is used instead when present.
 
         Returns:
             float: The modified value after applying limits.
         """
         target = kwargs.get("target")
-        attribute = kwargs.get("attribute")
+        attribute = kwargs.get("stat_id")
+        if attribute is None:
+            attribute = kwargs.get("attribute")
         return self.apply_limits(self.value, target, attribute)
 
+    def calculate_many(self, targets: list, recipients: list, **kwargs) -> list:
+        """
+        Calculate the limited value for every target of an area-of-effect cast. When the targets' stats
+        are all kept in one StatsStore and the attribute is a core stat, the limits are applied to the
+        columns at once.
+
+        Args:
+            targets (list): The targets of the cast.
+            recipients (list): The recipients of the effect (not used; the limits are the targets').
+            **kwargs: Must contain 'stat_id' or 'attribute', as for calculate().
+
+        Returns:
+            list: The limited change for each target, in order.
+        """
+        stat_id = kwargs.get("stat_id")
+        attribute = stat_names[stat_id] if stat_id is not None else kwargs.get("attribute")
+        located = _locate(targets)
+        if located is None or attribute not in located[0].columns:
+            return [self.apply_limits(self.value, target, attribute) for target in targets]
+
+        import numpy as np
+        store, rows = located
+        current = store.columns[attribute][rows]
+        amounts = np.full(len(rows), float(self.value))
+        max_column = store.columns.get(f"max_{attribute}")
+        # The same order as Stats.limit_delta: the maximum first, then the minimum of 0
+        if max_column is not None:
+            np.minimum(amounts, max_column[rows] - current, out=amounts)
+        np.maximum(amounts, -current, out=amounts)
+        return amounts.tolist()
+
+    def compile(self, attribute: str, stat_id: int):
+        """
+        Return a function applying the fixed change within the target's limits, for compiled spell casts.
+        The id of the attribute's maximum is looked up once.
+
+        Args:
+            attribute (str): The name of the attribute the effect changes.
+            stat_id (int): The attribute's StatSchema id.
+
+        Returns:
+            callable: A function called as function(caster, target, recipient, ability).
+        """
+        max_id = max_ids[stat_id]
+        limit_delta = Stats.limit_delta
+
+        def compiled(caster, target, recipient, ability):
+            stats = target.stats
+            max_value = None if max_id is None else stats.get_id(max_id)
+            return limit_delta(stats.get_id(stat_id), self.value, max_value)
+        return compiled
+
 
 class MultiEffectTargetFormula(Formula):
     """
@@ -76,6 +162,43 @@ class MultiEffectTargetFormula(Formula):
         target = kwargs.get("target")
         return -(50 + (target.stats.get("focus") * 0.5)) * (1 - (target.stats.get("armor") / 100.0))
 
+    def calculate_many(self, targets: list, recipients: list, **kwargs) -> list:
+        """
+        Calculate the effect value for every target of an area-of-effect cast, from the focus and armor
+        columns at once when the targets' stats are all kept in one StatsStore.
+
+        Args:
+            targets (list): The targets of the cast.
+            recipients (list): The recipients of the effect (not used).
+            **kwargs: Additional context variables (not used in this formula).
+
+        Returns:
+            list: The effect value for each target, in order.
+        """
+        located = _locate(targets)
+        if located is None:
+            return [self.calculate(target=target) for target in targets]
+        store, rows = located
+        focus = store.columns["focus"][rows]
+        armor = store.columns["armor"][rows]
+        return (-(50 + focus * 0.5) * (1 - armor / 100.0)).tolist()
+
+    def compile(self, attribute: str, stat_id: int):
+        """
+        Return a function calculating the effect value from the target's stats, for compiled spell casts.
+
+        Args:
+            attribute (str): The name of the attribute the effect changes (not used).
+            stat_id (int): The attribute's StatSchema id (not used).
+
+        Returns:
+            callable: A function called as function(caster, target, recipient, ability).
+        """
+        def compiled(caster, target, recipient, ability):
+            stats = target.stats
+            return -(50 + (stats.get("focus") * 0.5)) * (1 - (stats.get("armor") / 100.0))
+        return compiled
+
 
 class MultiEffectRecipientFormula(Formula):
     """
@@ -95,3 +218,31 @@ class MultiEffectRecipientFormula(Formula):
         """
         recipient = kwargs.get("recipient")
         return -(50 + (recipient.stats.get("focus") * 0.1)) * (1 - (recipient.stats.get("armor") / 100.0))
+
+    def compile(self, attribute: str, stat_id: int):
+        """
+        Return a function calculating the effect value from the recipient's stats, for compiled spell casts.
+
+        Args:
+            attribute (str): The name of the attribute the effect changes (not used).
+            stat_id (int): The attribute's StatSchema id (not used).
+
+        Returns:
+            callable: A function called as function(caster, target, recipient, ability).
+        """
+        def compiled(caster, target, recipient, ability):
+            stats = recipient.stats
+            return -(50 + (stats.get("focus") * 0.1)) * (1 - (stats.get("armor") / 100.0))
+        return compiled
+
+
+def _locate(targets):
+    """
+    Return StatsStore.locate(targets), or None without importing the store (and NumPy) when the first
+    target's stats are not kept in a StatsStore.
+    """
+    if not targets or targets[0].stats.__class__.__name__ != "StoredCharacterStats":
+        return None
+    from ..stats.stats_store import StatsStore
+    return StatsStore.locate(targets)
+
@@ -0,0 +1,209 @@
+import ast
+from .formula import Formula
+from ..stats.stats import Stats
+from ..stats.stat_schema import max_ids, stat_ids
+
+# Namespaces an expression can read from, in the order compiled functions take them
+NAMESPACES = ("caster", "target", "recipient", "ability")
+
+# Functions an expression can call
+FUNCTIONS = {"min": min, "max": max, "abs": abs, "round": round}
+
+_OPERATORS = (
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.UAdd, ast.USub, ast.Not, ast.And, ast.Or,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+)
+
+class ExpressionFormula(Formula):
+    """
+    A formula written as an arithmetic expression, such as
+    '-(50 + target.focus * 0.5) * (1 - target.armor / 100)', instead of a Formula subclass.
+
+    The expression can read the stats of the 'caster', 'target' and 'recipient' of the effect
+    (e.g. caster.focus) and the attributes of the 'ability' being cast (e.g. ability.mana_cost), and
+    call min, max, abs and round. Comparisons, 'and'/'or'/'not' and 'a if condition else b' are allowed;
+    anything else (other names, calls, subscripts, strings) is rejected. Stats must be registered in the
+    StatSchema, which the core stats always are, so misspelled stats are caught when the formula is created.
+
+    The expression is parsed and validated once and compiled to a Python function that reads the stats
+    the same way the formula subclasses do; formulas with the same expression share the compiled function.
+    """
+
+    # Compiled functions by expression, shared by every formula using the expression
+    _functions = {}
+
+    def __init__(self, expression: str, limits: bool = False):
+        """
+        Initialize the formula, compiling the expression.
+
+        Args:
+            expression (str): The expression calculating the effect value.
+            limits (bool): Whether to keep the changed attribute within its limits, like
+                           SimpleChangeFormulaWithStatLimits. Defaults to False.
+
+        Raises:
+            ValueError: If the expression is not valid or reads a stat the StatSchema does not know.
+        """
+        self.expression = expression
+        self.limits = limits
+        self.function = self._functions.get(expression)
+        if self.function is None:
+            self.function = self._functions[expression] = _compile_expression(expression)
+
+    def with_limits(self) -> "ExpressionFormula":
+        """
+        Return a formula with the same expression that keeps the changed attribute within the
+        target's limits (between 0 and its maximum), like SimpleChangeFormulaWithStatLimits.
+
+        Returns:
+            ExpressionFormula: The limited formula, sharing the compiled expression.
+        """
+        return ExpressionFormula(self.expression, limits=True)
+
+    def calculate(self, **kwargs):
+        """
+        Evaluate the expression.
+
+        Args:
+            **kwargs: May contain 'caster', 'target', 'recipient' and 'ability', and must contain those
+                      the expression reads. Limited formulas also need 'target' and 'stat_id' or 'attribute',
+                      as for SimpleChangeFormulaWithStatLimits.
+
+        Returns:
+            float: The value of the expression, limited if the formula has limits.
+        """
+        target = kwargs.get("target")
+        value = self.function(kwargs.get("caster"), target, kwargs.get("recipient"), kwargs.get("ability"))
+        if not self.limits:
+            return value
+        attribute = kwargs.get("stat_id")
+        if attribute is None:
+            attribute = kwargs.get("attribute")
+        return self.apply_limits(value, target, attribute)
+
+    def calculate_many(self, targets: list, recipients: list, **kwargs) -> list:
+        """
+        Evaluate the expression for every target of an area-of-effect cast.
+
+        Args:
+            targets (list): The targets of the cast.
+            recipients (list): The recipient of the effect for each target.
+            **kwargs: The context shared by every target, as for calculate().
+
+        Returns:
+            list: The value for each target, in order.
+        """
+        if self.limits:
+            return super().calculate_many(targets, recipients, **kwargs)
+        function = self.function
+        caster = kwargs.get("caster")
+        ability = kwargs.get("ability")
+        return [function(caster, target, recipient, ability) for target, recipient in zip(targets, recipients)]
+
+    def compile(self, attribute: str, stat_id: int):
+        """
+        Return the compiled expression, wrapped to apply the target's limits for limited formulas,
+        for compiled spell casts.
+
+        Args:
+            attribute (str): The name of the attribute the effect changes.
+            stat_id (int): The attribute's StatSchema id.
+
+        Returns:
+            callable: A function called as function(caster, target, recipient, ability).
+        """
+        function = self.function
+        if not self.limits:
+            return function
+        max_id = max_ids[stat_id]
+        limit_delta = Stats.limit_delta
+
+        def compiled(caster, target, recipient, ability):
+            value = function(caster, target, recipient, ability)
+            stats = target.stats
+            max_value = None if max_id is None else stats.get_id(max_id)
+            return limit_delta(stats.get_id(stat_id), value, max_value)
+        return compiled
+
+    def __reduce__(self):
+        # The compiled function cannot be pickled; compile the expression again when loading
+        return self.__class__, (self.expression, self.limits)
+
+    def __repr__(self):
+        return f"ExpressionFormula({self.expression!r}, limits={self.limits})"
+
+
+def _compile_expression(expression: str):
+    """
+    Parse, validate and compile an expression.
+
+    Args:
+        expression (str): The expression.
+
+    Returns:
+        callable: A function called as function(caster, target, recipient, ability).
+
+    Raises:
+        ValueError: If the expression is not valid or reads a stat the StatSchema does not know.
+    """
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as error:
+        raise ValueError(f"Invalid formula expression {expression!r}: {error.msg}.") from None
+
+    body = _StatReader(expression).visit(tree.body)
+    arguments = ast.arguments(posonlyargs=[], args=[ast.arg(arg=name) for name in NAMESPACES], vararg=None,
+                              kwonlyargs=[], kw_defaults=[], kwarg=None, defaults=[])
+    function = ast.Expression(ast.Lambda(args=arguments, body=body))
+    ast.fix_missing_locations(function)
+    code = compile(function, f"<formula {expression!r}>", "eval")
+    return eval(code, {"__builtins__": {}, **FUNCTIONS})
+
+
+class _StatReader(ast.NodeTransformer):
+    """
+    Validates an expression and rewrites its stat reads (target.focus) into the calls the formula
+    subclasses make (target.stats.get('focus')) and its ability reads (ability.mana_cost) into
+    lookups in the ability's attributes.
+    """
+
+    def __init__(self, expression: str):
+        self.expression = expression
+
+    def _error(self, message: str):
+        return ValueError(f"Invalid formula expression {self.expression!r}: {message}.")
+
+    def visit_Attribute(self, node):
+        namespace = node.value
+        if not isinstance(namespace, ast.Name) or namespace.id not in NAMESPACES:
+            raise self._error("only caster, target, recipient and ability attributes can be read")
+        if namespace.id == "ability":
+            attributes = ast.Attribute(value=ast.Name(id="ability", ctx=ast.Load()), attr="attributes", ctx=ast.Load())
+            return ast.copy_location(ast.Subscript(value=attributes, slice=ast.Constant(node.attr), ctx=ast.Load()), node)
+        if node.attr not in stat_ids:
+            raise self._error(f"unknown stat '{node.attr}'")
+        stats = ast.Attribute(value=ast.Name(id=namespace.id, ctx=ast.Load()), attr="stats", ctx=ast.Load())
+        get = ast.Attribute(value=stats, attr="get", ctx=ast.Load())
+        return ast.copy_location(ast.Call(func=get, args=[ast.Constant(node.attr)], keywords=[]), node)
+
+    def visit_Call(self, node):
+        if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS or node.keywords:
+            raise self._error(f"only {', '.join(FUNCTIONS)} can be called, with positional arguments")
+        node.args = [self.visit(argument) for argument in node.args]
+        return node
+
+    def visit_Name(self, node):
+        if node.id in NAMESPACES:
+            raise self._error(f"'{node.id}' can only be used to read an attribute, e.g. {node.id}.focus")
+        raise self._error(f"unknown name '{node.id}'")
+
+    def visit_Constant(self, node):
+        if node.value.__class__ not in (int, float, bool):
+            raise self._error(f"unsupported constant {node.value!r}")
+        return node
+
+    def generic_visit(self, node):
+        if not isinstance(node, (ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare, ast.IfExp, ast.Load) + _OPERATORS):
+            raise self._error(f"unsupported syntax '{node.__class__.__name__}'")
+        return super().generic_visit(node)
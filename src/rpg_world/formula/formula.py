@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from ..stats.stats import Stats
+from ..stats.stat_schema import StatSchema, stat_ids, max_ids
 
 class Formula(ABC):
     """
@@ -19,6 +21,43 @@ class Formula(ABC):
         """
         pass
 
+    def calculate_many(self, targets: list, recipients: list, **kwargs) -> list:
+        """
+        Calculate the effect value for every target of an area-of-effect cast (see Spell.cast_area).
+        Subclasses can override this with a vectorized version; this one calls `calculate` once per target.
+
+        Args:
+            targets (list): The targets of the cast.
+            recipients (list): The character receiving the effect for each target (the target or the caster).
+            **kwargs: The context variables shared by every target, such as 'caster', 'attribute', 'stat_id' and 'ability'.
+
+        Returns:
+            list: The effect value for each target, in order.
+        """
+        calculate = self.calculate
+        return [calculate(target=target, recipient=recipient, **kwargs) for target, recipient in zip(targets, recipients)]
+
+    def compile(self, attribute: str, stat_id: int):
+        """
+        Return a function calculating this formula for one effect, for compiled spell casts (see Spell.compile).
+        The attribute is resolved once, so the function only takes the participants of the cast.
+        Subclasses can override this with a specialized version; this one calls `calculate` with the
+        same keyword arguments SpellEffect.apply passes.
+
+        Args:
+            attribute (str): The name of the attribute the effect changes.
+            stat_id (int): The attribute's StatSchema id.
+
+        Returns:
+            callable: A function called as function(caster, target, recipient, ability) returning the amount.
+        """
+        calculate = self.calculate
+
+        def compiled(caster, target, recipient, ability):
+            return calculate(target=target, attribute=attribute, stat_id=stat_id,
+                             caster=caster, recipient=recipient, ability=ability)
+        return compiled
+
     def apply_limits(self, value, target, attribute):
         """
         Apply min/max limits to the calculated value, ensuring the resulting attribute value
@@ -27,21 +66,21 @@ class Formula(ABC):
         Args:
             value (float): The calculated effect amount on the target attribute.
             target (Character): The target character whose attribute is being modified.
-            attribute (str): The name of the attribute to apply the limits on.
+            attribute (str or int): The name of the attribute to apply the limits on, or its StatSchema id.
 
         Returns:
             float: The modified value that adheres to the attribute's min/max limits.
         """
-        current_value = target.stats.get(attribute)
-        max_value = target.stats.get(f"max_{attribute}")
-        min_value = 0  # Assuming attributes like health/mana cannot drop below 0
-
-        # Adjust the value to ensure it doesn't exceed the max limit
-        if max_value is not None and current_value + value > max_value:
-            value = max_value - current_value  # Return only the amount needed to reach max
-
-        # Adjust the value to ensure it doesn't drop below the min limit
-        if current_value + value < min_value:
-            value = min_value - current_value  # Return only the amount needed to reach min
+        if attribute.__class__ is int:
+            stat_id = attribute
+        else:
+            stat_id = stat_ids.get(attribute)
+            if stat_id is None:
+                stat_id = StatSchema.id(attribute)
+        stats = target.stats
+        current_value = stats.get_id(stat_id)
+        max_id = max_ids[stat_id]
+        max_value = None if max_id is None else stats.get_id(max_id)
 
-        return value
+        # Attributes like health/mana cannot exceed their max or drop below 0
+        return Stats.limit_delta(current_value, value, max_value)
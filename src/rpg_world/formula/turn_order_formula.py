@@ -1,3 +1,4 @@
+from operator import attrgetter
 from .formula import Formula
 
 class SimpleFocusTurnOrderFormula(Formula):
@@ -30,6 +31,6 @@ class SimpleFocusTurnOrderFormula(Formula):
         """
         return sorted(
             self.participants,
-            key=lambda char: char.focus,
+            key=attrgetter("focus"),
             reverse=True
         )
@@ -1,3 +1,4 @@
+import logging
 import time
 from ..utils.logger import Logger
 
@@ -25,14 +26,12 @@ class Game:
         self.start_time = None  # To track when the game starts
 
         # Initialize logger for this game instance
-        self.logger = Logger("Game")
-        self.logger.info(f"""Game initialized with attributes: {
-            {
-                "target_fps": self.target_fps,
-                "frame_duration": self.frame_duration,
-                "max_run_time": self.max_run_time,
-            }
-        }""")
+        self.logger = Logger("rpg_world.game")
+        self.logger.info("Game initialized with attributes: %s", {
+            "target_fps": self.target_fps,
+            "frame_duration": self.frame_duration,
+            "max_run_time": self.max_run_time,
+        })
 
         # Initialize game components (e.g., characters, spells, UI)
         self.init_game()
@@ -51,14 +50,16 @@ class Game:
         Args:
             delta_time (float): The amount of time passed since the last frame in seconds.
         """
-        # Calculate the current FPS (frames per second)
-        if delta_time > 0:
-            fps = 1.0 / delta_time
-        else:
-            fps = float('inf')  # To avoid division by zero if delta_time is zero
+        # Skip the FPS calculation entirely unless debug output is enabled
+        if self.logger.is_enabled_for(logging.DEBUG):
+            # Calculate the current FPS (frames per second)
+            if delta_time > 0:
+                fps = 1.0 / delta_time
+            else:
+                fps = float('inf')  # To avoid division by zero if delta_time is zero
 
-        # Display the FPS and delta time
-        self.logger.debug(f"Updating game. Delta time: {delta_time:.8f} seconds, FPS: {fps:.8f}")
+            # Display the FPS and delta time
+            self.logger.debug("Updating game. Delta time: %.8f seconds, FPS: %.8f", delta_time, fps)
 
     def _sync_to_target_frame_rate(self, current_time):
         """
@@ -88,7 +89,7 @@ class Game:
         if self.max_run_time is not None:
             time_elapsed = current_time - self.start_time
             if time_elapsed >= self.max_run_time:
-                self.logger.info(f"Max run time of {self.max_run_time} seconds reached. Stopping the game.")
+                self.logger.info("Max run time of %s seconds reached. Stopping the game.", self.max_run_time)
                 self.stop()
 
     def run(self):
@@ -115,6 +116,8 @@ class Game:
     def stop(self):
         """
         Stop the game loop, effectively ending the game.
+        Pending log output is flushed so nothing queued by an asynchronous logging backend is lost.
         """
         self.is_running = False
         self.logger.info("Game stopped.")
+        Logger.flush()
@@ -10,6 +10,27 @@ class GameState:
         self.current_world = None
         self.characters = {}
         self.quests = {}
+        self.stats_store = None  # Optional columnar storage for character stats, see enable_stats_store()
+
+    def enable_stats_store(self, capacity: int = 1024):
+        """
+        Keep the core stats of every character in a StatsStore, so population-wide operations run vectorized.
+        Characters already in the game state are attached now and characters added later are attached as they arrive.
+        Requires NumPy.
+
+        Args:
+            capacity (int): The number of rows allocated up front. Defaults to 1024.
+
+        Returns:
+            StatsStore: The game state's stats store.
+        """
+        from ..stats.stats_store import StatsStore
+
+        if self.stats_store is None:
+            self.stats_store = StatsStore(capacity)
+        for character in self.characters.values():
+            self.stats_store.attach(character.stats)
+        return self.stats_store
 
     def update_world(self, world):
         """
@@ -30,6 +51,39 @@ class GameState:
         """
         assert hasattr(character, 'id'), "Character must have an 'id' attribute."
         self.characters[character.id] = character
+        if self.stats_store is not None:
+            self.stats_store.attach(character.stats)
+
+    def spawn_many(self, archetype, count: int, id_prefix: str = None) -> list:
+        """
+        Spawn many characters from an archetype and add them to the game state in one call.
+        The characters get sequential IDs ('<id_prefix>-<index>', using the archetype's spawn counter),
+        and their inventories and loggers are only created when first used.
+
+        Args:
+            archetype (Archetype): The archetype to spawn the characters from.
+            count (int): The number of characters to spawn.
+            id_prefix (str, optional): The prefix of the characters' IDs. Defaults to the archetype's name.
+
+        Returns:
+            list: The new characters, in spawn order.
+
+        Raises:
+            ValueError: If one of the IDs is already taken by a character in the game state.
+        """
+        start = archetype.spawned
+        id_format = f"{archetype.name if id_prefix is None else id_prefix}-{{}}".format
+        ids = list(map(id_format, range(start, start + count)))
+        if not self.characters.keys().isdisjoint(ids):
+            raise ValueError(f"Spawning {count} '{archetype.name}' characters would reuse IDs already in the game state.")
+
+        characters = archetype.spawn_many(count, ids)
+        self.characters.update(zip(ids, characters))
+        if self.stats_store is not None:
+            attach = self.stats_store.attach
+            for character in characters:
+                attach(character.stats)
+        return characters
 
     def update_quests(self, quest):
         """
@@ -40,3 +94,17 @@ class GameState:
         """
         assert hasattr(quest, 'id'), "Quest must have an 'id' attribute."
         self.quests[quest.id] = quest
+
+    def __setstate__(self, state):
+        """
+        Restore a pickled game state. Character stats are saved as plain values, so they are attached
+        to the stats store again if it was enabled.
+
+        Args:
+            state (dict): The pickled attributes.
+        """
+        self.__dict__.update(state)
+        self.__dict__.setdefault("stats_store", None)
+        if self.stats_store is not None:
+            for character in self.characters.values():
+                self.stats_store.attach(character.stats)
@@ -1,6 +1,5 @@
 from .item import Item
 from ..effect.effect import Effect
-from ..utils.logger import Logger
 
 class Consumable(Item):
     """
@@ -20,11 +19,8 @@ class Consumable(Item):
         """
         super().__init__(name, description, value, effects)
 
-        # Initialize the logger
-        self.logger = Logger(f"Consumable-{self.name}")
-
         # Log the initialization
-        self.logger.info(f"Consumable '{self.name}' initialized with {len(self.effects)} effects")
+        self.logger.info("Consumable '%s' initialized with %d effects", self.name, len(self.effects))
 
         # Indicator to track if the consumable has been used
         self.is_used = False
@@ -37,18 +33,18 @@ class Consumable(Item):
             target (Character): The character using the consumable.
         """
         if self.is_used:
-            self.logger.warning(f"{self.name} has already been used and cannot be used again.")
+            self.logger.warning("%s has already been used and cannot be used again.", self.name)
             return
         
-        self.logger.info(f"{target.name} uses {self.name}.")
+        self.logger.info("%s uses %s.", target.name, self.name)
 
         # Apply each effect to the target
         for effect in self.effects:
-            self.logger.info(f"Applying effect: {effect}")
+            self.logger.info("Applying effect: %s", effect)
             effect.apply(target)
 
         # Mark the consumable as used
         self.is_used = True
 
-        self.logger.info(f"{self.name} has been used.")
-        self.logger.info(f"{target.name}'s stats after using {self.name}: {target.stats}")
+        self.logger.info("%s has been used.", self.name)
+        self.logger.info("%s's stats after using %s: %s", target.name, self.name, target.stats)
@@ -1,12 +1,20 @@
 from .item import Item
-from ..utils.logger import Logger
+from ..telemetry.journal import Journal, JournalEvent
 
 class Equipment(Item):
     """
     Represents an equippable item, such as a weapon or armor, which can apply effects when equipped.
     The effects are unapplied when the item is unequipped.
+
+    Each effect's amount (see Effect.amount_for) is calculated once, when the item is equipped, and added
+    to the target's stats as a modifier layer keyed by this item. Unequipping removes the layers, so formulas
+    are not run again and the stats return exactly to what they would have been without the item. Effects
+    that set `as_modifier` to False are applied and unapplied with their own apply() and unapply() instead.
     """
 
+    # The character the item is equipped by, or None; the class default covers equipment saved without one
+    wearer = None
+
     def __init__(self, name: str, description: str, value: int, effects: list):
         """
         Initialize an equippable item with a name, description, value, and a list of effects.
@@ -19,10 +27,10 @@ class Equipment(Item):
         """
         super().__init__(name, description, value, effects)
         self.equipped = False
+        self.wearer = None
+        self._amounts = {}  # The amounts added as modifier layers while equipped, by attribute
 
-        # Initialize logger for this equipment
-        self.logger = Logger(f"Equipment-{self.name}")
-        self.logger.info(f"Equipment '{self.name}' initialized with {len(self.effects)} effects")
+        self.logger.info("Equipment '%s' initialized with %d effects", self.name, len(self.effects))
 
     def use(self, target):
         """
@@ -45,20 +53,51 @@ class Equipment(Item):
             target (Character): The character equipping the item.
         """
         if not self.equipped:
-            self.logger.info(f"{target.name} equips {self.name}!")
+            self.logger.info("%s equips %s!", target.name, self.name)
+            journal = Journal.current
+            amounts = {}
             for effect in self.effects:
-                effect.apply(target)
+                if not effect.as_modifier:
+                    effect.apply(target=target, caster=target)
+                    continue
+                if not effect.attribute:
+                    self.logger.warning("No attribute specified in effect: %s", effect)
+                    continue
+                # The wearer is the caster and recipient of spell effects on equipment
+                amount = effect.amount_for(target, caster=target, recipient=target)
+                amounts[effect.attribute] = amounts.get(effect.attribute, 0) + amount
+                if journal is not None:
+                    journal.record(JournalEvent.EFFECT_APPLIED, self, target, effect.attribute, amount)
+            # One layer per attribute, since a source has a single layer on each attribute
+            for attribute, amount in amounts.items():
+                target.stats.add_modifier(self, attribute, add=amount)
+            self._amounts = amounts
+            self.wearer = target
             self.equipped = True
 
     def unequip(self, target):
         """
-        Unequip the item and remove its effects from the target character.
+        Unequip the item and remove its effects from the target character. Only the wearer can unequip
+        the item; other characters are refused with a warning and the item stays equipped. Equipment saved
+        before its wearer was kept has none, and is unequipped from the given target.
 
         Args:
             target (Character): The character unequipping the item.
         """
         if self.equipped:
-            self.logger.info(f"{target.name} unequips {self.name}!")
+            if self.wearer is not None and target is not self.wearer:
+                self.logger.warning("%s cannot unequip %s, which is equipped by %s.", target.name, self.name, self.wearer.name)
+                return
+            self.logger.info("%s unequips %s!", target.name, self.name)
+            target.stats.remove_modifier(self)
+            journal = Journal.current
+            if journal is not None:
+                # Equipment saved before the amounts were kept has none to report
+                for attribute, amount in getattr(self, "_amounts", {}).items():
+                    journal.record(JournalEvent.EFFECT_APPLIED, self, target, attribute, -amount)
             for effect in self.effects:
-                effect.unapply(target)
+                if not effect.as_modifier:
+                    effect.unapply(target=target, caster=target)
+            self._amounts = {}
+            self.wearer = None
             self.equipped = False
@@ -10,7 +10,7 @@ class Inventory:
         Initialize the inventory as an empty list of items.
         """
         self.items = []
-        self.logger = Logger("Inventory")
+        self.logger = Logger("rpg_world.item")
         self.logger.info("Inventory initialized.")
 
     def add_item(self, item):
@@ -21,7 +21,7 @@ class Inventory:
             item (Item): The item to be added to the inventory.
         """
         self.items.append(item)
-        self.logger.info(f"Added {item.name} to the inventory.")
+        self.logger.info("Added %s to the inventory.", item.name)
 
     def remove_item(self, item):
         """
@@ -32,9 +32,9 @@ class Inventory:
         """
         if item in self.items:
             self.items.remove(item)
-            self.logger.info(f"Removed {item.name} from the inventory.")
+            self.logger.info("Removed %s from the inventory.", item.name)
         else:
-            self.logger.warning(f"Item {item.name} not found in inventory.")
+            self.logger.warning("Item %s not found in inventory.", item.name)
 
     def list_items(self):
         """
@@ -45,4 +45,4 @@ class Inventory:
         else:
             self.logger.info("Listing inventory items:")
             for item in self.items:
-                self.logger.info(f"- {item}")
+                self.logger.info("- %s", item)
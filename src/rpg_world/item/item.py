@@ -21,9 +21,9 @@ class Item(ABC):
         self.value = value
         self.effects = effects
 
-        # Initialize logger for this item
-        self.logger = Logger(f"Item-{self.name}")
-        self.logger.info(f"Item '{self.name}' initialized with description: '{self.description}', value: {self.value}, and {len(self.effects)} effects")
+        # Initialize logger for this item, identified by its class and name
+        self.logger = Logger("rpg_world.item", context={"entity": self.__class__.__name__, "name": self.name})
+        self.logger.info("Item '%s' initialized with description: '%s', value: %s, and %d effects", self.name, self.description, self.value, len(self.effects))
 
     def use(self, target, **kwargs):
         """
@@ -33,7 +33,7 @@ class Item(ABC):
             target (Character): The character that will use the item.
             **kwargs: Additional context for the effects to use in their calculations.
         """
-        self.logger.info(f"{target.name} uses {self.name}!")
+        self.logger.info("%s uses %s!", target.name, self.name)
         
         # Apply each effect
         for effect in self.effects:
@@ -17,6 +17,6 @@ class Place(ABC):
         self.id = id
         self.name = name
 
-        # Initialize logger for this place
-        self.logger = Logger(f"{self.__class__.__name__}-{self.name}")
+        # Initialize logger for this place, identified by its class and name
+        self.logger = Logger("rpg_world.place", context={"entity": self.__class__.__name__, "name": self.name})
         self.logger.info(f"{self.__class__.__name__} '{self.name}' initialized")
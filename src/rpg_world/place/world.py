@@ -1,4 +1,5 @@
 from .place import Place
+from ..telemetry.journal import Journal, JournalEvent
 
 class World(Place):
     """
@@ -56,7 +57,11 @@ class World(Place):
             return
         
         self.current_location = self.locations[location_name]
-        self.logger.info(f"Moved to: {self.current_location.name}")
+        self.logger.info("Moved to: %s", self.current_location.name)
+
+        journal = Journal.current
+        if journal is not None:
+            journal.record(JournalEvent.LOCATION_CHANGED, self, self.current_location)
         
         # Update position in the new location
         if new_position:
@@ -20,7 +20,7 @@ class Quest(EventManager):
         """
         super().__init__(id, name, description)  # Initialize EventManager with id, name, and description
         self.rewards = rewards or {}
-        self.logger = Logger(f"Quest-{self.name}")
+        self.logger = Logger("rpg_world.quest", context={"entity": "Quest", "name": self.name})
 
         # If objectives are provided, add them as events to EventManager
         if objectives:
@@ -13,7 +13,7 @@ class QuestManager(EventManager):
         Inherits functionality from EventManager to handle quests as events.
         """
         super().__init__()  # Inherit from EventManager
-        self.logger = Logger("QuestManager")
+        self.logger = Logger("rpg_world.quest")
 
     def add_quest(self, quest):
         """
@@ -18,7 +18,7 @@ class QuestObjective(Event):
         """
         triggers = triggers if triggers else []  # Initialize with an empty list if no triggers are provided
         super().__init__(name=name, description=description, triggers=triggers)
-        self.logger = Logger(f"QuestObjective-{self.name}")
+        self.logger = Logger("rpg_world.quest", context={"entity": "QuestObjective", "name": self.name})
 
     def execute_action(self, game_state):
         """
@@ -18,7 +18,7 @@ class LoadManager:
         self.save_directory = save_directory
         self.file_name = file_name
         self.save_path = os.path.join(save_directory, file_name)
-        self.logger = Logger("LoadManager")
+        self.logger = Logger("rpg_world.save_load")
 
     def load_game(self):
         """
@@ -18,7 +18,7 @@ class SaveManager:
         self.save_directory = save_directory
         self.file_name = file_name
         self.save_path = os.path.join(save_directory, file_name)
-        self.logger = Logger("SaveManager")
+        self.logger = Logger("rpg_world.save_load")
 
         # Create the save directory if it doesn't exist
         if not os.path.exists(self.save_directory):
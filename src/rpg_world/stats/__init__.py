@@ -1,7 +1,40 @@
-# rpg_world/character/__init__.py
+# rpg_world/stats/__init__.py
 
-from .stats import Stats
-from .character_stats import CharacterStats
+# StatsStore pulls in NumPy, so names are imported on first access only.
+# This keeps characters, which import stats.character_stats, from paying for the store.
+_EXPORTS = {
+    "Stats": ".stats",
+    "CharacterStats": ".character_stats",
+    "StatsStore": ".stats_store",
+    "StatsSnapshot": ".stats_snapshot",
+    "StatSchema": ".stat_schema",
+    "StatWatcher": ".stat_watchers",
+}
 
-# By including this, users can import characters like this:
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """
+    Import and return a public name on first access, then cache it in the package namespace.
+
+    Args:
+        name (str): The name being accessed.
+
+    Returns:
+        Any: The class or object exported under that name.
+
+    Raises:
+        AttributeError: If the name is not part of the public API.
+    """
+    from importlib import import_module
+
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+# By including this, users can import stats like this:
 # from rpg_world.stats import Stats
@@ -1,11 +1,22 @@
-from .stats import Stats
+from collections.abc import MutableMapping
+from .stats import Stats, next_version
+from .stat_schema import StatSchema, stat_ids, stat_names
 
 class CharacterStats(Stats):
     """
     Manages character statistics such as health, mana, focus, and armor.
     Ensures stats like health, mana, and focus are handled safely with max values.
+
+    The core stats every character has are stored in fixed slots, so reading or changing them needs
+    no dictionary lookups. Any additional attributes are kept in an overflow dictionary, and
+    `attributes` presents both as a single mapping.
     """
 
+    CORE_FIELDS = ("health", "max_health", "mana", "max_mana", "focus", "max_focus", "armor")
+
+    # _store and _row are only set while the stats are attached to a StatsStore
+    __slots__ = CORE_FIELDS + ("_extra", "_store", "_row")
+
     def __init__(self, health=100, mana=100, focus=100, armor=0, **kwargs):
         """
         Initialize the character's statistics with default or provided values.
@@ -15,14 +26,181 @@ class CharacterStats(Stats):
             mana (float): The current mana of the character.
             focus (float): The current focus of the character.
             armor (float): The armor value, reducing incoming damage.
-            **kwargs: Additional attributes as key-value pairs.
+            **kwargs: Additional attributes as key-value pairs. The maximums max_health, max_mana and
+                      max_focus can be given here too; they default to the current values.
+        """
+        _object_setattr(self, "health", health)
+        _object_setattr(self, "max_health", health)
+        _object_setattr(self, "mana", mana)
+        _object_setattr(self, "max_mana", mana)
+        _object_setattr(self, "focus", focus)
+        _object_setattr(self, "max_focus", focus)
+        _object_setattr(self, "armor", armor)
+        if kwargs and not _CORE_FIELDS.isdisjoint(kwargs):
+            # Core stats given by keyword (e.g. max_health=200) go to their slots, not the overflow dictionary
+            for attr_name in _CORE_FIELDS.intersection(kwargs):
+                _object_setattr(self, attr_name, kwargs.pop(attr_name))
+        # The overflow dictionary is only allocated for characters that have additional attributes
+        _object_setattr(self, "_extra", kwargs or None)
+        for attr_name in kwargs:
+            if attr_name not in stat_ids:
+                StatSchema.id(attr_name)
+        _object_setattr(self, "_versions", None)
+        _object_setattr(self, "_drained", None)
+        _object_setattr(self, "_modifiers", None)
+        _object_setattr(self, "_watchers", None)
+
+    def get(self, attr_name):
+        """
+        Retrieve the value of a specific attribute.
+
+        Args:
+            attr_name (str): The name of the attribute to retrieve.
+
+        Returns:
+            The value of the attribute or None if it doesn't exist.
+        """
+        if attr_name in _CORE_FIELDS:
+            return getattr(self, attr_name)
+        extra = self._extra
+        return None if extra is None else extra.get(attr_name)
+
+    def set(self, attr_name, value):
+        """
+        Set the value of a specific attribute.
+
+        Args:
+            attr_name (str): The name of the attribute to set.
+            value: The value to assign to the attribute.
+        """
+        if attr_name in _CORE_FIELDS:
+            _object_setattr(self, attr_name, value)
+        else:
+            if attr_name not in stat_ids:
+                StatSchema.id(attr_name)
+            if self._extra is None:
+                _object_setattr(self, "_extra", {attr_name: value})
+            else:
+                self._extra[attr_name] = value
+        versions = self._versions
+        if versions is None:
+            _object_setattr(self, "_versions", {attr_name: next_version()})
+        else:
+            versions[attr_name] = next_version()
+        if self._watchers is not None:
+            self._notify_watchers(attr_name, value)
+
+    def modify(self, attr_name, amount):
+        """
+        Modify the value of an attribute by a specified amount.
+
+        Args:
+            attr_name (str): The name of the attribute to modify.
+            amount (float): The amount to add (or subtract) from the attribute.
+        """
+        if attr_name in _CORE_FIELDS:
+            value = (getattr(self, attr_name) or 0) + amount
+            _object_setattr(self, attr_name, value)
+            versions = self._versions
+            if versions is None:
+                _object_setattr(self, "_versions", {attr_name: next_version()})
+            else:
+                versions[attr_name] = next_version()
+            if self._watchers is not None:
+                self._notify_watchers(attr_name, value)
+        else:
+            self.set(attr_name, (self.get(attr_name) or 0) + amount)
+
+    def get_id(self, stat_id: int):
+        """
+        Retrieve the value of an attribute by its StatSchema id.
+
+        Args:
+            stat_id (int): The id of the attribute, from StatSchema.id().
+
+        Returns:
+            The value of the attribute or None if it doesn't exist.
+        """
+        attr_name = stat_names[stat_id]
+        if stat_id in _CORE_IDS:
+            return getattr(self, attr_name)
+        extra = self._extra
+        return None if extra is None else extra.get(attr_name)
+
+    def modify_id(self, stat_id: int, amount):
+        """
+        Modify the value of an attribute, addressed by its StatSchema id, by a specified amount.
+
+        Args:
+            stat_id (int): The id of the attribute, from StatSchema.id().
+            amount (float): The amount to add (or subtract) from the attribute.
+        """
+        attr_name = stat_names[stat_id]
+        if stat_id in _CORE_IDS:
+            value = (getattr(self, attr_name) or 0) + amount
+            _object_setattr(self, attr_name, value)
+            versions = self._versions
+            if versions is None:
+                _object_setattr(self, "_versions", {attr_name: next_version()})
+            else:
+                versions[attr_name] = next_version()
+            if self._watchers is not None:
+                self._notify_watchers(attr_name, value)
+        else:
+            self.set(attr_name, (self.get(attr_name) or 0) + amount)
+
+    def modify_many(self, deltas, clamp: bool = True) -> dict:
+        """
+        Modify several attributes at once. Changes to the same attribute are summed and applied in one step.
+
+        Args:
+            deltas (dict or iterable): A mapping of attribute names to amounts, or an iterable of (attribute, amount) pairs.
+            clamp (bool): Whether to keep each attribute within [0, max_<attribute>], as Formula.apply_limits does. Defaults to True.
+
+        Returns:
+            dict: The change actually applied to each attribute.
+        """
+        if not isinstance(deltas, dict):
+            return super().modify_many(deltas, clamp)
+
+        applied = {}
+        for attr_name, amount in deltas.items():
+            if attr_name not in _CORE_FIELDS:
+                applied.update(super().modify_many({attr_name: amount}, clamp))
+                continue
+            current_value = getattr(self, attr_name)
+            if clamp:
+                max_name = _MAX_FIELDS.get(attr_name)
+                if max_name is not None and current_value + amount > getattr(self, max_name):
+                    amount = getattr(self, max_name) - current_value
+                if current_value + amount < 0:
+                    amount = -current_value
+            _object_setattr(self, attr_name, current_value + amount)
+            self._bump(attr_name)
+            applied[attr_name] = amount
+        return applied
+
+    @property
+    def attributes(self):
+        """
+        A live mapping of every attribute, core stats first, then additional attributes.
+
+        Returns:
+            MutableMapping: A view that reads and writes this object's attributes.
+        """
+        return _AttributesView(self)
+
+    @attributes.setter
+    def attributes(self, values):
+        """
+        Replace every attribute with the given values. Core stats missing from `values` keep their current value.
+
+        Args:
+            values (dict): Key-value pairs for the attributes.
         """
-        super().__init__(
-            health=health, max_health=health,
-            mana=mana, max_mana=mana,
-            focus=focus, max_focus=focus,
-            armor=armor, **kwargs
-        )
+        _object_setattr(self, "_extra", None)
+        for attr_name, value in values.items():
+            self.set(attr_name, value)
 
     def is_alive(self):
         """
@@ -32,3 +210,120 @@ class CharacterStats(Stats):
             bool: True if health is greater than zero, False otherwise.
         """
         return self.health > 0
+
+    def __contains__(self, attr_name):
+        """
+        Check whether an attribute exists. Core stats always exist.
+
+        Args:
+            attr_name (str): The name of the attribute.
+
+        Returns:
+            bool: True if the attribute exists, False otherwise.
+        """
+        if attr_name in _CORE_FIELDS:
+            return True
+        extra = self._extra
+        return extra is not None and attr_name in extra
+
+    def __getattr__(self, attr_name):
+        """
+        Return an additional attribute from the overflow dictionary. Core stats never get here.
+
+        Args:
+            attr_name (str): The name of the attribute to retrieve.
+
+        Returns:
+            The value of the attribute if it exists in the overflow dictionary.
+        """
+        # Slots are only missing while the object is being copied or unpickled
+        if attr_name not in _SLOT_NAMES:
+            extra = self._extra
+            if extra is not None and attr_name in extra:
+                return extra[attr_name]
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{attr_name}'")
+
+    def __setattr__(self, attr_name, value):
+        """
+        Set a core stat in its slot and any other attribute in the overflow dictionary.
+
+        Args:
+            attr_name (str): The name of the attribute to set.
+            value: The value to assign to the attribute.
+        """
+        if attr_name == "attributes":
+            _object_setattr(self, attr_name, value)
+        else:
+            self.set(attr_name, value)
+
+    def __getstate__(self):
+        """
+        Pickle every attribute as a single dictionary, since the slots are not stored in a __dict__,
+        along with the modifier layers if there are any. Watchers are not kept.
+        """
+        if self._modifiers:
+            return dict(self.attributes), self._modifiers
+        return dict(self.attributes)
+
+    def __setstate__(self, state):
+        values, modifiers = state if isinstance(state, tuple) else (state, None)
+        # Pickles from before the core stats had slots hold the __dict__, {'attributes': {...}}
+        if len(values) == 1 and isinstance(values.get("attributes"), dict):
+            values = values["attributes"]
+        _object_setattr(self, "_extra", None)
+        _object_setattr(self, "_versions", None)
+        _object_setattr(self, "_watchers", None)
+        for attr_name, value in values.items():
+            self.set(attr_name, value)
+        _object_setattr(self, "_modifiers", modifiers)
+        # A restored object starts with a clean version history
+        _object_setattr(self, "_versions", None)
+        _object_setattr(self, "_drained", None)
+
+
+_CORE_FIELDS = frozenset(CharacterStats.CORE_FIELDS)
+_CORE_IDS = frozenset(StatSchema.id(field) for field in CharacterStats.CORE_FIELDS)
+_SLOT_NAMES = frozenset(CharacterStats.__slots__ + Stats.__slots__)
+_MAX_FIELDS = {"health": "max_health", "mana": "max_mana", "focus": "max_focus"}
+
+# Writes the slots directly, bypassing the __setattr__ overrides
+_object_setattr = object.__setattr__
+
+
+class _AttributesView(MutableMapping):
+    """
+    Dictionary-like view over the attributes of a CharacterStats object.
+    """
+
+    __slots__ = ("_stats",)
+
+    def __init__(self, stats):
+        self._stats = stats
+
+    def __getitem__(self, attr_name):
+        if attr_name not in self._stats:
+            raise KeyError(attr_name)
+        return self._stats.get(attr_name)
+
+    def __setitem__(self, attr_name, value):
+        self._stats.set(attr_name, value)
+
+    def __delitem__(self, attr_name):
+        extra = self._stats._extra
+        if extra is None or attr_name not in extra:
+            if attr_name in CharacterStats.CORE_FIELDS:
+                raise KeyError(f"Core stat '{attr_name}' cannot be removed.")
+            raise KeyError(attr_name)
+        del extra[attr_name]
+
+    def __iter__(self):
+        yield from CharacterStats.CORE_FIELDS
+        if self._stats._extra is not None:
+            yield from self._stats._extra
+
+    def __len__(self):
+        extra = self._stats._extra
+        return len(CharacterStats.CORE_FIELDS) + (0 if extra is None else len(extra))
+
+    def __repr__(self):
+        return repr(dict(self))
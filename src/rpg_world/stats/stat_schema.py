@@ -0,0 +1,83 @@
+class StatSchema:
+    """
+    Process-wide registry that maps stat names to small integer ids. Ids are handed out on first use,
+    in order, and never change afterwards, so hot loops can resolve a name once and then address the
+    stat by id with Stats.get_id/set_id/modify_id. Registering a stat also registers its maximum
+    (health -> max_health), so the pairing used for limits is looked up instead of formatted per call.
+
+    Ids are only valid within the running process; save files and journals keep using names.
+    Stats register the names of the attributes they are given, so the schema also lists every stat in use.
+    """
+
+    _ids = {}
+    _names = []
+    _max_ids = []
+
+    @classmethod
+    def id(cls, name: str) -> int:
+        """
+        Return the id of a stat, registering it (and its maximum) if it is new.
+
+        Args:
+            name (str): The name of the stat, e.g. 'health'.
+
+        Returns:
+            int: The stat's id.
+        """
+        stat_id = cls._ids.get(name)
+        if stat_id is None:
+            stat_id = cls._ids[name] = len(cls._names)
+            cls._names.append(name)
+            cls._max_ids.append(None)
+            # A maximum has no maximum of its own
+            if not name.startswith("max_"):
+                cls._max_ids[stat_id] = cls.id(f"max_{name}")
+        return stat_id
+
+    @classmethod
+    def name(cls, stat_id: int) -> str:
+        """
+        Return the name of a registered stat.
+
+        Args:
+            stat_id (int): The stat's id.
+
+        Returns:
+            str: The stat's name.
+
+        Raises:
+            IndexError: If no stat has this id.
+        """
+        return cls._names[stat_id]
+
+    @classmethod
+    def max_id(cls, stat_id: int):
+        """
+        Return the id of the stat holding a stat's maximum value.
+
+        Args:
+            stat_id (int): The stat's id.
+
+        Returns:
+            int or None: The id of 'max_<name>', or None if the stat is itself a maximum.
+
+        Raises:
+            IndexError: If no stat has this id.
+        """
+        return cls._max_ids[stat_id]
+
+    @classmethod
+    def names(cls) -> tuple:
+        """
+        Return every registered stat name, indexed by id.
+
+        Returns:
+            tuple: The names in id order.
+        """
+        return tuple(cls._names)
+
+
+# Shared with Stats and Formula, which index them directly in hot paths
+stat_ids = StatSchema._ids
+stat_names = StatSchema._names
+max_ids = StatSchema._max_ids
@@ -0,0 +1,141 @@
+from bisect import bisect_left, bisect_right
+
+BELOW = "below"
+ABOVE = "above"
+CROSSING = "crossing"
+DIRECTIONS = (BELOW, ABOVE, CROSSING)
+
+
+class StatWatcher:
+    """
+    A threshold watcher registered on one attribute of a Stats object with Stats.watch(). Its callback
+    is called as callback(stats, attr_name, old_value, new_value) when a write crosses the threshold:
+
+    - 'below': the value drops from at least the threshold to under it.
+    - 'above': the value rises from at most the threshold to over it.
+    - 'crossing': the value moves across the threshold, or onto or off it, in either direction.
+    """
+
+    __slots__ = ("attr_name", "threshold", "callback", "direction")
+
+    def __init__(self, attr_name, threshold, callback, direction=BELOW):
+        """
+        Initialize the watcher.
+
+        Args:
+            attr_name (str): The name of the watched attribute.
+            threshold (float): The value to watch for.
+            callback (callable): Called as callback(stats, attr_name, old_value, new_value).
+            direction (str): 'below', 'above' or 'crossing'. Defaults to 'below'.
+
+        Raises:
+            ValueError: If the direction is not one of the above.
+        """
+        if direction not in DIRECTIONS:
+            raise ValueError(f"Unknown watcher direction '{direction}'. Expected one of {DIRECTIONS}.")
+        self.attr_name = attr_name
+        self.threshold = threshold
+        self.callback = callback
+        self.direction = direction
+
+    def matches(self, old_value, new_value) -> bool:
+        """
+        Check whether a change from old_value to new_value crosses the threshold in the watched direction.
+
+        Args:
+            old_value (float): The value before the write.
+            new_value (float): The value after the write.
+
+        Returns:
+            bool: True if the callback should be called.
+        """
+        threshold = self.threshold
+        if self.direction == BELOW:
+            return old_value >= threshold > new_value
+        if self.direction == ABOVE:
+            return old_value <= threshold < new_value
+        return (old_value < threshold) != (new_value < threshold) or (old_value > threshold) != (new_value > threshold)
+
+    def __repr__(self):
+        return f"StatWatcher({self.attr_name!r}, {self.threshold!r}, direction={self.direction!r})"
+
+
+class AttributeWatchers:
+    """
+    The watchers of one attribute, kept sorted by threshold. A write only looks at the thresholds
+    between the previous and the new value, found by bisection, so its cost does not depend on how
+    many watchers are far from the value.
+    """
+
+    __slots__ = ("thresholds", "watchers", "value")
+
+    def __init__(self, value):
+        """
+        Initialize an empty list of watchers.
+
+        Args:
+            value (float): The attribute's current value, which the first write is compared against.
+        """
+        self.thresholds = []
+        self.watchers = []
+        self.value = value or 0
+
+    def __len__(self):
+        return len(self.watchers)
+
+    def add(self, watcher: StatWatcher):
+        """
+        Add a watcher, keeping the lists sorted by threshold.
+
+        Args:
+            watcher (StatWatcher): The watcher to add.
+        """
+        index = bisect_right(self.thresholds, watcher.threshold)
+        self.thresholds.insert(index, watcher.threshold)
+        self.watchers.insert(index, watcher)
+
+    def remove(self, watcher: StatWatcher) -> bool:
+        """
+        Remove a watcher.
+
+        Args:
+            watcher (StatWatcher): The watcher to remove.
+
+        Returns:
+            bool: True if the watcher was found and removed, False otherwise.
+        """
+        start = bisect_left(self.thresholds, watcher.threshold)
+        end = bisect_right(self.thresholds, watcher.threshold)
+        for index in range(start, end):
+            if self.watchers[index] is watcher:
+                del self.thresholds[index]
+                del self.watchers[index]
+                return True
+        return False
+
+    def notify(self, stats, attr_name, new_value):
+        """
+        Compare the attribute's new value with the previous one and call the watchers whose threshold was crossed.
+
+        Args:
+            stats (Stats): The stats that were written.
+            attr_name (str): The name of the written attribute.
+            new_value (float): The attribute's new value.
+        """
+        new_value = new_value or 0
+        old_value = self.value
+        if new_value == old_value:
+            return
+        # Updated first, so callbacks that write the attribute again are compared against this value
+        self.value = new_value
+
+        low, high = (new_value, old_value) if new_value < old_value else (old_value, new_value)
+        thresholds = self.thresholds
+        start = bisect_left(thresholds, low)
+        if start == len(thresholds) or thresholds[start] > high:
+            return
+        end = bisect_right(thresholds, high, start)
+        # Copied, since callbacks may add or remove watchers
+        for watcher in self.watchers[start:end]:
+            if watcher.matches(old_value, new_value):
+                watcher.callback(stats, attr_name, old_value, new_value)
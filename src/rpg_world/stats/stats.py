@@ -1,9 +1,33 @@
+import itertools
+import math
+from .stat_schema import StatSchema, max_ids, stat_ids, stat_names
+
+# Source of attribute versions, shared by every Stats object
+next_version = itertools.count(1).__next__
+
+
 class Stats:
     """
     Base class for managing general statistics. Provides methods to modify, retrieve, and manage attributes.
     Attributes are stored in a dictionary and can be dynamically accessed.
+
+    Every write through set/modify/modify_many (or attribute assignment) gives the attribute a new version,
+    taken from a process-wide counter, so other systems can tell whether an input changed without comparing
+    values. Attributes changed since the last drain_dirty() call are reported as dirty. Writes made directly
+    to the `attributes` dictionary are not tracked.
+
+    Attributes can also carry modifier layers keyed by their source (an equipment piece, a buff). The
+    stored value of such an attribute is its effective value, (base + sum of additive layers) * product
+    of multiplicative layers, so reads cost nothing extra; it is only recomputed when a layer is added
+    or removed. Writes change the effective value and the base follows.
+
+    Threshold watchers (see watch()) are notified by the same writes, and only when a write moves an
+    attribute across one of their thresholds, so triggers need not poll the stats.
     """
 
+    # _versions, _drained, _modifiers and _watchers are only allocated once they are needed
+    __slots__ = ("attributes", "_versions", "_drained", "_modifiers", "_watchers")
+
     def __init__(self, **kwargs):
         """
         Initialize the statistics with any provided attributes.
@@ -12,6 +36,13 @@ class Stats:
             **kwargs: Key-value pairs for initializing the stats (e.g., health=100, mana=50).
         """
         self.attributes = kwargs
+        for attr_name in kwargs:
+            if attr_name not in stat_ids:
+                StatSchema.id(attr_name)
+        object.__setattr__(self, "_versions", None)
+        object.__setattr__(self, "_drained", None)
+        object.__setattr__(self, "_modifiers", None)
+        object.__setattr__(self, "_watchers", None)
 
     def get(self, attr_name):
         """
@@ -33,7 +64,16 @@ class Stats:
             attr_name (str): The name of the attribute to set.
             value: The value to assign to the attribute.
         """
+        if attr_name not in stat_ids:
+            StatSchema.id(attr_name)
         self.attributes[attr_name] = value
+        versions = self._versions
+        if versions is None:
+            object.__setattr__(self, "_versions", {attr_name: next_version()})
+        else:
+            versions[attr_name] = next_version()
+        if self._watchers is not None:
+            self._notify_watchers(attr_name, value)
 
     def modify(self, attr_name, amount):
         """
@@ -47,6 +87,365 @@ class Stats:
         new_value = current_value + amount
         self.set(attr_name, new_value)
 
+    def get_id(self, stat_id: int):
+        """
+        Retrieve the value of an attribute by its StatSchema id.
+
+        Args:
+            stat_id (int): The id of the attribute, from StatSchema.id().
+
+        Returns:
+            The value of the attribute or None if it doesn't exist.
+        """
+        return self.get(stat_names[stat_id])
+
+    def set_id(self, stat_id: int, value):
+        """
+        Set the value of an attribute by its StatSchema id.
+
+        Args:
+            stat_id (int): The id of the attribute, from StatSchema.id().
+            value: The value to assign to the attribute.
+        """
+        self.set(stat_names[stat_id], value)
+
+    def modify_id(self, stat_id: int, amount):
+        """
+        Modify the value of an attribute, addressed by its StatSchema id, by a specified amount.
+
+        Args:
+            stat_id (int): The id of the attribute, from StatSchema.id().
+            amount (float): The amount to add (or subtract) from the attribute.
+        """
+        self.modify(stat_names[stat_id], amount)
+
+    def _bump(self, attr_name):
+        """
+        Give an attribute a new version after it has been written.
+
+        Args:
+            attr_name (str): The name of the attribute that was written.
+        """
+        versions = self._versions
+        if versions is None:
+            object.__setattr__(self, "_versions", {attr_name: next_version()})
+        else:
+            versions[attr_name] = next_version()
+        if self._watchers is not None:
+            self._notify_watchers(attr_name, self.get(attr_name))
+
+    def version(self, attr_name) -> int:
+        """
+        Return the version of an attribute. It is 0 until the attribute is first written and increases
+        with every write. Versions come from one counter shared by all stats, so they can also be
+        compared across attributes and objects.
+
+        Args:
+            attr_name (str): The name of the attribute.
+
+        Returns:
+            int: The version of the attribute.
+        """
+        versions = self._versions
+        return 0 if versions is None else versions.get(attr_name, 0)
+
+    def _current_versions(self) -> dict:
+        """
+        Return a copy of the version of every attribute that has been written.
+
+        Returns:
+            dict: A mapping of attribute names to versions.
+        """
+        return dict(self._versions or ())
+
+    @property
+    def dirty(self) -> set:
+        """
+        The attributes written since the last call to drain_dirty(), without resetting them.
+
+        Returns:
+            set: The names of the changed attributes.
+        """
+        drained = self._drained or {}
+        return {name for name, version in self._current_versions().items() if drained.get(name, 0) != version}
+
+    def drain_dirty(self) -> set:
+        """
+        Return the attributes written since the last call, and mark them clean.
+
+        Returns:
+            set: The names of the changed attributes.
+        """
+        current = self._current_versions()
+        drained = self._drained or {}
+        object.__setattr__(self, "_drained", current)
+        return {name for name, version in current.items() if drained.get(name, 0) != version}
+
+    def watch(self, attr_name, threshold, callback, direction="below"):
+        """
+        Register a callback for when writes move an attribute across a threshold. Watchers of an attribute
+        are kept sorted by threshold, so a write only checks the thresholds it may have crossed.
+
+        Args:
+            attr_name (str): The name of the attribute to watch.
+            threshold (float): The value to watch for.
+            callback (callable): Called as callback(stats, attr_name, old_value, new_value).
+            direction (str): 'below' (drops under the threshold), 'above' (rises over it) or 'crossing'
+                             (moves across, onto or off it either way). Defaults to 'below'.
+
+        Returns:
+            StatWatcher: The watcher, to pass to unwatch().
+
+        Raises:
+            ValueError: If the direction is unknown.
+        """
+        from .stat_watchers import AttributeWatchers, StatWatcher
+
+        watcher = StatWatcher(attr_name, threshold, callback, direction)
+        watchers = self._watchers
+        if watchers is None:
+            watchers = {}
+            object.__setattr__(self, "_watchers", watchers)
+        attribute_watchers = watchers.get(attr_name)
+        if attribute_watchers is None:
+            attribute_watchers = watchers[attr_name] = AttributeWatchers(self.get(attr_name))
+        attribute_watchers.add(watcher)
+        return watcher
+
+    def unwatch(self, watcher):
+        """
+        Remove a watcher registered with watch(). Removing a watcher twice does nothing.
+
+        Args:
+            watcher (StatWatcher): The watcher returned by watch().
+        """
+        watchers = self._watchers
+        attribute_watchers = None if watchers is None else watchers.get(watcher.attr_name)
+        if attribute_watchers is None or not attribute_watchers.remove(watcher):
+            return
+        if not attribute_watchers:
+            del watchers[watcher.attr_name]
+            if not watchers:
+                object.__setattr__(self, "_watchers", None)
+
+    def _notify_watchers(self, attr_name, value):
+        """
+        Let the watchers of an attribute compare its new value with the previous one.
+
+        Args:
+            attr_name (str): The name of the attribute that was written.
+            value: The attribute's new value.
+        """
+        attribute_watchers = self._watchers.get(attr_name)
+        if attribute_watchers is not None:
+            attribute_watchers.notify(self, attr_name, value)
+
+    def add_modifier(self, source, attr_name, add=0, mult=1):
+        """
+        Add a modifier layer to an attribute, replacing any layer the same source already put on it.
+        Only that attribute's effective value changes; with additive layers alone this is a single add.
+
+        Args:
+            source (object): What the modifier comes from, e.g. an Equipment. Used to remove it later.
+            attr_name (str): The name of the attribute to modify.
+            add (float): The amount added to the base value. Defaults to 0.
+            mult (float): The factor the value is multiplied by after the additions. Defaults to 1.
+
+        Raises:
+            ValueError: If mult is 0, which would make the base value unrecoverable.
+        """
+        if mult == 0:
+            raise ValueError("A multiplicative modifier cannot be 0.")
+        modifiers = self._modifiers
+        if modifiers is None:
+            modifiers = {}
+            object.__setattr__(self, "_modifiers", modifiers)
+        layers = modifiers.get(attr_name)
+        if layers is None:
+            # Additive layers, multiplicative layers, and the effective and base values after the last recompute
+            layers = modifiers[attr_name] = [{}, {}, None, None]
+
+        if mult == 1 and not layers[1]:
+            # Only additive layers: shift the effective value by the change in this source's layer
+            previous = layers[0].pop(source, 0)
+            if add:
+                layers[0][source] = add
+            elif not layers[0]:
+                del modifiers[attr_name]
+            self.modify(attr_name, add - previous)
+            return
+
+        base = self.base(attr_name)
+        if add:
+            layers[0][source] = add
+        else:
+            layers[0].pop(source, None)
+        if mult != 1:
+            layers[1][source] = mult
+        else:
+            layers[1].pop(source, None)
+        self._apply_layers(attr_name, layers, base)
+
+    def remove_modifier(self, source, attr_name=None):
+        """
+        Remove the modifier layers a source put on an attribute, or on every attribute.
+
+        Args:
+            source (object): The source the layers were added with.
+            attr_name (str, optional): The attribute to remove the layers from. Defaults to None (every attribute).
+        """
+        modifiers = self._modifiers
+        if not modifiers:
+            return
+        for name in (list(modifiers) if attr_name is None else [attr_name]):
+            layers = modifiers.get(name)
+            if layers is not None and (source in layers[0] or source in layers[1]):
+                self.add_modifier(source, name)
+
+    def base(self, attr_name):
+        """
+        Return the value of an attribute without its modifier layers.
+
+        Args:
+            attr_name (str): The name of the attribute.
+
+        Returns:
+            The base value, or the attribute's value if it has no modifiers.
+        """
+        value = self.get(attr_name)
+        layers = self._modifiers.get(attr_name) if self._modifiers else None
+        if layers is None:
+            return value
+        if layers[1] and value == layers[2]:
+            return layers[3]  # Unchanged since the last recompute, so the stored base is exact
+        value = value or 0
+        if layers[1]:
+            value /= math.prod(layers[1].values())
+        return value - sum(layers[0].values())
+
+    def _apply_layers(self, attr_name, layers, base):
+        """
+        Recompute and store the effective value of an attribute after a multiplicative layer changed.
+
+        Args:
+            attr_name (str): The name of the attribute.
+            layers (list): The attribute's layers, as stored in _modifiers.
+            base (float): The attribute's base value.
+        """
+        value = (base or 0) + sum(layers[0].values())
+        if layers[1]:
+            value *= math.prod(layers[1].values())
+            layers[2], layers[3] = value, base
+        elif not layers[0]:
+            del self._modifiers[attr_name]
+        self.set(attr_name, value)
+
+    @staticmethod
+    def limit_delta(current_value, amount, max_value=None, min_value=0):
+        """
+        Limit a change so the resulting value stays within [min_value, max_value]. The maximum is applied
+        first, then the minimum, so a value that is already above its maximum is pulled back down to it.
+
+        Args:
+            current_value (float): The current value of the attribute.
+            amount (float): The requested change.
+            max_value (float, optional): The maximum value, or None for no maximum. Defaults to None.
+            min_value (float): The minimum value. Defaults to 0.
+
+        Returns:
+            float: The change that can actually be applied.
+        """
+        if max_value is not None and current_value + amount > max_value:
+            amount = max_value - current_value
+        if current_value + amount < min_value:
+            amount = min_value - current_value
+        return amount
+
+    def modify_many(self, deltas, clamp: bool = True) -> dict:
+        """
+        Modify several attributes at once. Changes to the same attribute are summed and applied in one step.
+
+        Args:
+            deltas (dict or iterable): A mapping of attribute names to amounts, or an iterable of (attribute, amount) pairs.
+            clamp (bool): Whether to keep each attribute within [0, max_<attribute>], as Formula.apply_limits does. Defaults to True.
+
+        Returns:
+            dict: The change actually applied to each attribute.
+        """
+        if isinstance(deltas, dict):
+            totals = deltas
+        else:
+            totals = {}
+            for attr_name, amount in deltas:
+                totals[attr_name] = totals.get(attr_name, 0) + amount
+
+        applied = {}
+        get = self.get
+        limit_delta = self.limit_delta
+        for attr_name, amount in totals.items():
+            current_value = get(attr_name) or 0
+            if clamp:
+                # The maximum is paired with the stat in the StatSchema, so its name is not built per call
+                stat_id = stat_ids.get(attr_name)
+                if stat_id is None:
+                    stat_id = StatSchema.id(attr_name)
+                max_id = max_ids[stat_id]
+                amount = limit_delta(current_value, amount, None if max_id is None else get(stat_names[max_id]))
+            self.set(attr_name, current_value + amount)
+            applied[attr_name] = amount
+        return applied
+
+    @staticmethod
+    def apply_deltas(batch, clamp: bool = True) -> dict:
+        """
+        Apply a batch of changes across many characters. Changes are grouped by character and applied with
+        modify_many, so each attribute of each character is read, limited and written once.
+
+        Args:
+            batch (iterable): (character, attribute, amount) triples. Characters are objects with a `stats` attribute.
+            clamp (bool): Whether to keep each attribute within [0, max_<attribute>]. Defaults to True.
+
+        Returns:
+            dict: The change actually applied, keyed by (character, attribute).
+        """
+        grouped = {}
+        for character, attr_name, amount in batch:
+            deltas = grouped.get(character)
+            if deltas is None:
+                grouped[character] = {attr_name: amount}
+            elif attr_name in deltas:
+                deltas[attr_name] += amount
+            else:
+                deltas[attr_name] = amount
+
+        applied = {}
+        for character, deltas in grouped.items():
+            for attr_name, amount in character.stats.modify_many(deltas, clamp).items():
+                applied[character, attr_name] = amount
+        return applied
+
+    def snapshot(self):
+        """
+        Return a copy-on-write snapshot of these stats, for what-if changes that can be committed or discarded.
+
+        Returns:
+            StatsSnapshot: A snapshot that reads through to these stats.
+        """
+        from .stats_snapshot import StatsSnapshot
+        return StatsSnapshot(self)
+
+    def __contains__(self, attr_name):
+        """
+        Check whether an attribute exists.
+
+        Args:
+            attr_name (str): The name of the attribute.
+
+        Returns:
+            bool: True if the attribute exists, False otherwise.
+        """
+        return attr_name in self.attributes
+
     def __getattr__(self, attr_name):
         """
         Override __getattr__ to dynamically return attributes from the attributes dictionary if they exist.
@@ -57,7 +456,8 @@ class Stats:
         Returns:
             The value of the attribute if it exists in the dictionary.
         """
-        if attr_name in self.attributes:
+        # Slots are only missing while the object is being copied or unpickled
+        if attr_name not in Stats.__slots__ and attr_name in self.attributes:
             return self.attributes[attr_name]
         raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{attr_name}'")
 
@@ -70,10 +470,20 @@ class Stats:
             attr_name (str): The name of the attribute to set.
             value: The value to assign to the attribute.
         """
-        if attr_name == 'attributes':
+        if attr_name in Stats.__slots__:
             super().__setattr__(attr_name, value)
         else:
-            self.attributes[attr_name] = value
+            self.set(attr_name, value)
+
+    def __setstate__(self, state):
+        # The default pickled state of slotted objects is (None, slot values); pickles from before the
+        # stats had slots hold their __dict__, {'attributes': {...}}, which unpacks the same way
+        if isinstance(state, tuple):
+            state = state[1]
+        for slot_name in Stats.__slots__:
+            object.__setattr__(self, slot_name, None)
+        for slot_name, value in state.items():
+            object.__setattr__(self, slot_name, value)
 
     def __str__(self):
         """
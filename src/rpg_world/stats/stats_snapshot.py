@@ -0,0 +1,218 @@
+from collections.abc import Mapping
+from .stats import Stats, next_version
+from .stat_schema import StatSchema, stat_ids
+
+# Marks attributes the snapshot has not written, since None is a valid value
+_MISSING = object()
+
+class StatsSnapshot(Stats):
+    """
+    A copy-on-write view of another Stats object, for trying out changes without touching the original.
+    Reads fall through to the parent until an attribute is written; writes go to a small delta owned
+    by the snapshot. commit() writes the delta into the parent, and discard() drops it.
+
+    Creating a snapshot copies nothing, so it costs the same however many attributes the parent has.
+    The parent can be any Stats object, including CharacterStats attached to a StatsStore or another
+    snapshot. Modifier layers and watchers added to a snapshot stay in the snapshot and are not
+    committed, and the parent's watchers only see the changes once they are committed.
+    """
+
+    __slots__ = ("parent", "_delta")
+
+    def __init__(self, parent: Stats):
+        """
+        Initialize an empty snapshot of a Stats object.
+
+        Args:
+            parent (Stats): The stats to read through to and commit into.
+        """
+        _object_setattr(self, "parent", parent)
+        _object_setattr(self, "_delta", {})
+        _object_setattr(self, "_versions", None)
+        _object_setattr(self, "_drained", None)
+        _object_setattr(self, "_modifiers", None)
+        _object_setattr(self, "_watchers", None)
+
+    def get(self, attr_name):
+        """
+        Retrieve the value of a specific attribute, from the delta if it was written and from the parent otherwise.
+
+        Args:
+            attr_name (str): The name of the attribute to retrieve.
+
+        Returns:
+            The value of the attribute or None if it doesn't exist.
+        """
+        value = self._delta.get(attr_name, _MISSING)
+        if value is _MISSING:
+            return self.parent.get(attr_name)
+        return value
+
+    def set(self, attr_name, value):
+        """
+        Set the value of a specific attribute in the delta. The parent is not changed.
+
+        Args:
+            attr_name (str): The name of the attribute to set.
+            value: The value to assign to the attribute.
+        """
+        if attr_name not in stat_ids:
+            StatSchema.id(attr_name)
+        self._delta[attr_name] = value
+        versions = self._versions
+        if versions is None:
+            _object_setattr(self, "_versions", {attr_name: next_version()})
+        else:
+            versions[attr_name] = next_version()
+        if self._watchers is not None:
+            self._notify_watchers(attr_name, value)
+
+    def version(self, attr_name) -> int:
+        """
+        Return the version of an attribute: its version in the snapshot if it was written there,
+        and the parent's version otherwise.
+
+        Args:
+            attr_name (str): The name of the attribute.
+
+        Returns:
+            int: The version of the attribute.
+        """
+        versions = self._versions
+        if versions is not None and attr_name in versions:
+            return versions[attr_name]
+        return self.parent.version(attr_name)
+
+    @property
+    def changes(self) -> dict:
+        """
+        The attributes written to the snapshot and their new values.
+
+        Returns:
+            dict: A copy of the delta.
+        """
+        return dict(self._delta)
+
+    def commit(self):
+        """
+        Write every changed attribute into the parent, which gives them new versions there, and empty the delta.
+        Values the parent received since the snapshot was taken are overwritten for those attributes.
+        """
+        parent = self.parent
+        for attr_name, value in self._delta.items():
+            parent.set(attr_name, value)
+        self.discard()
+
+    def discard(self):
+        """
+        Drop every change, so the snapshot reads the parent's values again.
+        """
+        self._delta.clear()
+        _object_setattr(self, "_versions", None)
+        _object_setattr(self, "_drained", None)
+
+    @property
+    def attributes(self):
+        """
+        A read-only mapping of every attribute as the snapshot sees it.
+
+        Returns:
+            Mapping: A live view of the parent's attributes with the delta applied.
+        """
+        return _SnapshotView(self)
+
+    def is_alive(self):
+        """
+        Check if the character is still alive, according to the snapshot.
+
+        Returns:
+            bool: True if health is greater than zero, False otherwise.
+        """
+        return (self.get("health") or 0) > 0
+
+    def __contains__(self, attr_name):
+        """
+        Check whether an attribute exists in the snapshot or its parent.
+
+        Args:
+            attr_name (str): The name of the attribute.
+
+        Returns:
+            bool: True if the attribute exists, False otherwise.
+        """
+        return attr_name in self._delta or attr_name in self.parent
+
+    def __getattr__(self, attr_name):
+        """
+        Return an attribute as the snapshot sees it.
+
+        Args:
+            attr_name (str): The name of the attribute to retrieve.
+
+        Returns:
+            The value of the attribute if it exists in the snapshot or its parent.
+        """
+        # Slots are only missing while the object is being copied or unpickled
+        if attr_name not in _SLOT_NAMES and attr_name in self:
+            return self.get(attr_name)
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{attr_name}'")
+
+    def __setattr__(self, attr_name, value):
+        """
+        Write an attribute to the delta.
+
+        Args:
+            attr_name (str): The name of the attribute to set.
+            value: The value to assign to the attribute.
+        """
+        if attr_name in _SLOT_NAMES:
+            _object_setattr(self, attr_name, value)
+        else:
+            self.set(attr_name, value)
+
+    def __getstate__(self):
+        """
+        Pickle the parent and the delta; version history and watchers are not kept.
+        """
+        return self.parent, self._delta
+
+    def __setstate__(self, state):
+        parent, delta = state
+        self.__init__(parent)
+        self._delta.update(delta)
+
+
+_SLOT_NAMES = frozenset(StatsSnapshot.__slots__ + Stats.__slots__)
+
+# Writes the slots directly, bypassing the __setattr__ override
+_object_setattr = object.__setattr__
+
+
+class _SnapshotView(Mapping):
+    """
+    Read-only dictionary-like view over the attributes of a StatsSnapshot.
+    """
+
+    __slots__ = ("_snapshot",)
+
+    def __init__(self, snapshot):
+        self._snapshot = snapshot
+
+    def __getitem__(self, attr_name):
+        if attr_name not in self._snapshot:
+            raise KeyError(attr_name)
+        return self._snapshot.get(attr_name)
+
+    def __iter__(self):
+        delta = self._snapshot._delta
+        parent_names = self._snapshot.parent.attributes
+        yield from parent_names
+        for attr_name in delta:
+            if attr_name not in parent_names:
+                yield attr_name
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return repr(dict(self))
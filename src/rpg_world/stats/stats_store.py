@@ -0,0 +1,401 @@
+from .stats import Stats, next_version
+from .character_stats import CharacterStats, _object_setattr
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+class StatsStore:
+    """
+    Columnar storage for the core stats of many characters. Each core stat (see CharacterStats.CORE_FIELDS)
+    is a contiguous NumPy array indexed by row, and every attached CharacterStats becomes a view of its row,
+    so the per-object API keeps working while population-wide operations (regeneration, clamping, alive
+    masks) run as single vectorized operations. Additional attributes stay in each object's overflow dictionary.
+
+    Vectorized operations stamp the rows they write with a new version in per-row version columns,
+    which the views combine with their own versions, so Stats.version() and Stats.drain_dirty() see
+    every change made through the store. Watchers registered on views (see Stats.watch) are notified
+    after each vectorized operation; only the rows that have watchers are checked.
+
+    The columns hold floats. Stats that were integers when attached or assigned are read back (and
+    detached) as integers while their value stays whole, so attaching does not turn 100 into 100.0.
+
+    Requires NumPy.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize an empty store.
+
+        Args:
+            capacity (int): The number of rows allocated up front. The store grows as needed. Defaults to 1024.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError("StatsStore requires NumPy. Install it with 'pip install numpy'.")
+        capacity = max(capacity, 1)
+        self.columns = {field: np.zeros(capacity) for field in CharacterStats.CORE_FIELDS}
+        self.versions = {field: np.zeros(capacity, dtype=np.int64) for field in CharacterStats.CORE_FIELDS}
+        # Rows whose stat was last given an int, read back as an int while the value is whole
+        self.integers = {field: np.zeros(capacity, dtype=bool) for field in CharacterStats.CORE_FIELDS}
+        self.active = np.zeros(capacity, dtype=bool)
+        self.size = 0  # Rows in use or freed; rows past this have never been used
+        self._views = []
+        self._free_rows = []
+        self._watched_rows = set()
+
+    @property
+    def capacity(self):
+        """
+        The number of rows currently allocated.
+
+        Returns:
+            int: The length of every column.
+        """
+        return len(self.active)
+
+    def __len__(self):
+        return len(self._views) - len(self._free_rows)
+
+    def attach(self, stats: CharacterStats) -> int:
+        """
+        Move a CharacterStats object's core stats into the store and turn it into a view of its row.
+        Attaching an object that is already in this store does nothing.
+
+        Args:
+            stats (CharacterStats): The stats to attach.
+
+        Returns:
+            int: The row holding the stats.
+
+        Raises:
+            ValueError: If the stats are attached to another store.
+        """
+        if isinstance(stats, StoredCharacterStats):
+            if stats._store is not self:
+                raise ValueError("These stats are already attached to another StatsStore.")
+            return stats._row
+
+        if self._free_rows:
+            row = self._free_rows.pop()
+            self._views[row] = stats
+        else:
+            row = self.size
+            if row == self.capacity:
+                self._grow(2 * row)
+            self._views.append(stats)
+            self.size += 1
+
+        integers = self.integers
+        for field, column in self.columns.items():
+            value = getattr(stats, field)
+            column[row] = value
+            integers[field][row] = type(value) is int
+        self.active[row] = True
+
+        _object_setattr(stats, "__class__", StoredCharacterStats)
+        _object_setattr(stats, "_store", self)
+        _object_setattr(stats, "_row", row)
+        if stats._watchers is not None:
+            self._watched_rows.add(row)
+        return row
+
+    def detach(self, stats: CharacterStats):
+        """
+        Copy a view's values back into the object itself and free its row.
+
+        Args:
+            stats (CharacterStats): Stats previously attached to this store.
+
+        Raises:
+            ValueError: If the stats are not attached to this store.
+        """
+        if not isinstance(stats, StoredCharacterStats) or stats._store is not self:
+            raise ValueError("These stats are not attached to this StatsStore.")
+
+        row = stats._row
+        values = [(field, _to_python(column.item(row), self.integers[field].item(row)))
+                  for field, column in self.columns.items()]
+        versions = stats._current_versions()
+        _object_setattr(stats, "__class__", CharacterStats)
+        for field, value in values:
+            _object_setattr(stats, field, value)
+        _object_setattr(stats, "_versions", versions or None)
+        _object_setattr(stats, "_store", None)
+        _object_setattr(stats, "_row", None)
+
+        for column in self.columns.values():
+            column[row] = 0
+        for column in self.versions.values():
+            column[row] = 0
+        for column in self.integers.values():
+            column[row] = False
+        self.active[row] = False
+        self._views[row] = None
+        self._free_rows.append(row)
+        self._watched_rows.discard(row)
+
+    def column(self, field: str):
+        """
+        Return one core stat of every row in use. Changes to the array are seen by the views.
+
+        Args:
+            field (str): The name of a core stat, e.g. 'health'.
+
+        Returns:
+            numpy.ndarray: A view of the column, indexed by row. Freed rows hold 0. Writes made
+                           directly to the array are not counted in the stats' versions.
+        """
+        return self.columns[field][:self.size]
+
+    @staticmethod
+    def locate(characters):
+        """
+        Find the store and rows holding the stats of a group of characters, so formulas can read their
+        core stats as columns (see Formula.calculate_many).
+
+        Args:
+            characters (list): Objects with a `stats` attribute.
+
+        Returns:
+            tuple or None: (store, rows) with the rows as an integer array in the order of the characters,
+                           or None if any character's stats are not a view of the same store.
+        """
+        if not characters or type(characters[0].stats) is not StoredCharacterStats:
+            return None
+        store = characters[0].stats._store
+        rows = []
+        for character in characters:
+            stats = character.stats
+            if type(stats) is not StoredCharacterStats or stats._store is not store:
+                return None
+            rows.append(stats._row)
+        return store, np.array(rows, dtype=np.intp)
+
+    def alive_mask(self):
+        """
+        Return which rows belong to a character that is still alive.
+
+        Returns:
+            numpy.ndarray: A boolean array indexed by row.
+        """
+        return self.active[:self.size] & (self.columns["health"][:self.size] > 0)
+
+    def regenerate(self, field: str, amount, clamp: bool = True):
+        """
+        Add an amount to one stat of every living character, e.g. mana regeneration at the end of a turn.
+
+        Args:
+            field (str): The name of a core stat, e.g. 'mana'.
+            amount (float or numpy.ndarray): The amount to add, as a scalar or an array indexed by row.
+            clamp (bool): Whether to clamp the stat to [0, max] afterwards. Defaults to True.
+        """
+        alive = self.alive_mask()
+        column = self.column(field)
+        if np.ndim(amount):
+            column[alive] += np.asarray(amount)[alive]
+        else:
+            column[alive] += amount
+        self.versions[field][:self.size][alive] = next_version()
+        if clamp:
+            self.clamp_to_max(field)
+        else:
+            self._notify_watchers(field)
+
+    def clamp_to_max(self, *fields: str):
+        """
+        Clamp stats that have a maximum (health, mana, focus) to the range [0, max] for every row.
+
+        Args:
+            *fields (str): The stats to clamp. Defaults to every stat that has a 'max_' counterpart.
+        """
+        for field in fields or ("health", "mana", "focus"):
+            column = self.column(field)
+            clamped = np.clip(column, 0, self.column(f"max_{field}"))
+            changed = clamped != column
+            column[changed] = clamped[changed]
+            self.versions[field][:self.size][changed] = next_version()
+            self._notify_watchers(field)
+
+    def apply_deltas(self, batch, clamp: bool = True) -> dict:
+        """
+        Vectorized counterpart of Stats.apply_deltas. Changes to core stats of characters attached to this
+        store are summed per row and applied to each column at once; any other changes go through Stats.apply_deltas.
+
+        Args:
+            batch (iterable): (character, attribute, amount) triples. Characters are objects with a `stats` attribute.
+            clamp (bool): Whether to keep each stat within [0, max_<stat>], as Formula.apply_limits does. Defaults to True.
+
+        Returns:
+            dict: The change actually applied, keyed by (character, attribute).
+        """
+        by_field = {}
+        others = []
+        for character, attr_name, amount in batch:
+            stats = character.stats
+            if attr_name in self.columns and type(stats) is StoredCharacterStats and stats._store is self:
+                entry = by_field.get(attr_name)
+                if entry is None:
+                    entry = by_field[attr_name] = ([], [], [])
+                entry[0].append(character)
+                entry[1].append(stats._row)
+                entry[2].append(amount)
+            else:
+                others.append((character, attr_name, amount))
+
+        applied = Stats.apply_deltas(others, clamp) if others else {}
+        for field, (characters, rows, amounts) in by_field.items():
+            rows, first, inverse = np.unique(rows, return_index=True, return_inverse=True)
+            column = self.columns[field]
+            current = column[rows]
+            new = current + np.bincount(inverse, weights=amounts)
+            if clamp:
+                max_column = self.columns.get(f"max_{field}")
+                if max_column is not None:
+                    np.minimum(new, max_column[rows], out=new)
+                np.maximum(new, 0, out=new)
+            column[rows] = new
+            self.versions[field][rows] = next_version()
+            for index, amount in zip(first.tolist(), (new - current).tolist()):
+                applied[(characters[index], field)] = amount
+            self._notify_watchers(field)
+        return applied
+
+    def _notify_watchers(self, field: str):
+        """
+        Let the watchers of one stat on every watched row compare their values after a vectorized write.
+
+        Args:
+            field (str): The name of the core stat that was written.
+        """
+        if not self._watched_rows:
+            return
+        views = self._views
+        for row in list(self._watched_rows):
+            stats = views[row]
+            if stats._watchers is None:
+                self._watched_rows.discard(row)
+            else:
+                stats._notify_watchers(field, stats.get(field))
+
+    def _grow(self, capacity: int):
+        """
+        Reallocate every column with room for `capacity` rows.
+        """
+        for columns in (self.columns, self.versions, self.integers):
+            for field, column in columns.items():
+                grown = np.zeros(capacity, dtype=column.dtype)
+                grown[:len(column)] = column
+                columns[field] = grown
+        active = np.zeros(capacity, dtype=bool)
+        active[:len(self.active)] = self.active
+        self.active = active
+
+    def __getstate__(self):
+        """
+        Pickle the store empty. Views pickle as detached CharacterStats, and GameState attaches them again on load.
+        """
+        return {"capacity": self.capacity}
+
+    def __setstate__(self, state):
+        self.__init__(state["capacity"])
+
+
+def _column_property(field):
+    """
+    Build a property that reads and writes one core stat in the owning store's column.
+    """
+    def fget(self):
+        store = self._store
+        row = self._row
+        return _to_python(store.columns[field].item(row), store.integers[field].item(row))
+
+    def fset(self, value):
+        store = self._store
+        row = self._row
+        store.columns[field][row] = value
+        store.integers[field][row] = type(value) is int
+
+    return property(fget, fset, doc=f"The '{field}' stat, stored in the StatsStore.")
+
+
+class StoredCharacterStats(CharacterStats):
+    """
+    A CharacterStats object whose core stats live in a row of a StatsStore. Objects become (and stop
+    being) instances of this class through StatsStore.attach and StatsStore.detach; it has no state of
+    its own beyond the store and row slots CharacterStats reserves for it.
+    """
+
+    __slots__ = ()
+
+    def version(self, attr_name) -> int:
+        """
+        Return the version of an attribute, including writes made through the store.
+
+        Args:
+            attr_name (str): The name of the attribute.
+
+        Returns:
+            int: The version of the attribute.
+        """
+        column = self._store.versions.get(attr_name)
+        own = super().version(attr_name)
+        return own if column is None else max(own, column.item(self._row))
+
+    def watch(self, attr_name, threshold, callback, direction="below"):
+        """
+        Register a threshold watcher (see Stats.watch), which also sees writes made through the store.
+
+        Args:
+            attr_name (str): The name of the attribute to watch.
+            threshold (float): The value to watch for.
+            callback (callable): Called as callback(stats, attr_name, old_value, new_value).
+            direction (str): 'below', 'above' or 'crossing'. Defaults to 'below'.
+
+        Returns:
+            StatWatcher: The watcher, to pass to unwatch().
+        """
+        watcher = super().watch(attr_name, threshold, callback, direction)
+        self._store._watched_rows.add(self._row)
+        return watcher
+
+    def _current_versions(self) -> dict:
+        """
+        Return the version of every written attribute, including writes made through the store.
+        """
+        versions = super()._current_versions()
+        row = self._row
+        for field, column in self._store.versions.items():
+            version = column.item(row)
+            if version > versions.get(field, 0):
+                versions[field] = version
+        return versions
+
+    def __reduce__(self):
+        """
+        Copy and pickle as a detached CharacterStats with the current values.
+        """
+        return (_new_character_stats, (), self.__getstate__())
+
+
+# Core stats are read from and written to the store instead of the slots
+for _field in CharacterStats.CORE_FIELDS:
+    setattr(StoredCharacterStats, _field, _column_property(_field))
+del _field
+
+
+def _to_python(value: float, integer: bool):
+    """
+    Convert a value read from a column back to an int if the stat was an int and is still whole.
+    """
+    return int(value) if integer and value.is_integer() else value
+
+
+def _new_character_stats():
+    """
+    Create an empty CharacterStats for unpickling; its values are restored by __setstate__.
+    """
+    return CharacterStats.__new__(CharacterStats)
@@ -0,0 +1,38 @@
+# rpg_world/telemetry/__init__.py
+
+# The reader pulls in NumPy when it is installed, so names are imported on first access only.
+# This keeps instrumented modules, which import telemetry.journal, from paying for the reader.
+_EXPORTS = {
+    "Journal": ".journal",
+    "JournalEvent": ".journal",
+    "JournalReader": ".journal_reader",
+    "JournalRecord": ".journal_reader",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """
+    Import and return a public name on first access, then cache it in the package namespace.
+
+    Args:
+        name (str): The name being accessed.
+
+    Returns:
+        Any: The class or object exported under that name.
+
+    Raises:
+        AttributeError: If the name is not part of the public API.
+    """
+    from importlib import import_module
+
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+# By including this, users can import the journal like this:
+# from rpg_world.telemetry import Journal
@@ -0,0 +1,66 @@
+import argparse
+import sys
+from datetime import datetime
+from .journal import JournalEvent
+from .journal_reader import JournalReader
+
+def main(argv=None):
+    """
+    Query a telemetry journal from the command line.
+
+    Usage:
+        python -m rpg_world.telemetry JOURNAL [--kind KIND] [--source NAME] [--target NAME]
+                                              [--attribute NAME] [--since TS] [--until TS]
+                                              [--count] [--limit N]
+
+    Args:
+        argv (list, optional): The command line arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        int: The exit status.
+    """
+    kinds = [kind.name.lower() for kind in JournalEvent]
+
+    parser = argparse.ArgumentParser(prog="python -m rpg_world.telemetry", description="Filter records in a telemetry journal.")
+    parser.add_argument("journal", help="path of the journal file")
+    parser.add_argument("--kind", choices=kinds, help="only records of this kind")
+    parser.add_argument("--source", help="only records whose source has this id or name")
+    parser.add_argument("--target", help="only records whose target has this id or name")
+    parser.add_argument("--attribute", help="only records whose attribute has this name")
+    parser.add_argument("--since", type=float, help="only records at or after this UNIX timestamp")
+    parser.add_argument("--until", type=float, help="only records before this UNIX timestamp")
+    parser.add_argument("--count", action="store_true", help="print the number of matching records only")
+    parser.add_argument("--limit", type=int, help="print at most this many records")
+    args = parser.parse_args(argv)
+
+    reader = JournalReader(args.journal)
+    filters = {
+        "kind": JournalEvent[args.kind.upper()] if args.kind else None,
+        "source": args.source,
+        "target": args.target,
+        "attribute": args.attribute,
+        "since": args.since,
+        "until": args.until,
+    }
+
+    if args.count:
+        print(reader.count(**filters))
+        return 0
+
+    names = reader.names()
+    for index, record in enumerate(reader.query(**filters)):
+        if args.limit is not None and index >= args.limit:
+            break
+        print("\t".join([
+            datetime.fromtimestamp(record.timestamp).isoformat(),
+            JournalEvent(record.kind).name.lower(),
+            names.get(record.source, "-" if not record.source else str(record.source)),
+            names.get(record.target, "-" if not record.target else str(record.target)),
+            names.get(record.attribute, "-" if not record.attribute else str(record.attribute)),
+            f"{record.delta:g}",
+        ]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
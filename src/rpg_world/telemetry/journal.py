@@ -0,0 +1,210 @@
+import os
+import struct
+import time
+from enum import IntEnum
+
+class JournalEvent(IntEnum):
+    """
+    The kinds of events recorded in a journal.
+    """
+
+    EFFECT_APPLIED = 1        # source: none, target: character, attribute: stat, delta: change
+    SPELL_EFFECT_APPLIED = 2  # source: caster, target: recipient, attribute: stat, delta: change
+    SPELL_CAST = 3            # source: caster, target: target, attribute: spell name
+    LOCATION_CHANGED = 4      # source: world, target: new location
+    EVENT_TRIGGERED = 5       # source: event
+
+
+class Journal:
+    """
+    An append-only binary journal of combat and world telemetry.
+
+    Every record has the same fixed size (see RECORD): a timestamp, the change in value, the ids of the
+    source and target entities, the id of the affected attribute and the event kind. Each name gets the
+    next free id the first time the journal sees it, so ids never collide, and each id is written once to a
+    '<path>.names' sidecar file so readers can turn ids back into names. A journal appending to an existing
+    file continues from the ids already in its sidecar. Records are packed into a preallocated buffer and
+    written in blocks.
+
+    Instrumented code writes to Journal.current, which is None (and costs a single check) until a
+    journal is started with Journal.start(). Events whose source or target is a what-if copy
+    (see Character.overlay) did not happen, and are not recorded.
+    """
+
+    # timestamp, delta, source id, target id, attribute id, kind (+2 bytes padding)
+    RECORD = struct.Struct("<ddIIIH2x")
+
+    # The journal instrumented code writes to, or None when journaling is off
+    current = None
+
+    def __init__(self, path: str, buffer_records: int = 4096):
+        """
+        Open a journal for appending.
+
+        Args:
+            path (str): The path of the journal file. Names are stored next to it in '<path>.names'.
+            buffer_records (int): The number of records buffered in memory before they are written. Defaults to 4096.
+        """
+        self.path = path
+        self.records_written = 0
+        self._file = open(path, "ab")
+        self._names_file = open(f"{path}.names", "a", encoding="utf-8")
+        self._buffer = bytearray(self.RECORD.size * buffer_records)
+        self._view = memoryview(self._buffer)
+        self._capacity = buffer_records
+        self._count = 0
+
+        # Ids by name, and ids already used by the sidecar of an existing journal, which new names skip
+        self._ids = {name: ident for ident, name in read_names(path).items()}
+        self._taken = set(self._ids.values())
+        self._next_id = 1
+
+    @classmethod
+    def start(cls, path: str, buffer_records: int = 4096):
+        """
+        Open a journal and make it the one instrumented code writes to. Any current journal is closed first.
+
+        Args:
+            path (str): The path of the journal file.
+            buffer_records (int): The number of records buffered in memory before they are written. Defaults to 4096.
+
+        Returns:
+            Journal: The started journal.
+        """
+        cls.stop()
+        cls.current = cls(path, buffer_records)
+        return cls.current
+
+    @classmethod
+    def stop(cls):
+        """
+        Close the current journal, if any, and stop journaling.
+        """
+        journal, cls.current = cls.current, None
+        if journal is not None:
+            journal.close()
+
+    def name_id(self, name: str) -> int:
+        """
+        Return the journal id of a name, assigning it the next free id and recording it in the sidecar file
+        the first time it is seen. Id 0 is reserved for "no entity".
+
+        Args:
+            name (str): The name to map.
+
+        Returns:
+            int: The id of the name.
+
+        Raises:
+            OverflowError: If the journal has run out of 32-bit ids.
+        """
+        ident = self._ids.get(name)
+        if ident is None:
+            ident = self._next_id
+            while ident in self._taken:
+                ident += 1
+            if ident > 0xFFFFFFFF:
+                raise OverflowError(f"Journal '{self.path}' has run out of ids for names.")
+            self._next_id = ident + 1
+            self._ids[name] = ident
+            self._names_file.write(f"{ident}\t{name}\n")
+        return ident
+
+    def entity_id(self, entity) -> int:
+        """
+        Return the journal id of an entity (see name_id()).
+        Entities are identified by their `id` if they have one, otherwise by their `name`.
+
+        Args:
+            entity (object or str or None): An entity, a plain name, or None.
+
+        Returns:
+            int: The id of the entity, or 0 for None.
+        """
+        if entity is None:
+            return 0
+        if isinstance(entity, str):
+            key = entity
+        else:
+            key = getattr(entity, "id", None)
+            if key is None:
+                key = entity.name
+            key = str(key)
+
+        ident = self._ids.get(key)
+        if ident is None:
+            ident = self.name_id(key)
+        return ident
+
+    def record(self, kind: JournalEvent, source=None, target=None, attribute: str = None, delta: float = 0.0):
+        """
+        Append a record to the journal.
+
+        Args:
+            kind (JournalEvent): The kind of event.
+            source (object or str, optional): The entity that caused the event. Defaults to None.
+            target (object or str, optional): The entity affected by the event. Defaults to None.
+            attribute (str, optional): The affected attribute, or another name qualifying the event. Defaults to None.
+            delta (float): The change in value. Defaults to 0.0.
+        """
+        if getattr(source, "what_if", False) or getattr(target, "what_if", False):
+            return
+        self.RECORD.pack_into(
+            self._buffer,
+            self._count * self.RECORD.size,
+            time.time(),
+            delta,
+            self.entity_id(source),
+            self.entity_id(target),
+            self.entity_id(attribute),
+            kind
+        )
+        self._count += 1
+        if self._count == self._capacity:
+            self.flush()
+
+    def flush(self):
+        """
+        Write all buffered records and names to disk.
+        """
+        if self._count:
+            self._file.write(self._view[:self._count * self.RECORD.size])
+            self.records_written += self._count
+            self._count = 0
+        self._file.flush()
+        self._names_file.flush()
+
+    def close(self):
+        """
+        Flush and close the journal files.
+        """
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+            self._names_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def read_names(path: str) -> dict:
+    """
+    Load the id-to-name mapping from a journal's '<path>.names' sidecar file.
+
+    Args:
+        path (str): The path of the journal file.
+
+    Returns:
+        dict: A mapping of ids to names. Empty if the sidecar file does not exist.
+    """
+    names = {}
+    names_path = f"{path}.names"
+    if os.path.exists(names_path):
+        with open(names_path, encoding="utf-8") as names_file:
+            for line in names_file:
+                ident, _, name = line.rstrip("\n").partition("\t")
+                names[int(ident)] = name
+    return names
@@ -0,0 +1,174 @@
+from collections import namedtuple
+from .journal import Journal, JournalEvent, read_names
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+JournalRecord = namedtuple("JournalRecord", ["timestamp", "delta", "source", "target", "attribute", "kind"])
+
+class JournalReader:
+    """
+    Streams records from a journal written by Journal, one fixed-size block at a time, so files of any
+    size can be filtered without being loaded into memory. Filtering is vectorized when NumPy is installed;
+    otherwise only the filtered fields are scanned and just the matching records are unpacked.
+    """
+
+    # Byte offset, memoryview format and width of each integer field within a record
+    FIELD_LAYOUT = {
+        "source": (16, "I", 4),
+        "target": (20, "I", 4),
+        "attribute": (24, "I", 4),
+        "kind": (28, "H", 2),
+    }
+
+    if np is not None:
+        DTYPE = np.dtype([
+            ("timestamp", "<f8"),
+            ("delta", "<f8"),
+            ("source", "<u4"),
+            ("target", "<u4"),
+            ("attribute", "<u4"),
+            ("kind", "<u2"),
+            ("padding", "V2"),
+        ])
+
+    def __init__(self, path: str, chunk_records: int = 65536):
+        """
+        Initialize the reader.
+
+        Args:
+            path (str): The path of the journal file.
+            chunk_records (int): The number of records read from disk at a time. Defaults to 65536.
+        """
+        self.path = path
+        self.chunk_records = chunk_records
+
+    def names(self) -> dict:
+        """
+        Load the id-to-name mapping from the journal's '.names' sidecar file.
+
+        Returns:
+            dict: A mapping of ids to names. Empty if the sidecar file does not exist.
+        """
+        return read_names(self.path)
+
+    def _chunks(self):
+        """
+        Yield the raw bytes of the journal, a whole number of records at a time.
+        """
+        chunk_size = Journal.RECORD.size * self.chunk_records
+        with open(self.path, "rb") as journal_file:
+            while True:
+                data = journal_file.read(chunk_size)
+                if not data:
+                    return
+                # Ignore a partially written trailing record
+                yield data[:len(data) - len(data) % Journal.RECORD.size]
+
+    @staticmethod
+    def _to_id(value, ids: dict):
+        """
+        Convert a filter value (an id or a name) to a journal id, or -1 for a name the journal never recorded.
+        """
+        if value is None or isinstance(value, int):
+            return value
+        return ids.get(value, -1)
+
+    def query(self, kind: JournalEvent = None, source=None, target=None, attribute=None, since: float = None, until: float = None):
+        """
+        Yield the records matching every given filter, in journal order.
+
+        Args:
+            kind (JournalEvent, optional): Only records of this kind.
+            source (str or int, optional): Only records whose source has this name or id.
+            target (str or int, optional): Only records whose target has this name or id.
+            attribute (str or int, optional): Only records whose attribute has this name or id.
+            since (float, optional): Only records with a timestamp at or after this time.
+            until (float, optional): Only records with a timestamp before this time.
+
+        Yields:
+            JournalRecord: The matching records.
+        """
+        for block in self._filtered_blocks(kind, source, target, attribute, since, until):
+            if np is not None:
+                for row in block.tolist():
+                    yield JournalRecord(*row[:6])
+            else:
+                for row in block:
+                    yield JournalRecord(*row)
+
+    def count(self, kind: JournalEvent = None, source=None, target=None, attribute=None, since: float = None, until: float = None) -> int:
+        """
+        Count the records matching every given filter. Takes the same filters as query().
+
+        Returns:
+            int: The number of matching records.
+        """
+        return sum(len(block) for block in self._filtered_blocks(kind, source, target, attribute, since, until))
+
+    def __iter__(self):
+        return self.query()
+
+    def _filtered_blocks(self, kind, source, target, attribute, since, until):
+        """
+        Yield the matching records of each chunk, as a NumPy structured array or a list of tuples.
+        """
+        # Ids are assigned per journal, so names are looked up in its sidecar
+        ids = {}
+        if any(isinstance(value, str) for value in (source, target, attribute)):
+            ids = {name: ident for ident, name in self.names().items()}
+        filters = [
+            ("kind", None if kind is None else int(kind)),
+            ("source", self._to_id(source, ids)),
+            ("target", self._to_id(target, ids)),
+            ("attribute", self._to_id(attribute, ids)),
+        ]
+        filters = [(field, value) for field, value in filters if value is not None]
+        if any(value == -1 for _, value in filters):
+            return
+
+        if np is not None:
+            for data in self._chunks():
+                records = np.frombuffer(data, dtype=self.DTYPE)
+                mask = None
+                for field, value in filters:
+                    mask = (records[field] == value) if mask is None else mask & (records[field] == value)
+                if since is not None:
+                    mask = (records["timestamp"] >= since) if mask is None else mask & (records["timestamp"] >= since)
+                if until is not None:
+                    mask = (records["timestamp"] < until) if mask is None else mask & (records["timestamp"] < until)
+                yield records if mask is None else records[mask]
+            return
+
+        # Without NumPy, pull each filtered field out as a strided column and only unpack matching records
+        record_size = Journal.RECORD.size
+        wanted = tuple(value for _, value in filters)
+        for data in self._chunks():
+            view = memoryview(data)
+            columns = [self._column(view, field) for field, _ in filters]
+            if since is not None or until is not None:
+                timestamps = view.cast("d")[0::record_size // 8].tolist()
+                columns.append(timestamps)
+            if not columns:
+                yield list(Journal.RECORD.iter_unpack(data))
+                continue
+
+            low = float("-inf") if since is None else since
+            high = float("inf") if until is None else until
+            timed = since is not None or until is not None
+            count = len(filters)
+            yield [
+                Journal.RECORD.unpack_from(data, index * record_size)
+                for index, values in enumerate(zip(*columns))
+                if values[:count] == wanted and (not timed or low <= values[count] < high)
+            ]
+
+    @staticmethod
+    def _column(view, field):
+        """
+        Return one integer field of every record in a chunk as a list.
+        """
+        offset, code, width = JournalReader.FIELD_LAYOUT[field]
+        return view.cast(code)[offset // width::Journal.RECORD.size // width].tolist()
@@ -1,6 +1,8 @@
 # rpg_world/utils/__init__.py
 
 from .logger import Logger
+from .async_log_backend import AsyncLogBackend
+from .ring_buffer_handler import RingBufferHandler
 
 # By including this, users can import characters like this:
 # from rpg_world.logger import Logger
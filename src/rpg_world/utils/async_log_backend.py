@@ -0,0 +1,132 @@
+import logging
+import threading
+from collections import deque
+
+class AsyncLogBackend:
+    """
+    Moves log output off the calling thread. Records are handed to a bounded queue and written
+    by a single background thread, so the game loop only pays for creating the record.
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    OVERFLOW_POLICIES = (BLOCK, DROP_OLDEST, DROP_NEWEST)
+
+    def __init__(self, max_size: int = 10000, overflow_policy: str = BLOCK):
+        """
+        Initialize the backend and start its writer thread.
+
+        Args:
+            max_size (int): The maximum number of records waiting to be written. Defaults to 10000.
+            overflow_policy (str): What to do with a new record when the queue is full:
+                                   'block' waits for room, 'drop_oldest' discards the oldest queued record,
+                                   'drop_newest' discards the new record. Defaults to 'block'.
+
+        Raises:
+            ValueError: If max_size is not positive or the overflow policy is unknown.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+        if overflow_policy not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow_policy}'. Expected one of {self.OVERFLOW_POLICIES}.")
+
+        self.max_size = max_size
+        self.overflow_policy = overflow_policy
+        self.dropped_oldest = 0
+        self.dropped_newest = 0
+
+        self._queue = deque()
+        self._pending = 0  # Records queued or currently being written
+        self._running = True
+        self._condition = threading.Condition()
+
+        self._thread = threading.Thread(target=self._run, name="rpg_world-log-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def dropped(self):
+        """
+        The total number of records discarded because the queue was full.
+
+        Returns:
+            int: The sum of dropped_oldest and dropped_newest.
+        """
+        return self.dropped_oldest + self.dropped_newest
+
+    def put(self, record: logging.LogRecord):
+        """
+        Queue a record for the writer thread, applying the overflow policy if the queue is full.
+        Once the backend has been stopped, records are written synchronously instead.
+
+        Args:
+            record (logging.LogRecord): The record to write.
+        """
+        with self._condition:
+            while self._running and len(self._queue) >= self.max_size:
+                if self.overflow_policy == self.DROP_NEWEST:
+                    self.dropped_newest += 1
+                    return
+                if self.overflow_policy == self.DROP_OLDEST:
+                    self._queue.popleft()
+                    self._pending -= 1
+                    self.dropped_oldest += 1
+                    break
+                self._condition.wait()
+
+            if self._running:
+                self._queue.append(record)
+                self._pending += 1
+                self._condition.notify_all()
+                return
+
+        logging.getLogger(record.name).handle(record)
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Wait until every queued record has been handed to its handlers.
+
+        Args:
+            timeout (float, optional): The maximum number of seconds to wait. Defaults to None (no limit).
+
+        Returns:
+            bool: True if the queue was drained, False if the timeout expired first.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending == 0, timeout)
+
+    def stop(self, timeout: float = None):
+        """
+        Write any queued records and stop the writer thread.
+
+        Args:
+            timeout (float, optional): The maximum number of seconds to wait for the thread. Defaults to None.
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        self._thread.join(timeout)
+
+    def _run(self):
+        """
+        Writer thread loop: take every queued record at once and pass each one to its logger's handlers.
+        """
+        while True:
+            with self._condition:
+                while self._running and not self._queue:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                batch = list(self._queue)
+                self._queue.clear()
+                self._condition.notify_all()  # Wake producers waiting for room
+
+            for record in batch:
+                try:
+                    logging.getLogger(record.name).handle(record)
+                except Exception:
+                    pass  # Handlers report their own errors; never let one kill the writer thread
+
+            with self._condition:
+                self._pending -= len(batch)
+                self._condition.notify_all()
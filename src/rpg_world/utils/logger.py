@@ -1,12 +1,95 @@
+import atexit
 import logging
 import os
+import random
+import threading
+import time
+import weakref
+from .async_log_backend import AsyncLogBackend
+from .ring_buffer_handler import RingBufferHandler
+
+class ContextFormatter(logging.Formatter):
+    """
+    Formatter that appends a record's structured context, if it has any, to the formatted line.
+    """
+
+    def formatMessage(self, record):
+        """
+        Format the record and append its context as 'key=value' pairs.
+
+        Args:
+            record (logging.LogRecord): The record to format.
+
+        Returns:
+            str: The formatted line.
+        """
+        text = super().formatMessage(record)
+        context = getattr(record, "context", None)
+        if context:
+            fields = " ".join(f"{key}={value}" for key, value in context.items())
+            text = f"{text} [{fields}]"
+        return text
+
 
 class Logger:
     """
     A simple logger class to handle logging across the RPG framework.
+
+    Handlers are shared process-wide: every Logger writing to the same file at the same level
+    reuses one file handler and one console handler, and each underlying logging.Logger is
+    configured only once, no matter how many Logger wrappers are created for it.
+
+    Messages are formatted lazily: pass a %-style format string plus arguments, or a callable
+    returning the message, and nothing is formatted or called when the level is disabled.
+    Repetitive messages can be limited per call site with `rate_limit` (messages per second, with the
+    number suppressed reported on the next message that gets through) or sampled with `sample_rate`.
+    Limits are kept per Logger wrapper, so every entity logging with its own context is limited
+    separately, while wrappers without context only share the limit with their own owner. Counts still
+    pending when a call site goes quiet are reported by Logger.flush(), which also runs at exit.
+
+    Entities log through a small fixed hierarchy of loggers ('rpg_world.character', 'rpg_world.item', ...)
+    and pass their identity as structured context, so the number of logging.Logger objects stays
+    bounded no matter how many entities are created.
+
+    Output is synchronous by default. Logger.enable_async() switches every Logger to an
+    AsyncLogBackend, which writes records from a single background thread.
+
+    Logger.enable_ring_buffer() keeps the most recent records of the 'rpg_world' hierarchy in memory,
+    including levels below the file and console output level (see Logger.set_output_level()),
+    and dumps them to disk when an error is logged or on demand.
     """
 
-    def __init__(self, name: str, log_file: str = "game_log.log", log_level=logging.INFO):
+    FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+    # Shared handlers keyed by (absolute log file path, log level)
+    _handlers = {}
+
+    # Requested levels of the underlying loggers that have already been configured, by name
+    _configured = {}
+
+    # Level overriding the requested level of the shared file and console handlers, if set
+    _output_level = None
+
+    # Shared in-memory ring buffer of recent records, or None when disabled
+    _ring_buffer = None
+
+    # Default per-second limit for repetitive messages on hot paths, such as cooldown polling
+    HOT_PATH_RATE_LIMIT = 5
+
+    # Rate limit state of this wrapper's call sites, keyed by message template, created on first use
+    _rate_limits = None
+
+    # Wrappers holding rate limit state, so that pending suppressed counts can be flushed
+    _rate_limited_loggers = weakref.WeakSet()
+    _rate_limit_lock = threading.Lock()
+
+    _lock = threading.Lock()
+
+    # Shared asynchronous backend, or None for synchronous output
+    _backend = None
+    _atexit_registered = False
+
+    def __init__(self, name: str, log_file: str = "game_log.log", log_level=logging.INFO, context: dict = None):
         """
         Initialize the logger.
 
@@ -14,50 +97,376 @@ class Logger:
             name (str): The name of the logger.
             log_file (str): The file where logs will be saved.
             log_level (int): The logging level (e.g., logging.DEBUG, logging.INFO).
+            context (dict, optional): Structured context attached to every record as `record.context`,
+                                      such as the identity of the entity that is logging. Defaults to None.
         """
-        # Ensure log directory exists
-        log_dir = os.path.dirname(log_file)
-        if log_dir and not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-
-        # Set up the logger
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(log_level)
+        self.context = context
+        self._extra = {"context": context} if context else None
 
-        # File handler for writing logs to a file
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(log_level)
+        # Configure the underlying logger only the first time it is wrapped
+        if name not in self._configured:
+            with self._lock:
+                if name not in self._configured:
+                    self.logger.setLevel(self._effective_level(log_level))
 
-        # Console handler for output to the terminal
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(log_level)
+                    # Adding handlers to the logger
+                    if not self.logger.hasHandlers():
+                        for handler in self.get_handlers(log_file, log_level):
+                            self.logger.addHandler(handler)
 
-        # Formatter to define the log format
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
+                    self._configured[name] = log_level
 
-        # Adding handlers to the logger
-        if not self.logger.hasHandlers():
-            self.logger.addHandler(file_handler)
-            self.logger.addHandler(console_handler)
+    @classmethod
+    def get_handlers(cls, log_file: str = "game_log.log", log_level=logging.INFO):
+        """
+        Return the shared file and console handlers for a log file and level, creating them on first use.
+        The log file itself is only opened when the first record is emitted.
+
+        Args:
+            log_file (str): The file where logs will be saved.
+            log_level (int): The logging level of the handlers.
+
+        Returns:
+            tuple: The (file_handler, console_handler) pair.
+        """
+        key = (os.path.abspath(log_file), log_level)
+        handlers = cls._handlers.get(key)
+        if handlers is None:
+            # Ensure log directory exists
+            log_dir = os.path.dirname(key[0])
+            if log_dir and not os.path.exists(log_dir):
+                os.makedirs(log_dir)
+
+            # File handler for writing logs to a file, opened lazily on first emit
+            handler_level = log_level if cls._output_level is None else cls._output_level
+            file_handler = logging.FileHandler(key[0], delay=True)
+            file_handler.setLevel(handler_level)
+
+            # Console handler for output to the terminal
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(handler_level)
+
+            # Formatter to define the log format
+            formatter = ContextFormatter(cls.FORMAT)
+            file_handler.setFormatter(formatter)
+            console_handler.setFormatter(formatter)
+
+            handlers = cls._handlers.setdefault(key, (file_handler, console_handler))
+        return handlers
+
+    @classmethod
+    def close_handlers(cls):
+        """
+        Detach and close every shared handler, so that the next Logger reconfigures from scratch.
+        """
+        with cls._lock:
+            for handlers in cls._handlers.values():
+                for handler in handlers:
+                    for name in cls._configured:
+                        logging.getLogger(name).removeHandler(handler)
+                    handler.close()
+            cls._handlers.clear()
+            cls._configured.clear()
+
+    @classmethod
+    def set_output_level(cls, level: int = None):
+        """
+        Set the level of every shared file and console handler, existing and future, regardless of the
+        level each Logger requested. Loggers keep their own level, so lower-level records still reach
+        the ring buffer.
+
+        Args:
+            level (int, optional): The output level, or None to go back to each Logger's requested level.
+        """
+        with cls._lock:
+            cls._output_level = level
+            for (_, requested_level), handlers in cls._handlers.items():
+                for handler in handlers:
+                    handler.setLevel(requested_level if level is None else level)
+
+    @classmethod
+    def enable_ring_buffer(cls, capacity: int = 5000, dump_file: str = "game_log.dump.log", level=logging.DEBUG, dump_level=logging.ERROR):
+        """
+        Keep the most recent records of the 'rpg_world' logger hierarchy in a preallocated ring buffer.
+        Loggers are lowered to `level` if needed so those records are created; the shared file and console
+        handlers keep filtering at their own level. Any previously enabled ring buffer is removed first.
+
+        Args:
+            capacity (int): The number of records kept. Defaults to 5000.
+            dump_file (str): The file the buffer is appended to when it is dumped. Defaults to 'game_log.dump.log'.
+            level (int): The lowest level kept in the buffer. Defaults to logging.DEBUG.
+            dump_level (int): Records at or above this level dump the buffer automatically. Defaults to logging.ERROR.
+
+        Returns:
+            RingBufferHandler: The attached ring buffer.
+        """
+        cls.disable_ring_buffer()
+        ring_buffer = RingBufferHandler(capacity, dump_file, dump_level, level)
+        ring_buffer.setFormatter(ContextFormatter(cls.FORMAT))
+        logging.getLogger("rpg_world").addHandler(ring_buffer)
+        with cls._lock:
+            cls._ring_buffer = ring_buffer
+            cls._apply_levels()
+        return ring_buffer
+
+    @classmethod
+    def disable_ring_buffer(cls):
+        """
+        Detach the ring buffer, if any, and restore every logger to its requested level.
+        """
+        with cls._lock:
+            ring_buffer, cls._ring_buffer = cls._ring_buffer, None
+            cls._apply_levels()
+        if ring_buffer is not None:
+            logging.getLogger("rpg_world").removeHandler(ring_buffer)
+            ring_buffer.close()
+
+    @classmethod
+    def dump_ring_buffer(cls, path: str = None) -> int:
+        """
+        Write the records currently held by the ring buffer to disk, oldest first, and empty it.
+
+        Args:
+            path (str, optional): The file to append to. Defaults to the ring buffer's dump file.
+
+        Returns:
+            int: The number of records written, or 0 if no ring buffer is enabled.
+        """
+        ring_buffer = cls._ring_buffer
+        if ring_buffer is None:
+            return 0
+        return ring_buffer.dump(path)
+
+    @classmethod
+    def _effective_level(cls, log_level: int) -> int:
+        """
+        Return the level an underlying logger needs so that both its output and the ring buffer get their records.
+        """
+        if cls._ring_buffer is None:
+            return log_level
+        return min(log_level, cls._ring_buffer.level)
+
+    @classmethod
+    def _apply_levels(cls):
+        """
+        Reset the level of every configured logger after the ring buffer was enabled or disabled.
+        """
+        for name, log_level in cls._configured.items():
+            logging.getLogger(name).setLevel(cls._effective_level(log_level))
+
+    @classmethod
+    def enable_async(cls, max_size: int = 10000, overflow_policy: str = AsyncLogBackend.BLOCK):
+        """
+        Route the output of every Logger through a background writer thread.
+        Any previously enabled backend is flushed and stopped first.
+
+        Args:
+            max_size (int): The maximum number of records waiting to be written. Defaults to 10000.
+            overflow_policy (str): 'block', 'drop_oldest' or 'drop_newest'. Defaults to 'block'.
+
+        Returns:
+            AsyncLogBackend: The running backend, which exposes the drop counters.
+        """
+        cls.disable_async()
+        backend = AsyncLogBackend(max_size, overflow_policy)
+        with cls._lock:
+            cls._register_atexit()
+            cls._backend = backend
+        return backend
+
+    @classmethod
+    def disable_async(cls):
+        """
+        Write everything still queued, stop the background writer and return to synchronous output.
+        """
+        with cls._lock:
+            backend, cls._backend = cls._backend, None
+        if backend is not None:
+            backend.stop()
+        cls.flush()
+
+    @classmethod
+    def flush(cls, timeout: float = None):
+        """
+        Report the messages still suppressed by rate limits, wait for the background writer to drain its queue,
+        then flush every shared handler.
+
+        Args:
+            timeout (float, optional): The maximum number of seconds to wait for the queue. Defaults to None.
+        """
+        cls.flush_rate_limits()
+        if cls._backend is not None:
+            cls._backend.flush(timeout)
+        for handlers in list(cls._handlers.values()):
+            for handler in handlers:
+                try:
+                    handler.flush()
+                except (OSError, ValueError):
+                    pass  # The stream was already closed, e.g. during interpreter shutdown
+
+    @classmethod
+    def flush_rate_limits(cls) -> int:
+        """
+        Log the last suppressed message of every rate-limited call site that suppressed messages since it last
+        logged one, with the number of other messages suppressed, so that counts are not lost when a call site goes quiet.
+
+        Returns:
+            int: The number of messages logged.
+        """
+        pending = []
+        with cls._rate_limit_lock:
+            for logger in list(cls._rate_limited_loggers):
+                for state in logger._rate_limits.values():
+                    if state[2]:
+                        pending.append((logger, state[3], state[4], state[5], state[2] - 1))
+                        state[2] = 0
+                        state[4] = state[5] = None
+        for logger, level, message, args, suppressed in pending:
+            logger._emit(level, message, args, suppressed)
+        return len(pending)
+
+    def __getstate__(self):
+        # Rate limit state belongs to the running process
+        state = self.__dict__.copy()
+        state.pop("_rate_limits", None)
+        return state
+
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Check whether a message at the given level would be logged. Use this to guard
+        log calls whose arguments are expensive to compute.
+
+        Args:
+            level (int): The logging level (e.g., logging.DEBUG, logging.INFO).
+
+        Returns:
+            bool: True if messages at this level are logged, False otherwise.
+        """
+        return self.logger.isEnabledFor(level)
+
+    def _log(self, level: int, message, args: tuple, rate_limit: int = None, sample_rate: float = None):
+        """
+        Log a message synchronously, or hand it to the background writer when one is enabled.
+        Nothing is formatted or called unless the level is enabled and the message passes sampling and rate limiting.
+
+        Args:
+            level (int): The logging level of the message.
+            message (str or callable): A %-style format string, or a callable returning the message.
+            args (tuple): Arguments merged into the format string.
+            rate_limit (int, optional): The maximum number of messages per second from this call site. Defaults to None (no limit).
+            sample_rate (float, optional): The probability that the message is logged at all. Defaults to None (always).
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+        if sample_rate is not None and random.random() >= sample_rate:
+            return
+        if rate_limit is not None:
+            suppressed = self._rate_limited(level, message, args, rate_limit)
+            if suppressed is None:
+                return
+        else:
+            suppressed = 0
+        self._emit(level, message, args, suppressed)
+
+    def _emit(self, level: int, message, args: tuple, suppressed: int):
+        """
+        Format a message that passed the checks of _log() and write it, synchronously or through the background writer.
+
+        Args:
+            level (int): The logging level of the message.
+            message (str or callable): A %-style format string, or a callable returning the message.
+            args (tuple): Arguments merged into the format string.
+            suppressed (int): The number of similar messages suppressed before this one, reported if not 0.
+        """
+        if callable(message):
+            message = message()
+        if suppressed:
+            if not args:
+                message = message.replace("%", "%%")
+            message += " (%d similar messages suppressed)"
+            args += (suppressed,)
+
+        backend = self._backend
+        if backend is None:
+            self.logger.log(level, message, *args, extra=self._extra)
+        else:
+            record = self.logger.makeRecord(self.logger.name, level, "(unknown file)", 0, message, args, None, extra=self._extra)
+
+            # Format now, so the writer thread never sees arguments that changed after this call
+            record.msg = record.getMessage()
+            record.args = None
+            backend.put(record)
+
+    def _rate_limited(self, level: int, message, args: tuple, rate_limit: int):
+        """
+        Count a message against the limit of its call site, identified by this wrapper and the message template.
+        The last suppressed message is kept so that Logger.flush_rate_limits() can report it.
+
+        Args:
+            level (int): The logging level of the message.
+            message (str or callable): The message template, or the callable producing the message.
+            args (tuple): Arguments merged into the format string.
+            rate_limit (int): The maximum number of messages per second from this call site.
+
+        Returns:
+            int or None: None if the message must be suppressed, otherwise the number of messages
+                         suppressed at this call site since the last one that was logged.
+        """
+        key = getattr(message, "__code__", message)
+        now = time.monotonic()
+        with self._rate_limit_lock:
+            rate_limits = self._rate_limits
+            if rate_limits is None:
+                rate_limits = self._rate_limits = {}
+                self._rate_limited_loggers.add(self)
+                self._register_atexit()
+            state = rate_limits.get(key)
+            if state is None:
+                state = rate_limits[key] = [now, 0, 0, level, None, None]
+
+            # state holds [window start, messages logged in the window, messages suppressed since the last log,
+            # and the level, message and arguments of the last suppressed message]
+            if now - state[0] >= 1.0:
+                state[0] = now
+                state[1] = 0
+            if state[1] >= rate_limit:
+                state[2] += 1
+                state[3] = level
+                state[4] = message
+                state[5] = args
+                return None
+
+            state[1] += 1
+            suppressed, state[2] = state[2], 0
+            state[4] = state[5] = None
+            return suppressed
+
+    @classmethod
+    def _register_atexit(cls):
+        """
+        Flush pending output, including suppressed counts, when the interpreter exits. Registered once.
+        """
+        if not cls._atexit_registered:
+            atexit.register(cls.disable_async)
+            cls._atexit_registered = True
 
-    def debug(self, message: str):
+    def debug(self, message, *args, rate_limit: int = None, sample_rate: float = None):
         """Log a debug message."""
-        self.logger.debug(message)
+        self._log(logging.DEBUG, message, args, rate_limit, sample_rate)
 
-    def info(self, message: str):
+    def info(self, message, *args, rate_limit: int = None, sample_rate: float = None):
         """Log an info message."""
-        self.logger.info(message)
+        self._log(logging.INFO, message, args, rate_limit, sample_rate)
 
-    def warning(self, message: str):
+    def warning(self, message, *args, rate_limit: int = None, sample_rate: float = None):
         """Log a warning message."""
-        self.logger.warning(message)
+        self._log(logging.WARNING, message, args, rate_limit, sample_rate)
 
-    def error(self, message: str):
+    def error(self, message, *args, rate_limit: int = None, sample_rate: float = None):
         """Log an error message."""
-        self.logger.error(message)
+        self._log(logging.ERROR, message, args, rate_limit, sample_rate)
 
-    def critical(self, message: str):
+    def critical(self, message, *args, rate_limit: int = None, sample_rate: float = None):
         """Log a critical message."""
-        self.logger.critical(message)
+        self._log(logging.CRITICAL, message, args, rate_limit, sample_rate)
@@ -0,0 +1,103 @@
+import logging
+import os
+import time
+
+class RingBufferHandler(logging.Handler):
+    """
+    A logging handler that keeps the last N records in a preallocated in-memory ring buffer.
+    Each record's message is merged with its arguments when it is stored, so a dump shows the state
+    the arguments had when the record was logged; the rest of the formatting (timestamp, level, context)
+    is left for when the buffer is formatted and appended to a file, which happens when a record at or
+    above the dump level arrives, or when dump() is called.
+    """
+
+    def __init__(self, capacity: int = 5000, dump_file: str = "game_log.dump.log", dump_level=logging.ERROR, level=logging.NOTSET):
+        """
+        Initialize the ring buffer.
+
+        Args:
+            capacity (int): The number of records kept. Defaults to 5000.
+            dump_file (str): The file the buffer is appended to when it is dumped. Defaults to 'game_log.dump.log'.
+            dump_level (int): Records at or above this level dump the buffer automatically. Defaults to logging.ERROR.
+            level (int): The lowest level kept in the buffer. Defaults to logging.NOTSET.
+
+        Raises:
+            ValueError: If the capacity is not positive.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        super().__init__(level)
+        self.capacity = capacity
+        self.dump_file = dump_file
+        self.dump_level = dump_level
+        self.dumps = 0
+        self._records = [None] * capacity
+        self._next = 0
+        self._size = 0
+
+    def emit(self, record: logging.LogRecord):
+        """
+        Store a record, overwriting the oldest one once the buffer is full, and dump the buffer
+        if the record is at or above the dump level.
+
+        Args:
+            record (logging.LogRecord): The record to store.
+        """
+        if record.args:
+            # Arguments are often live objects (e.g. a character's stats); freeze them as the async backend does
+            try:
+                record.msg = record.getMessage()
+            except Exception:
+                self.handleError(record)
+                return
+            record.args = None
+        self._records[self._next] = record
+        self._next += 1
+        if self._next == self.capacity:
+            self._next = 0
+        if self._size < self.capacity:
+            self._size += 1
+
+        if record.levelno >= self.dump_level:
+            self.dump()
+
+    def records(self) -> list:
+        """
+        Return the stored records, oldest first.
+
+        Returns:
+            list: The records currently held by the buffer.
+        """
+        with self.lock:
+            start = self._next - self._size
+            if start >= 0:
+                return self._records[start:self._next]
+            return self._records[start:] + self._records[:self._next]
+
+    def dump(self, path: str = None) -> int:
+        """
+        Append the stored records to a file, oldest first, and empty the buffer.
+
+        Args:
+            path (str, optional): The file to append to. Defaults to the dump file given at initialization.
+
+        Returns:
+            int: The number of records written.
+        """
+        path = path or self.dump_file
+        with self.lock:
+            records = self.records()
+            self._records = [None] * self.capacity
+            self._next = 0
+            self._size = 0
+
+            dump_dir = os.path.dirname(os.path.abspath(path))
+            if not os.path.exists(dump_dir):
+                os.makedirs(dump_dir)
+
+            with open(path, "a", encoding="utf-8") as dump_file:
+                dump_file.write(f"=== Ring buffer dump at {time.strftime('%Y-%m-%d %H:%M:%S')} ({len(records)} records) ===\n")
+                for record in records:
+                    dump_file.write(self.format(record) + "\n")
+            self.dumps += 1
+        return len(records)
@@ -0,0 +1,95 @@
+import copy
+import pickle
+import pytest
+from rpg_world import (
+    AbilityRegistry,
+    Character,
+    CharacterStats,
+    Mage,
+    SimpleChangeFormula,
+    Spell,
+    SpellEffect
+)
+
+@pytest.fixture
+def fireball():
+    """
+    Fixture defining a shared Fireball spell, removed from the registry after the test.
+    """
+    spell = AbilityRegistry.define(Spell("Shared Fireball", 10, 5, [SpellEffect("health", SimpleChangeFormula(-20))]))
+    yield spell
+    AbilityRegistry.remove(spell.name)
+
+@pytest.fixture
+def goblin():
+    """
+    Fixture providing a target character.
+    """
+    return Character("Goblin", CharacterStats(health=100))
+
+def test_define_registers_a_read_only_definition(fireball):
+    """
+    Test that defined abilities can be looked up by name and cannot be modified.
+    """
+    assert AbilityRegistry.get("Shared Fireball") is fireball
+    assert "Shared Fireball" in AbilityRegistry.names()
+    assert fireball.shared
+    assert AbilityRegistry.define(fireball) is fireball
+
+    with pytest.raises(AttributeError):
+        fireball.cooldown = 0
+    with pytest.raises(TypeError):
+        fireball.attributes["cooldown"] = 0
+    with pytest.raises(ValueError):
+        AbilityRegistry.define(Spell("Shared Fireball", 1, 1, []))
+    with pytest.raises(KeyError):
+        AbilityRegistry.get("Unknown Spell")
+
+def test_cooldowns_are_kept_per_caster(fireball, goblin):
+    """
+    Test that mages knowing the same shared spell each have their own cooldown.
+    """
+    merlin = Mage("Merlin", spells=[fireball])
+    morgana = Mage("Morgana", spells=[fireball])
+    assert merlin.spells["Shared Fireball"] is morgana.spells["Shared Fireball"]
+
+    merlin.cast_spell("Shared Fireball", goblin, current_time=10)
+    morgana.cast_spell("Shared Fireball", goblin, current_time=12)
+    assert goblin.health == 60
+    assert merlin.cooldowns == {"Shared Fireball": 10}
+    assert fireball.last_cast_time is None
+
+    assert fireball.is_on_cooldown(13, merlin)
+    assert not fireball.is_on_cooldown(15, merlin)
+    assert fireball.is_on_cooldown(15, morgana)
+    assert not fireball.is_on_cooldown(15)
+
+    merlin.cast_spell("Shared Fireball", goblin, current_time=14)
+    assert goblin.health == 60
+    merlin.cast_spell("Shared Fireball", goblin, current_time=15)
+    assert goblin.health == 40
+
+def test_overlay_keeps_its_own_cooldowns(fireball, goblin):
+    """
+    Test that casting a shared spell through an overlay leaves the mage's cooldowns alone.
+    """
+    merlin = Mage("Merlin", spells=[fireball])
+    merlin.cast_spell("Shared Fireball", goblin, current_time=0)
+
+    what_if = merlin.overlay()
+    what_if.cast_spell("Shared Fireball", goblin.overlay(), current_time=6)
+
+    assert what_if.cooldowns == {"Shared Fireball": 6}
+    assert merlin.cooldowns == {"Shared Fireball": 0}
+
+def test_shared_spells_pickle_and_copy_by_name(fireball, goblin):
+    """
+    Test that pickling or copying a mage keeps its shared spells pointing at the registered definition.
+    """
+    merlin = Mage("Merlin", spells=[fireball])
+    merlin.cast_spell("Shared Fireball", goblin, current_time=3)
+
+    restored = pickle.loads(pickle.dumps(merlin))
+    assert restored.spells["Shared Fireball"] is fireball
+    assert restored.cooldowns == {"Shared Fireball": 3}
+    assert copy.deepcopy(merlin).spells["Shared Fireball"] is fireball
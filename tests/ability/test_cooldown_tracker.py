@@ -0,0 +1,118 @@
+import pytest
+from rpg_world import (
+    Character,
+    CharacterStats,
+    CooldownTracker,
+    Journal,
+    Mage,
+    SimpleChangeFormula,
+    Spell,
+    SpellEffect
+)
+
+@pytest.fixture
+def tracker():
+    """
+    Fixture starting a cooldown tracker for the duration of a test.
+    """
+    tracker = CooldownTracker.start()
+    yield tracker
+    CooldownTracker.stop()
+
+def make_spell(name, cooldown):
+    """
+    Create a cheap damage spell with the given cooldown.
+    """
+    return Spell(name, 0, cooldown, [SpellEffect("health", SimpleChangeFormula(-1))])
+
+def test_pop_ready_returns_pairs_in_ready_order(tracker):
+    """
+    Test that pop_ready returns each (caster, ability) pair once, when its cooldown has ended.
+    """
+    caster, other = object(), object()
+    slow, fast = make_spell("Slow", 10), make_spell("Fast", 2)
+    tracker.add(caster, slow, 0)
+    tracker.add(caster, fast, 0)
+    tracker.add(other, fast, 1)
+
+    assert len(tracker) == 3
+    assert tracker.next_ready_time() == 2
+    assert tracker.pop_ready(1.5) == []
+    assert tracker.pop_ready(3) == [(caster, fast), (other, fast)]
+    assert tracker.pop_ready(3) == []
+    assert tracker.is_on_cooldown(caster, slow, 9)
+    assert tracker.ready_time(caster, slow) == 10
+    assert tracker.pop_ready(10) == [(caster, slow)]
+    assert len(tracker) == 0
+    assert tracker.next_ready_time() is None
+
+def test_replaced_and_cancelled_cooldowns_are_skipped(tracker):
+    """
+    Test that restarting or cancelling a cooldown drops its previous entry.
+    """
+    caster = object()
+    spell, free = make_spell("Bolt", 5), make_spell("Free", 0)
+    tracker.add(caster, spell, 0)
+    tracker.add(caster, spell, 3)
+    tracker.add(caster, free, 0)
+
+    assert tracker.pop_ready(5) == []
+    assert tracker.next_ready_time() == 8
+    assert tracker.pop_ready(8) == [(caster, spell)]
+
+    tracker.add(caster, spell, 10)
+    assert tracker.cancel(caster, spell)
+    assert not tracker.cancel(caster, spell)
+    assert tracker.pop_ready(20) == []
+
+def test_many_restarts_keep_the_heap_small(tracker):
+    """
+    Test that stale entries left by restarted cooldowns are compacted away.
+    """
+    caster, spell = object(), make_spell("Bolt", 5)
+    for time in range(1000):
+        tracker.add(caster, spell, time)
+
+    assert len(tracker._heap) < 100
+    assert tracker.pop_ready(1004) == [(caster, spell)]
+
+def test_spell_cast_registers_cooldown(tracker):
+    """
+    Test that casting a spell starts its cooldown in the current tracker.
+    """
+    fireball = make_spell("Fireball", 4)
+    mage = Mage("Merlin", spells=[fireball])
+    goblin = Character("Goblin", CharacterStats(health=30))
+
+    mage.cast_spell("Fireball", goblin, current_time=1)
+
+    assert tracker.ready_time(mage, fireball) == 5
+    assert tracker.pop_ready(5) == [(mage, fireball)]
+
+def test_overlay_casts_are_not_tracked(tracker, tmp_path):
+    """
+    Test that casting through what-if copies neither starts tracked cooldowns nor writes to the journal.
+    """
+    mage = Mage("Merlin", spells=[make_spell("Fireball", 4)])
+    goblin = Character("Goblin", CharacterStats(health=30))
+    journal = Journal.start(str(tmp_path / "game.journal"))
+    try:
+        mage.overlay().cast_spell("Fireball", goblin.overlay(), current_time=1)
+        mage.overlay().cast_spell_area("Fireball", [goblin.overlay()], current_time=1)
+    finally:
+        Journal.stop()
+
+    assert len(tracker) == 0 and tracker.pop_ready(10) == []
+    assert journal.records_written == 0
+    assert goblin.health == 30
+
+def test_cast_without_tracker():
+    """
+    Test that spells are cast as before when no tracker is started.
+    """
+    assert CooldownTracker.current is None
+    fireball = make_spell("Fireball", 4)
+    goblin = Character("Goblin", CharacterStats(health=30))
+
+    assert fireball.cast(goblin, goblin, current_time=1)
+    assert fireball.is_on_cooldown(2)
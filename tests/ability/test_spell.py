@@ -0,0 +1,244 @@
+import logging
+import pickle
+import pytest
+from rpg_world import (
+    Character,
+    CharacterStats,
+    Effect,
+    Mage,
+    MultiEffectRecipientFormula,
+    MultiEffectTargetFormula,
+    SimpleChangeFormula,
+    SimpleChangeFormulaWithStatLimits,
+    Spell,
+    SpellEffect,
+    StatsStore
+)
+
+@pytest.fixture
+def ability_logging_at_info():
+    """
+    Fixture disabling debug logging of abilities, so casts use the compiled effects.
+    """
+    logger = logging.getLogger("rpg_world.ability")
+    level = logger.level
+    logger.setLevel(logging.INFO)
+    yield
+    logger.setLevel(level)
+
+def make_spell():
+    """
+    Create a spell using every kind of formula and both recipients.
+    """
+    return Spell("Mystic Blast", 0, 0, [
+        SpellEffect("health", MultiEffectRecipientFormula(), recipient="caster"),
+        SpellEffect("health", MultiEffectTargetFormula()),
+        SpellEffect("focus", SimpleChangeFormula(-15)),
+        SpellEffect("mana", SimpleChangeFormulaWithStatLimits(80), recipient="caster"),
+    ])
+
+def make_pair():
+    """
+    Create a caster and a target.
+    """
+    caster = Character("Merlin", CharacterStats(health=200, mana=100, focus=90, armor=10))
+    target = Character("Goblin", CharacterStats(health=80, focus=40, armor=10))
+    caster.stats.modify("mana", -50)
+    return caster, target
+
+def test_compiled_cast_matches_applying_each_effect(ability_logging_at_info):
+    """
+    Test that a compiled cast changes the same stats by the same amounts as applying each effect.
+    """
+    spell = make_spell()
+    caster, target = make_pair()
+    expected_caster, expected_target = make_pair()
+    for effect in spell.effects:
+        effect.apply(caster=expected_caster, target=expected_target, ability=spell)
+
+    assert spell.cast(caster, target, current_time=1)
+
+    assert "_pipeline" in spell.__dict__
+    assert dict(caster.stats.attributes) == dict(expected_caster.stats.attributes)
+    assert dict(target.stats.attributes) == dict(expected_target.stats.attributes)
+    # The limits are those of the spell's target, whose mana is full
+    assert caster.mana == 50
+
+def test_assigning_effects_recompiles(ability_logging_at_info):
+    """
+    Test that assigning new effects discards the compiled effects, and that pickling drops them.
+    """
+    spell = Spell("Zap", 0, 0, [SpellEffect("health", SimpleChangeFormula(-5))])
+    caster, target = make_pair()
+    spell.cast(caster, target, current_time=1)
+
+    spell.effects = [SpellEffect("health", SimpleChangeFormula(-20))]
+    assert "_pipeline" not in spell.__dict__
+    spell.cast(caster, target, current_time=2)
+    assert target.health == 55
+
+    restored = pickle.loads(pickle.dumps(spell))
+    assert "_pipeline" not in restored.__dict__
+    restored.cast(caster, target, current_time=3)
+    assert target.health == 35
+
+@pytest.mark.parametrize("level", [logging.INFO, logging.DEBUG])
+def test_changing_effects_in_place_recompiles(level):
+    """
+    Test that appending effects and changing an effect's formula, attribute or recipient take effect on
+    the next cast, the same with debug logging (applying each effect) as with the compiled effects.
+    """
+    logger = logging.getLogger("rpg_world.ability")
+    previous = logger.level
+    logger.setLevel(level)
+    try:
+        spell = Spell("Zap", 0, 0, [SpellEffect("health", SimpleChangeFormula(-10))])
+        caster, target = make_pair()
+        spell.cast(caster, target, current_time=1)
+
+        spell.effects.append(SpellEffect("health", SimpleChangeFormula(-10)))
+        spell.cast(caster, target, current_time=2)
+        assert target.health == 50
+
+        spell.effects[1].formula = SimpleChangeFormula(-1)
+        spell.effects[0].attribute = "focus"
+        spell.effects[0].recipient = "caster"
+        spell.cast(caster, target, current_time=3)
+        assert (target.health, caster.focus) == (49, 80)
+    finally:
+        logger.setLevel(previous)
+
+def test_effects_without_compile_are_applied(ability_logging_at_info):
+    """
+    Test that effects without a compile method, and effects without an attribute, are handled.
+    """
+    class Drain(Effect):
+        def apply(self, caster, target, **kwargs):
+            super().apply(target)
+            caster.stats.modify("health", 3)
+
+    spell = Spell("Drain", 0, 0, [Drain("health", SimpleChangeFormula(-3)), SpellEffect(None, SimpleChangeFormula(-1))])
+    spell.effects[0].compile = None
+    caster, target = make_pair()
+
+    spell.cast(caster, target, current_time=1)
+
+    assert (caster.health, target.health) == (203, 77)
+
+def test_overridden_effect_methods_and_cast_are_used(ability_logging_at_info):
+    """
+    Test that compiled and area casts call SpellEffect subclasses overriding amount_for(), and that
+    mages cast through an overridden Spell.cast().
+    """
+    class Doubled(SpellEffect):
+        def amount_for(self, target, **kwargs):
+            return 2 * super().amount_for(target, **kwargs)
+
+    class Fizzle(Spell):
+        def cast(self, caster, target, current_time):
+            return False
+
+    spell = Spell("Double Tap", 0, 0, [Doubled("health", SimpleChangeFormula(-5))])
+    caster, target = make_pair()
+    others = make_targets(2)
+
+    spell.cast(caster, target, current_time=1)
+    spell.cast_area(caster, others, current_time=2)
+    assert target.health == 70
+    assert [other.health for other in others] == [other.max_health - 10 for other in others]
+
+    mage = Mage("Merlin", spells=[Fizzle("Fizzle", 10, 0, [SpellEffect("health", SimpleChangeFormula(-5))])])
+    mage.cast_spell("Fizzle", target, current_time=1)
+    assert (mage.mana, target.health) == (100, 70)
+
+def make_targets(count):
+    """
+    Create targets with different stats, so limits and stat-based formulas differ per target.
+    """
+    return [Character(f"Goblin {i}", CharacterStats(health=20 + 10 * i, focus=10 * i, armor=i)) for i in range(count)]
+
+def attributes(characters):
+    """
+    Return the stats of each character as plain dictionaries.
+    """
+    return [dict(character.stats.attributes) for character in characters]
+
+def make_target_spell():
+    """
+    Create a spell whose effects all land on the target, which area casts apply in batches.
+    """
+    return Spell("Frost Nova", 0, 0, [
+        SpellEffect("health", MultiEffectTargetFormula()),
+        SpellEffect("focus", SimpleChangeFormula(-15)),
+        SpellEffect("mana", SimpleChangeFormulaWithStatLimits(80)),
+    ])
+
+@pytest.mark.parametrize("stored", [False, True])
+@pytest.mark.parametrize("spell_factory, pattern", [
+    (make_spell, [0, 1, 2, 3, 4]),
+    (make_target_spell, [0, 1, 2, 3, 4]),
+    (make_target_spell, [0, 1, 0, 2, 0]),
+])
+def test_cast_area_matches_casting_on_each_target(stored, spell_factory, pattern):
+    """
+    Test that an area cast changes every stat as casting the spell on each target in turn does,
+    with plain stats and with stats kept in a StatsStore, with effects on the caster and with
+    targets listed more than once.
+    """
+    if stored:
+        pytest.importorskip("numpy")
+    spell = spell_factory()
+    spell.effects.append(SpellEffect("health", SimpleChangeFormulaWithStatLimits(-45)))
+    caster, _ = make_pair()
+    characters = make_targets(5)
+    expected_caster, _ = make_pair()
+    expected_characters = make_targets(5)
+    if stored:
+        store = StatsStore(capacity=4)
+        for character in [caster] + characters:
+            store.attach(character.stats)
+
+    assert spell.cast_area(caster, [characters[index] for index in pattern], current_time=1)
+    for index in pattern:
+        spell.cast(expected_caster, expected_characters[index], current_time=1)
+
+    for actual, expected in zip(attributes([caster] + characters), attributes([expected_caster] + expected_characters)):
+        assert actual == pytest.approx(expected)
+
+@pytest.mark.parametrize("stored", [False, True])
+def test_area_limits_hold_for_repeated_recipients(stored):
+    """
+    Test that limited effects stop at the limits when a target is hit twice, or the caster is hit once per target.
+    """
+    if stored:
+        pytest.importorskip("numpy")
+    caster = Character("Merlin", CharacterStats(health=100, mana=100))
+    goblin = Character("Goblin", CharacterStats(health=10))
+    caster.stats.modify("health", -30)
+    if stored:
+        store = StatsStore(capacity=4)
+        for character in (caster, goblin):
+            store.attach(character.stats)
+
+    SpellEffect("health", SimpleChangeFormulaWithStatLimits(-15)).apply_area(caster, [goblin, goblin])
+    assert goblin.health == 0
+
+    Spell("Smite", 0, 0, [SpellEffect("health", SimpleChangeFormulaWithStatLimits(-50))]).cast_area(caster, [caster, caster], 1)
+    assert caster.health == 0
+
+def test_mage_area_cast_spends_mana_and_cooldown_once():
+    """
+    Test that an area cast spends mana once, starts the cooldown once and ignores empty target lists.
+    """
+    fireball = Spell("Fireball", 30, 10, [SpellEffect("health", SimpleChangeFormula(-25))])
+    mage = Mage("Merlin", spells=[fireball])
+    targets = make_targets(4)
+
+    mage.cast_spell_area("Fireball", [], current_time=0)
+    assert mage.mana == 100
+    mage.cast_spell_area("Fireball", targets, current_time=1)
+    mage.cast_spell_area("Fireball", targets, current_time=2)
+
+    assert mage.mana == 70
+    assert [target.health for target in targets] == [-5, 5, 15, 25]
+    assert fireball.is_on_cooldown(2)
@@ -0,0 +1,167 @@
+import pickle
+import pytest
+from rpg_world import (
+    AbilityRegistry,
+    Archetype,
+    Character,
+    CharacterStats,
+    Consumable,
+    Mage,
+    SimpleChangeFormula,
+    Spell,
+    SpellEffect
+)
+
+@pytest.fixture
+def goblin_archetype():
+    """
+    Fixture providing a goblin archetype with base stats and default loot.
+    """
+    potion = Consumable("Small Potion", "Restores 5 health", 2, [])
+    return Archetype("Goblin", stats={"health": 30, "mana": 0, "strength": 4}, loot=[potion])
+
+@pytest.fixture
+def acolyte_archetype():
+    """
+    Fixture providing a mage archetype that knows two shared spells, removed from the registry afterwards.
+    """
+    spells = [
+        AbilityRegistry.define(Spell("Fireball", 30, 10, [SpellEffect("health", SimpleChangeFormula(-25))])),
+        AbilityRegistry.define(Spell("Frostbolt", 20, 5, [SpellEffect("health", SimpleChangeFormula(-10))])),
+    ]
+    yield Archetype("Acolyte", character_class=Mage, stats={"health": 60, "mana": 100, "focus": 50}, spells=spells)
+    for spell in spells:
+        AbilityRegistry.remove(spell.name)
+
+def test_spawn_builds_characters_from_the_template(goblin_archetype):
+    """
+    Test that spawned characters get the archetype's stats, generated names and their own stats objects.
+    """
+    first = goblin_archetype.spawn(id="g1")
+    second = goblin_archetype.spawn(strength=6)
+
+    assert isinstance(first, Character)
+    assert first.id == "g1"
+    assert (first.name, second.name) == ("Goblin 0", "Goblin 1")
+    assert first.archetype is goblin_archetype
+    assert first.health == 30
+    assert (first.strength, second.strength) == (4, 6)
+
+    first.health -= 10
+    assert (first.health, second.health) == (20, 30)
+    assert first.stats is not second.stats
+
+def test_inventory_and_logger_are_created_on_first_use(goblin_archetype):
+    """
+    Test that spawned characters create their inventory, holding the default loot, and logger lazily.
+    """
+    goblin = goblin_archetype.spawn()
+    assert "inventory" not in goblin.__dict__
+    assert "logger" not in goblin.__dict__
+
+    assert [item.name for item in goblin.inventory.items] == ["Small Potion"]
+    goblin.inventory.add_item(Consumable("Dagger", "Rusty", 1, []))
+    # The default loot is shared, but each inventory is not
+    assert len(goblin_archetype.spawn().inventory.items) == 1
+    assert len(goblin.inventory.items) == 2
+
+    goblin.logger.info("%s growls.", goblin.name)
+    assert "logger" in goblin.__dict__
+
+def test_spawned_mages_share_spells_until_they_learn_one(acolyte_archetype):
+    """
+    Test that spawned mages share the archetype's spells and copy them before learning or forgetting one.
+    """
+    first = acolyte_archetype.spawn()
+    second = acolyte_archetype.spawn()
+    assert first.spells is second.spells is acolyte_archetype.spells
+
+    first.learn_spell(Spell("Heal", 10, 0, [SpellEffect("health", SimpleChangeFormula(15))]))
+    second.forget_spell("Frostbolt")
+
+    assert set(first.spells) == {"Fireball", "Frostbolt", "Heal"}
+    assert set(second.spells) == {"Fireball"}
+    assert set(acolyte_archetype.spells) == {"Fireball", "Frostbolt"}
+
+def test_shared_spells_are_read_only(acolyte_archetype):
+    """
+    Test that the spells spawned mages share cannot be changed through one of them.
+    """
+    first, second = acolyte_archetype.spawn_many(2)
+
+    with pytest.raises(TypeError):
+        first.spells["Frostbolt"] = first.spells["Fireball"]
+    first.forget_spell("Frostbolt")
+
+    assert set(first.spells) == {"Fireball"}
+    assert set(second.spells) == set(acolyte_archetype.spells) == {"Fireball", "Frostbolt"}
+
+def test_spawned_mages_cast_spells(acolyte_archetype, goblin_archetype):
+    """
+    Test that a spawned mage casts the archetype's spells like a mage created through __init__.
+    """
+    acolyte = acolyte_archetype.spawn()
+    goblin = goblin_archetype.spawn()
+
+    acolyte.cast_spell("Frostbolt", goblin, current_time=0)
+
+    assert goblin.health == 20
+    assert acolyte.mana == 80
+
+def test_spawned_mages_have_their_own_cooldowns(acolyte_archetype, goblin_archetype):
+    """
+    Test that one spawned mage casting a spell does not put it on cooldown for the others.
+    """
+    first, second = acolyte_archetype.spawn_many(2)
+    goblin = goblin_archetype.spawn()
+
+    first.cast_spell("Frostbolt", goblin, current_time=0)
+    second.cast_spell("Frostbolt", goblin, current_time=1)
+
+    assert goblin.health == 10
+    assert (first.mana, second.mana) == (80, 80)
+
+def test_spells_that_keep_their_own_cooldown_are_rejected():
+    """
+    Test that archetypes refuse spells that are not shared definitions.
+    """
+    with pytest.raises(ValueError, match="AbilityRegistry"):
+        Archetype("Acolyte", character_class=Mage, spells=[Spell("Spark", 5, 10, [])])
+
+def test_mages_without_spells_can_learn_them():
+    """
+    Test that a mage spawned from an archetype without spells starts with none and can learn them.
+    """
+    apprentice = Archetype("Apprentice", character_class=Mage, stats={"health": 40, "mana": 40}).spawn()
+    assert dict(apprentice.spells) == {}
+
+    apprentice.learn_spell(Spell("Spark", 5, 0, []))
+    assert set(apprentice.spells) == {"Spark"}
+    assert dict(Mage.spells) == {}
+
+def test_spawned_characters_pickle(acolyte_archetype):
+    """
+    Test that spawned characters survive pickling with their stats, name and spells.
+    """
+    acolyte = acolyte_archetype.spawn(id="a1", name="Yara", mana=70)
+    restored = pickle.loads(pickle.dumps(acolyte))
+
+    assert (restored.id, restored.name, restored.mana) == ("a1", "Yara", 70)
+    assert set(restored.spells) == {"Fireball", "Frostbolt"}
+    assert isinstance(restored.stats, CharacterStats)
+    assert restored.spells is restored.archetype.spells
+
+def test_spawn_many(goblin_archetype):
+    """
+    Test that spawn_many creates independent characters with the given ids and consecutive names.
+    """
+    goblin_archetype.spawn()
+    goblins = goblin_archetype.spawn_many(3, ids=["a", "b", "c"])
+
+    assert [goblin.id for goblin in goblins] == ["a", "b", "c"]
+    assert [goblin.name for goblin in goblins] == ["Goblin 1", "Goblin 2", "Goblin 3"]
+    assert len({id(goblin.stats) for goblin in goblins}) == 3
+    assert goblin_archetype.spawn_many(2)[0].id is None
+
+    with pytest.raises(ValueError):
+        goblin_archetype.spawn_many(2, ids=["x"])
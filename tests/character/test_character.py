@@ -2,7 +2,8 @@ import pytest
 from rpg_world import (
     Character,
     CharacterStats,
-    Consumable
+    Consumable,
+    Stats
 )
 
 class Warrior(Character):
@@ -113,3 +114,72 @@ def test_warrior_id(conan, enemy_orc):
     # Assign an ID to enemy_orc and verify
     enemy_orc.id = "orc_id"
     assert enemy_orc.id == "orc_id"
+
+def test_overlay_isolates_stat_changes(conan, enemy_orc):
+    """
+    Test that changes made through an overlay stay in its snapshot until committed.
+    """
+    what_if = conan.overlay()
+    assert isinstance(what_if, Warrior)
+    assert what_if.name == "Conan" and what_if.strength == 20
+
+    what_if.health -= enemy_orc.strength
+    what_if.stats.modify("strength", 5)
+    assert what_if.health == 85 and what_if.strength == 25
+    assert conan.health == 100 and conan.strength == 20
+
+    what_if.stats.discard()
+    assert what_if.health == 100
+
+    what_if.health = 40
+    what_if.stats.commit()
+    assert conan.health == 40
+
+def test_stats_are_exposed_as_properties(conan):
+    """
+    Test that core stats are generated properties, extra stats are readable, and other attributes bypass the stats.
+    """
+    assert isinstance(Character.__dict__["health"], property)
+    assert "health" not in conan.__dict__
+
+    conan.health = 75
+    assert conan.stats.health == 75 and conan.health == 75
+
+    conan.stats.set("rage", 3)
+    assert conan.rage == 3
+    assert "rage" not in Character.__dict__
+    conan.stats.set("rage", 9)
+    assert conan.rage == 9
+
+    conan.battle_cry = "For Crom!"
+    assert "battle_cry" not in conan.stats
+
+    other = Character(name="Plain", stats=CharacterStats())
+    assert not hasattr(other, "rage")
+    with pytest.raises(AttributeError):
+        other.strength
+
+def test_registered_stats_do_not_shadow_instance_attributes():
+    """
+    Test that a stat registered by any Stats object does not turn a character attribute with the same name into a stat.
+    """
+    Stats(level=3)
+
+    class Squire(Character):
+        def __init__(self, name, stats):
+            super().__init__(name, stats)
+            self.level = 1
+
+    squire = Squire("Pip", CharacterStats())
+    assert squire.__dict__["level"] == 1
+    assert squire.stats.get("level") is None
+
+def test_extra_stats_are_written_through(conan):
+    """
+    Test that assigning an additional stat through the character changes the stat itself.
+    """
+    conan.strength = 25
+
+    assert "strength" not in conan.__dict__
+    assert conan.stats.get("strength") == 25
+    assert conan.strength == 25
@@ -0,0 +1,180 @@
+import threading
+import pytest
+from rpg_world import (
+    ActionQueue,
+    Character,
+    CharacterStats,
+    Consumable,
+    Effect,
+    Equipment,
+    Mage,
+    SimpleChangeFormula,
+    Spell,
+    SpellEffect
+)
+
+def make_mage(name, mana=100):
+    """
+    Create a mage knowing a cheap bolt and an expensive area spell.
+    """
+    return Mage(name, mana=mana, spells=[
+        Spell("Bolt", 30, 5, [SpellEffect("health", SimpleChangeFormula(-10))]),
+        Spell("Nova", 60, 0, [SpellEffect("health", SimpleChangeFormula(-5))]),
+    ])
+
+@pytest.fixture
+def goblins():
+    """
+    Fixture providing three goblins with 20 health.
+    """
+    return [Character(f"Goblin {i}", CharacterStats(health=20), id=f"goblin-{i}") for i in range(3)]
+
+def test_nothing_is_applied_until_resolved(goblins):
+    """
+    Test that submitted intents only take effect when the queue is resolved.
+    """
+    queue = ActionQueue()
+    merlin = make_mage("Merlin")
+    queue.cast(merlin, "Bolt", goblins[0])
+
+    assert len(queue) == 1
+    assert goblins[0].health == 20
+    applied, rejected = queue.resolve(current_time=1)
+
+    assert len(applied) == 1 and rejected == []
+    assert goblins[0].health == 10
+    assert merlin.mana == 70
+    assert len(queue) == 0
+
+def test_batch_validation_counts_earlier_intents(goblins):
+    """
+    Test that mana and cooldowns used by earlier intents of the batch reject later ones, with reasons.
+    """
+    queue = ActionQueue()
+    merlin = make_mage("Merlin")
+    queue.cast(merlin, "Bolt", goblins[0])
+    queue.cast(merlin, "Bolt", goblins[1])
+    queue.cast_area(merlin, "Nova", goblins)
+    queue.cast(merlin, "Frost", goblins[2])
+    queue.cast(make_mage("Broke", mana=10), "Bolt", goblins[2])
+
+    applied, rejected = queue.resolve(current_time=1)
+
+    assert [intent.subject for intent in applied] == ["Bolt", "Nova"]
+    assert sorted(intent.reason for intent in rejected) == ["not enough mana", "on cooldown", "unknown spell"]
+    assert [goblin.health for goblin in goblins] == [5, 15, 15]
+    assert merlin.mana == 10
+
+def test_dead_actors_and_targets_are_rejected(goblins):
+    """
+    Test that dead casters and dead targets are rejected, and dead targets are left out of area casts.
+    """
+    queue = ActionQueue()
+    merlin = make_mage("Merlin")
+    goblins[0].health = 0
+    queue.cast(merlin, "Bolt", goblins[0])
+    queue.cast_area(merlin, "Nova", goblins)
+    queue.cast(goblins[0], "Bolt", goblins[1])
+
+    applied, rejected = queue.resolve(current_time=1)
+
+    assert [intent.reason for intent in rejected] == ["target is dead", "actor is dead"]
+    assert applied[0].targets == (goblins[1], goblins[2])
+    assert [goblin.health for goblin in goblins] == [0, 15, 15]
+
+def test_resolution_order_is_deterministic(goblins):
+    """
+    Test that intents resolve by priority, then actor, then submission order, however they were submitted.
+    """
+    queue = ActionQueue()
+    alice, bob = make_mage("Alice"), make_mage("Bob")
+    queue.cast(bob, "Bolt", goblins[0])
+    queue.cast(alice, "Nova", goblins[1])
+    queue.cast(alice, "Bolt", goblins[1])
+    queue.cast(bob, "Nova", goblins[2], priority=1)
+
+    applied, _ = queue.resolve(current_time=1)
+
+    assert [(intent.actor.name, intent.subject) for intent in applied] == [
+        ("Bob", "Nova"), ("Alice", "Nova"), ("Alice", "Bolt"), ("Bob", "Bolt")
+    ]
+
+def test_items_are_used_and_equipped():
+    """
+    Test use, equip and unequip intents, including rejections for used and already equipped items.
+    """
+    queue = ActionQueue()
+    hero = Character("Hero", CharacterStats(health=50, armor=0))
+    potion = Consumable("Potion", "Heals", 5, [Effect("health", SimpleChangeFormula(20))])
+    shield = Equipment("Shield", "Blocks", 10, [Effect("armor", SimpleChangeFormula(5))])
+    queue.use(hero, potion)
+    queue.use(hero, potion)
+    queue.equip(hero, shield)
+    queue.equip(hero, shield)
+    queue.unequip(hero, Equipment("Helmet", "Shiny", 3, []))
+
+    applied, rejected = queue.resolve(current_time=0)
+
+    assert [intent.kind for intent in applied] == ["use", "equip"]
+    assert [intent.reason for intent in rejected] == ["item already used", "item already equipped", "item not equipped"]
+    assert (hero.health, hero.armor) == (70, 5)
+
+def test_only_the_wearer_can_unequip():
+    """
+    Test that an item equipped by one character cannot be unequipped by another.
+    """
+    queue = ActionQueue()
+    hero = Character("Hero", CharacterStats(armor=0))
+    thief = Character("Thief", CharacterStats(armor=0))
+    shield = Equipment("Shield", "Blocks", 10, [Effect("armor", SimpleChangeFormula(5))])
+    shield.equip(hero)
+    queue.unequip(thief, shield)
+
+    applied, rejected = queue.resolve(current_time=0)
+
+    assert applied == [] and [intent.reason for intent in rejected] == ["item equipped by another character"]
+    assert shield.wearer is hero and hero.armor == 5
+
+    queue.unequip(hero, shield)
+    applied, _ = queue.resolve(current_time=0)
+    assert len(applied) == 1
+    assert shield.wearer is None and hero.armor == 0
+
+@pytest.mark.parametrize("mana, current_time", [(100, 1), (10, 1), (100, 3)])
+def test_queue_and_mage_validate_casts_alike(goblins, mana, current_time):
+    """
+    Test that the queue accepts exactly the casts Mage.cast_spell performs, since both use Spell.check_cast.
+    """
+    queued, direct = make_mage("Merlin", mana=mana), make_mage("Merlin", mana=mana)
+    for mage in (queued, direct):
+        mage.spells["Bolt"].record_cast(mage, 0)
+
+    reason = direct.spells["Bolt"].check_cast(direct, current_time)
+    queue = ActionQueue()
+    queue.cast(queued, "Bolt", goblins[0])
+    _, rejected = queue.resolve(current_time)
+    direct.cast_spell("Bolt", goblins[1], current_time)
+
+    assert [intent.reason for intent in rejected] == ([] if reason is None else [reason])
+    assert (queued.mana, goblins[0].health) == (direct.mana, goblins[1].health)
+
+def test_submissions_from_threads(goblins):
+    """
+    Test that intents submitted from several threads are all kept.
+    """
+    queue = ActionQueue()
+    mages = [make_mage(f"Mage {i}") for i in range(8)]
+
+    def submit(mage):
+        for _ in range(50):
+            queue.cast(mage, "Bolt", goblins[0])
+
+    threads = [threading.Thread(target=submit, args=(mage,)) for mage in mages]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(queue) == 400
+    with pytest.raises(ValueError):
+        queue.submit("dance", mages[0], None)
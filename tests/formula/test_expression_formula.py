@@ -0,0 +1,103 @@
+import pickle
+import pytest
+from rpg_world import (
+    Character,
+    CharacterStats,
+    ExpressionFormula,
+    MultiEffectRecipientFormula,
+    MultiEffectTargetFormula,
+    SimpleChangeFormulaWithStatLimits,
+    Spell,
+    SpellEffect
+)
+
+def make_pair():
+    """
+    Create a caster and a target.
+    """
+    caster = Character("Merlin", CharacterStats(health=200, mana=100, focus=90, armor=10))
+    target = Character("Goblin", CharacterStats(health=80, focus=40, armor=20))
+    return caster, target
+
+def test_expression_matches_formula_subclasses():
+    """
+    Test that expressions calculate the same values as the equivalent Formula subclasses.
+    """
+    caster, target = make_pair()
+    target_formula = ExpressionFormula("-(50 + target.focus * 0.5) * (1 - target.armor / 100)")
+    recipient_formula = ExpressionFormula("-(50 + recipient.focus * 0.1) * (1 - recipient.armor / 100)")
+
+    assert target_formula.calculate(target=target) == MultiEffectTargetFormula().calculate(target=target)
+    assert (recipient_formula.calculate(recipient=caster)
+            == MultiEffectRecipientFormula().calculate(recipient=caster))
+
+def test_expression_reads_every_namespace():
+    """
+    Test that expressions read the caster's, target's and recipient's stats, the ability's
+    attributes, and call the allowed functions.
+    """
+    caster, target = make_pair()
+    spell = Spell("Drain", 30, 0, [])
+    formula = ExpressionFormula(
+        "-max(ability.mana_cost, caster.focus - target.focus) + abs(recipient.armor) if caster.mana > 50 else 0"
+    )
+
+    assert formula.calculate(caster=caster, target=target, recipient=caster, ability=spell) == -40
+    caster.stats.set("mana", 10)
+    assert formula.calculate(caster=caster, target=target, recipient=caster, ability=spell) == 0
+
+def test_with_limits_matches_stat_limits_formula():
+    """
+    Test that with_limits keeps the target's attribute within its limits, like SimpleChangeFormulaWithStatLimits.
+    """
+    caster, target = make_pair()
+    target.stats.modify("health", -30)
+    heal = ExpressionFormula("caster.focus").with_limits()
+
+    assert heal.limits
+    assert heal.function is ExpressionFormula("caster.focus").function
+    for attribute in ("health", "focus"):
+        assert (heal.calculate(caster=caster, target=target, attribute=attribute)
+                == SimpleChangeFormulaWithStatLimits(90).calculate(target=target, attribute=attribute))
+    assert ExpressionFormula("-500").with_limits().calculate(target=target, attribute="health") == -50
+
+def test_spells_with_expressions_cast_and_pickle():
+    """
+    Test that spells apply expression formulas, single-target and area, and survive pickling.
+    """
+    caster, target = make_pair()
+    spell = Spell("Siphon", 10, 0, [
+        SpellEffect("health", ExpressionFormula("-caster.focus / 3")),
+        SpellEffect("mana", ExpressionFormula("-caster.focus * 2").with_limits()),
+    ])
+
+    assert spell.cast(caster, target, current_time=0)
+    assert (target.health, target.mana) == (50, 0)
+
+    others = [Character(f"Rat {index}", CharacterStats(health=40, mana=200)) for index in range(3)]
+    spell.cast_area(caster, others, current_time=10)
+    assert [(other.health, other.mana) for other in others] == [(10, 20)] * 3
+
+    restored = pickle.loads(pickle.dumps(spell))
+    assert restored.effects[1].formula.limits
+    assert restored.effects[0].formula.calculate(caster=caster) == -30
+
+@pytest.mark.parametrize("expression", [
+    "target.fokus",
+    "target",
+    "enemy.health",
+    "target.stats.health",
+    "__import__('os')",
+    "round(target.focus, ndigits=1)",
+    "'health'",
+    "[target.health]",
+    "target.health[0]",
+    "lambda: 1",
+    "1 +",
+])
+def test_invalid_expressions_are_rejected(expression):
+    """
+    Test that unknown stats and names, other calls and unsupported syntax are rejected when the formula is created.
+    """
+    with pytest.raises(ValueError):
+        ExpressionFormula(expression)
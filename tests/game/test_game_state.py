@@ -1,5 +1,6 @@
 import pytest
 from rpg_world import (
+    Archetype,
     GameState,
     Character,
     Quest,
@@ -125,3 +126,31 @@ def test_update_quests_assert_error(game_state):
 
     with pytest.raises(AssertionError, match="Quest must have an 'id' attribute"):
         game_state.update_quests(mock_quest_no_id)
+
+def test_spawn_many(game_state):
+    """
+    Test that spawn_many registers characters with sequential ids and lazily created inventories.
+    """
+    goblins = Archetype("Goblin", stats={"health": 30, "mana": 0})
+    first = game_state.spawn_many(goblins, 3)
+    second = game_state.spawn_many(goblins, 2, id_prefix="grunt")
+
+    assert [goblin.id for goblin in first] == ["Goblin-0", "Goblin-1", "Goblin-2"]
+    assert [goblin.id for goblin in second] == ["grunt-3", "grunt-4"]
+    assert [goblin.name for goblin in second] == ["Goblin 3", "Goblin 4"]
+    assert len(game_state.characters) == 5
+    assert game_state.characters["Goblin-1"] is first[1]
+    assert "inventory" not in first[0].__dict__
+    assert first[0].inventory.items == []
+
+def test_spawn_many_rejects_taken_ids(game_state):
+    """
+    Test that spawn_many raises ValueError and adds nothing when an id is already taken.
+    """
+    goblins = Archetype("Goblin")
+    game_state.add_character(Character(name="Impostor", stats=CharacterStats(), id="Goblin-1"))
+
+    with pytest.raises(ValueError):
+        game_state.spawn_many(goblins, 3)
+    assert list(game_state.characters) == ["Goblin-1"]
+    assert goblins.spawned == 0
@@ -3,8 +3,13 @@ from rpg_world import (
     Equipment,
     Effect,
     SimpleChangeFormula,
+    SimpleChangeFormulaWithStatLimits,
     Character,
-    CharacterStats
+    CharacterStats,
+    Journal,
+    JournalReader,
+    MultiEffectRecipientFormula,
+    SpellEffect
 )
 
 # Mock effect class for testing
@@ -102,6 +107,22 @@ def test_equipment_use_toggle():
     assert character.stats.get("health") == 50  # 60 - 10
     assert character.stats.get("strength") == 30  # 35 - 5
 
+def test_equipment_unequip_by_another_character_is_refused():
+    """
+    Test that only the wearer can unequip an item, so its bonus cannot be stranded or stacked.
+    """
+    sword = Equipment("Sword", "Sharp", 10, [Effect("strength", SimpleChangeFormula(5))])
+    wearer = Character("Arthur", CharacterStats(strength=20))
+    other = Character("Mordred", CharacterStats(strength=20))
+    sword.equip(wearer)
+
+    sword.unequip(other)
+    assert sword.equipped and sword.wearer is wearer
+    assert (wearer.strength, other.strength) == (25, 20)
+
+    sword.unequip(wearer)
+    assert not sword.equipped and wearer.strength == 20
+
 def test_equipment_str_representation():
     # Create mock effects and an equipment
     effect1 = MockEffect("health", SimpleChangeFormula(10))
@@ -112,3 +133,78 @@ def test_equipment_str_representation():
     # Check the string representation of the equipment
     expected_str = "Item: Sword, Value: 150, Description: A sharp blade., Effects: MockEffect(health), MockEffect(strength)"
     assert str(equipment) == expected_str
+
+def test_equipment_layers_survive_damage_and_other_equipment():
+    # Create a mock character and two pieces of equipment
+    character = MockCharacter("Hero", health=50, strength=30)
+    sword = Equipment("Sword", "A sharp blade.", 150, [MockEffect("strength", SimpleChangeFormula(5)), MockEffect("strength", SimpleChangeFormula(2))])
+    ring = Equipment("Ring", "A ring of vigor.", 80, [MockEffect("health", SimpleChangeFormula(20))])
+
+    sword.equip(character)
+    ring.equip(character)
+    assert character.stats.get("strength") == 37  # 30 + 5 + 2
+    assert character.stats.get("health") == 70  # 50 + 20
+
+    # Damage changes the effective value; the base follows
+    character.stats.modify("health", -30)
+    assert character.stats.base("health") == 20
+
+    # Unequipping removes only that item's layers
+    sword.unequip(character)
+    assert character.stats.get("strength") == 30
+    ring.unequip(character)
+    assert character.stats.get("health") == 20
+    assert character.stats.base("health") == 20
+
+def test_equipment_unequip_does_not_rerun_formulas():
+    # A formula that depends on the current value would give a different amount on unequip
+    character = MockCharacter("Hero", health=50, strength=30)
+    equipment = Equipment("Amulet", "Doubles strength.", 300, [MockEffect("strength", SimpleChangeFormulaWithStatLimits(0))])
+    equipment.effects[0].formula.calculate = lambda **kwargs: kwargs["target"].stats.get("strength")
+
+    equipment.equip(character)
+    assert character.stats.get("strength") == 60
+    character.stats.modify("strength", 10)
+    equipment.unequip(character)
+    assert character.stats.get("strength") == 40
+
+def test_equipment_uses_the_amount_hook_and_effects_with_side_effects():
+    # Subclasses change the amount through amount_for, and effects that are not modifiers use apply/unapply
+    class DoubledEffect(Effect):
+        def amount_for(self, target, **kwargs):
+            return 2 * super().amount_for(target, **kwargs)
+
+    class MarkingEffect(Effect):
+        as_modifier = False
+
+        def apply(self, target, **kwargs):
+            super().apply(target, **kwargs)
+            target.marked = True
+
+        def unapply(self, target, **kwargs):
+            super().unapply(target, **kwargs)
+            target.marked = False
+
+    character = MockCharacter("Hero", health=50, strength=30)
+    ring = Equipment("Ring", "A marked ring.", 80, [DoubledEffect("strength", SimpleChangeFormula(5)), MarkingEffect("health", SimpleChangeFormula(10))])
+
+    ring.equip(character)
+    assert (character.stats.get("strength"), character.stats.get("health"), character.marked) == (40, 60, True)
+    ring.unequip(character)
+    assert (character.stats.get("strength"), character.stats.get("health"), character.marked) == (30, 50, False)
+
+def test_equipment_spell_effects_and_journal(tmp_path):
+    # Spell effects see the wearer as caster and recipient, and equips and unequips are journaled
+    character = MockCharacter("Hero", health=50, strength=30)
+    amulet = Equipment("Amulet", "Focus ward.", 300, [SpellEffect("armor", MultiEffectRecipientFormula())])
+    journal = Journal.start(str(tmp_path / "equip.journal"), buffer_records=4)
+    try:
+        amulet.equip(character)
+        amount = character.stats.get("armor")
+        amulet.unequip(character)
+    finally:
+        Journal.stop()
+
+    assert amount == MultiEffectRecipientFormula().calculate(recipient=MockCharacter("Other", health=50, strength=30))
+    assert character.stats.get("armor") == 0
+    assert [record.delta for record in JournalReader(journal.path)] == [amount, -amount]
@@ -1,9 +1,13 @@
+import copy
+import pickle
 import pytest
 from rpg_world import (
     Character,
     CharacterStats,
     Effect,
-    SimpleChangeFormula
+    SimpleChangeFormula,
+    SimpleChangeFormulaWithStatLimits,
+    Stats
 )
 
 @pytest.fixture
@@ -76,3 +80,197 @@ def test_character_alive_status(arcanist):
     health_effect.apply(arcanist)
     
     assert not arcanist.is_alive(), f"{arcanist.name} should be dead after taking 120 damage."
+
+def test_core_stats_use_fixed_storage():
+    """
+    Test that core stats live in slots and instances have no per-instance __dict__.
+    """
+    stats = CharacterStats(health=50)
+    assert not hasattr(stats, "__dict__")
+    assert stats.max_health == 50
+    stats.health = 40
+    stats.modify("health", -15)
+    assert stats.get("health") == 25
+    assert stats.attributes["health"] == 25
+
+def test_extra_stats_use_overflow_dict():
+    """
+    Test that additional attributes are stored, read, modified and listed alongside the core stats.
+    """
+    stats = CharacterStats(health=50, strength=12)
+    stats.modify("strength", 3)
+    stats.luck = 7
+    stats.attributes["agility"] = 4
+
+    assert stats.strength == 15
+    assert stats.get("luck") == 7
+    assert stats.get("missing") is None
+    assert "agility" in stats and "missing" not in stats
+    assert list(stats.attributes) == list(CharacterStats.CORE_FIELDS) + ["strength", "luck", "agility"]
+    assert str(stats).endswith("armor: 0, strength: 15, luck: 7, agility: 4)")
+    with pytest.raises(AttributeError):
+        stats.missing
+
+def test_core_stats_given_by_keyword_use_their_slots():
+    """
+    Test that maximums passed as keywords set the core slots instead of landing in the overflow dict.
+    """
+    stats = CharacterStats(health=150, max_health=200, max_mana=50, strength=4)
+
+    assert (stats.health, stats.max_health, stats.mana, stats.max_mana) == (150, 200, 100, 50)
+    assert stats.get("max_health") == 200
+    assert stats._extra == {"strength": 4}
+    assert len(stats.attributes) == len(dict(stats.attributes)) == 8
+
+def test_modify_missing_extra_stat_starts_at_zero():
+    """
+    Test that modifying an attribute that does not exist yet creates it, as Stats does.
+    """
+    stats = CharacterStats()
+    stats.modify("rage", 5)
+    assert stats.rage == 5
+
+def test_core_stats_cannot_be_deleted():
+    """
+    Test that the attributes view refuses to remove core stats but removes additional ones.
+    """
+    stats = CharacterStats(luck=1)
+    del stats.attributes["luck"]
+    assert "luck" not in stats
+    with pytest.raises(KeyError):
+        del stats.attributes["health"]
+
+def test_character_stats_copy_and_pickle():
+    """
+    Test that slotted stats survive deepcopy and pickling with all their attributes.
+    """
+    stats = CharacterStats(health=70, luck=3)
+    stats.modify("health", -20)
+
+    for restored in (copy.deepcopy(stats), pickle.loads(pickle.dumps(stats))):
+        assert dict(restored.attributes) == dict(stats.attributes)
+        assert restored.health == 50 and restored.luck == 3
+
+# (CharacterStats(health=80, mana=30, strength=7) with health set to 50, Stats(gold=5)) pickled before
+# the stats had slots, when their state was their __dict__
+LEGACY_PICKLE = (
+    b"\x80\x02crpg_world.stats.character_stats\nCharacterStats\nq\x00)\x81q\x01}q\x02X\n\x00\x00\x00"
+    b"attributesq\x03}q\x04(X\x06\x00\x00\x00healthq\x05K2X\n\x00\x00\x00max_healthq\x06KPX\x04"
+    b"\x00\x00\x00manaq\x07K\x1eX\x08\x00\x00\x00max_manaq\x08K\x1eX\x05\x00\x00\x00focusq\tKdX\t"
+    b"\x00\x00\x00max_focusq\nKdX\x05\x00\x00\x00armorq\x0bK\x00X\x08\x00\x00\x00strengthq\x0cK\x07"
+    b"usbcrpg_world.stats.stats\nStats\nq\r)\x81q\x0e}q\x0fh\x03}q\x10X\x04\x00\x00\x00goldq\x11K\x05ssb"
+    b"\x86q\x12."
+)
+
+def test_stats_pickled_before_slots_load():
+    """
+    Test that stats pickled in the old __dict__ format load with their values in place.
+    """
+    character_stats, stats = pickle.loads(LEGACY_PICKLE)
+
+    assert (character_stats.health, character_stats.max_health, character_stats.mana) == (50, 80, 30)
+    assert character_stats.get("strength") == 7
+    assert "attributes" not in character_stats
+    character_stats.modify("health", -10)
+    assert character_stats.health == 40
+
+    assert stats.get("gold") == 5
+    stats.modify("gold", 2)
+    assert stats.gold == 7
+
+def test_modify_many_clamps_like_apply_limits(arcanist):
+    """
+    Test that modify_many sums changes per attribute and limits them like Formula.apply_limits.
+    """
+    stats = arcanist.stats
+    stats.health = 100
+    applied = stats.modify_many([("health", 50), ("health", -10), ("mana", -500), ("armor", 5), ("rage", 3)])
+
+    assert applied == {"health": 20, "mana": -80, "armor": 5, "rage": 3}
+    assert (stats.health, stats.mana, stats.armor, stats.rage) == (120, 0, 15, 3)
+    for attribute in ("health", "mana"):
+        assert SimpleChangeFormulaWithStatLimits(-1000).calculate(target=arcanist, attribute=attribute) == -stats.get(attribute)
+
+def test_modify_many_without_clamp(arcanist):
+    """
+    Test that modify_many applies changes unchanged when clamping is off.
+    """
+    assert arcanist.stats.modify_many({"health": 1000, "focus": -500}, clamp=False) == {"health": 1000, "focus": -500}
+    assert arcanist.health == 1120
+    assert arcanist.focus == -400
+
+def test_apply_deltas_across_characters(arcanist):
+    """
+    Test that apply_deltas groups a batch of triples per character and reports the applied changes.
+    """
+    rogue = Character(name="Rogue", stats=CharacterStats(health=50, mana=10))
+    applied = Stats.apply_deltas([
+        (arcanist, "health", -30),
+        (rogue, "health", -80),
+        (arcanist, "health", -10),
+        (rogue, "mana", 5),
+    ])
+
+    assert applied == {(arcanist, "health"): -40, (rogue, "health"): -50, (rogue, "mana"): 0}
+    assert arcanist.health == 80
+    assert not rogue.is_alive()
+
+@pytest.mark.parametrize("stats", [CharacterStats(health=50, luck=1), Stats(health=50, luck=1)], ids=["CharacterStats", "Stats"])
+def test_versions_and_dirty_tracking(stats):
+    """
+    Test that every write gives an attribute a new, higher version and marks it dirty until drained.
+    """
+    assert stats.version("health") == 0
+    assert stats.drain_dirty() == set()
+
+    stats.modify("health", -5)
+    first = stats.version("health")
+    stats.health = 10
+    assert stats.version("health") > first > 0
+    stats.set("luck", 2)
+    stats.modify_many({"mana": 0})
+
+    assert stats.dirty == {"health", "luck", "mana"}
+    assert stats.drain_dirty() == {"health", "luck", "mana"}
+    assert stats.drain_dirty() == set()
+
+    version = stats.version("luck")
+    stats.luck = 3
+    assert stats.dirty == {"luck"}
+    assert stats.version("luck") > version
+
+def test_modifier_layers():
+    """
+    Test that additive and multiplicative layers combine as (base + adds) * mults and can be removed by source.
+    """
+    stats = CharacterStats(armor=10)
+    stats.add_modifier("shield", "armor", add=5)
+    stats.add_modifier("blessing", "armor", mult=2)
+    assert stats.armor == 30
+    assert stats.base("armor") == 10
+
+    stats.add_modifier("shield", "armor", add=10)  # Replaces the shield's layer
+    assert stats.armor == 40
+
+    stats.remove_modifier("blessing")
+    assert stats.armor == 20
+    stats.remove_modifier("shield", "armor")
+    assert stats.armor == 10
+    assert stats.base("armor") == 10
+
+    with pytest.raises(ValueError):
+        stats.add_modifier("curse", "armor", mult=0)
+
+def test_modifier_layers_follow_external_writes():
+    """
+    Test that writes between layer changes move the base value, and layers survive pickling.
+    """
+    stats = CharacterStats(health=100)
+    stats.add_modifier("rage", "health", mult=1.5)
+    assert stats.health == 150
+    stats.modify("health", -60)
+    assert stats.base("health") == 60
+
+    restored = pickle.loads(pickle.dumps(stats))
+    restored.remove_modifier("rage")
+    assert restored.health == 60
@@ -0,0 +1,71 @@
+import pickle
+from rpg_world import (
+    CharacterStats,
+    Effect,
+    SimpleChangeFormulaWithStatLimits,
+    StatSchema,
+    Stats,
+    StatsSnapshot
+)
+
+def test_ids_are_stable_and_paired_with_maximums():
+    """
+    Test that names get one id each, and that a stat's maximum is registered with it.
+    """
+    stat_id = StatSchema.id("stamina")
+    assert StatSchema.id("stamina") == stat_id
+    assert StatSchema.name(stat_id) == "stamina"
+    assert StatSchema.name(StatSchema.max_id(stat_id)) == "max_stamina"
+    assert StatSchema.max_id(StatSchema.id("max_stamina")) is None
+    assert StatSchema.names()[stat_id] == "stamina"
+
+def test_id_access_matches_name_access():
+    """
+    Test that get_id/set_id/modify_id behave like get/set/modify on every kind of stats.
+    """
+    health, luck = StatSchema.id("health"), StatSchema.id("luck")
+    for stats in (Stats(health=10, luck=1), CharacterStats(health=10, luck=1), StatsSnapshot(CharacterStats(health=10, luck=1))):
+        stats.modify_id(health, -4)
+        stats.modify_id(luck, 2)
+        assert (stats.get_id(health), stats.get_id(luck)) == (stats.get("health"), stats.get("luck")) == (6, 3)
+        stats.set_id(luck, 9)
+        assert stats.luck == 9
+        assert stats.dirty == {"health", "luck"}
+        assert stats.get_id(StatSchema.id("unknown_stat")) is None
+
+def test_apply_limits_accepts_names_and_ids():
+    """
+    Test that limits are found through the precomputed maximum whether the attribute is given by name or id.
+    """
+    class Target:
+        stats = CharacterStats(health=50)
+
+    Target.stats.health = 40
+    formula = SimpleChangeFormulaWithStatLimits(25)
+    assert formula.apply_limits(25, Target, "health") == 10
+    assert formula.apply_limits(25, Target, StatSchema.id("health")) == 10
+    assert formula.apply_limits(-90, Target, "armor") == 0
+
+def test_effect_resolves_its_attribute():
+    """
+    Test that effects keep their stat id in sync with the attribute, including after unpickling.
+    """
+    effect = Effect("mana", SimpleChangeFormulaWithStatLimits(5))
+    assert effect.stat_id == StatSchema.id("mana")
+    effect.attribute = "focus"
+    assert effect.stat_id == StatSchema.id("focus")
+    assert "stat_id" not in effect.__getstate__()
+    assert pickle.loads(pickle.dumps(effect)).stat_id == StatSchema.id("focus")
+    assert Effect(None, SimpleChangeFormulaWithStatLimits(5)).stat_id is None
+
+def test_effect_pickled_before_stat_ids_loads():
+    """
+    Test that an effect pickled when its attribute was a plain instance attribute loads with its stat id.
+    """
+    effect = Effect("mana", SimpleChangeFormulaWithStatLimits(5))
+    legacy = Effect.__new__(Effect)
+    legacy.__setstate__({"attribute": "focus", "formula": effect.formula, "logger": effect.logger})
+
+    assert legacy.attribute == "focus"
+    assert legacy.stat_id == StatSchema.id("focus")
+    assert "attribute" not in legacy.__dict__
@@ -0,0 +1,127 @@
+import pickle
+import pytest
+from rpg_world import (
+    Character,
+    CharacterStats,
+    Effect,
+    GameState,
+    SimpleChangeFormula,
+    StatThresholdTrigger,
+    Stats,
+    StatsStore
+)
+
+@pytest.fixture(params=[Stats, CharacterStats])
+def stats(request):
+    """
+    Fixture providing plain and character stats with the same health.
+    """
+    if request.param is Stats:
+        return Stats(health=100, max_health=100)
+    return CharacterStats(health=100)
+
+def record(calls):
+    """
+    Build a watcher callback that appends (old, new) to `calls`.
+    """
+    return lambda stats, attr_name, old_value, new_value: calls.append((old_value, new_value))
+
+def test_watchers_fire_only_on_crossings(stats):
+    """
+    Test that each direction fires exactly when a write crosses its threshold.
+    """
+    below, above, crossing = [], [], []
+    stats.watch("health", 50, record(below))
+    stats.watch("health", 50, record(above), direction="above")
+    stats.watch("health", 50, record(crossing), direction="crossing")
+
+    stats.modify("health", -20)          # 100 -> 80, no crossing
+    stats.set("health", 50)              # onto the threshold
+    stats.modify("health", -10)          # 50 -> 40, below
+    stats.health = 45                    # still below
+    stats.modify_many({"health": 30})    # 45 -> 75, above
+    assert below == [(50, 40)]
+    assert above == [(45, 75)]
+    assert crossing == [(80, 50), (50, 40), (45, 75)]
+
+def test_writes_check_only_nearby_thresholds(stats):
+    """
+    Test that a write visits only the thresholds between the old and new value, and that unwatch works.
+    """
+    calls = []
+    watchers = [stats.watch("health", threshold, record(calls)) for threshold in range(0, 100, 10)]
+    stats.modify("health", -25)
+    assert calls == [(100, 75), (100, 75)]  # Crossed 90 and 80 only
+
+    for watcher in watchers:
+        stats.unwatch(watcher)
+    stats.unwatch(watchers[0])
+    stats.set("health", 0)
+    assert len(calls) == 2
+    assert stats._watchers is None
+
+def test_watchers_see_effects_and_modifiers():
+    """
+    Test that effects and modifier layers notify watchers like any other write.
+    """
+    hero = Character(name="Hero", stats=CharacterStats(health=100))
+    calls = []
+    hero.stats.watch("health", 10, record(calls))
+    Effect("health", SimpleChangeFormula(-95)).apply(hero)
+    hero.stats.add_modifier("curse", "health", mult=0.5)
+    assert calls == [(100, 5)]
+
+    hero.stats.watch("armor", 1, record(calls), direction="above")
+    hero.stats.add_modifier("shield", "armor", add=3)
+    assert calls[-1] == (0, 3)
+
+def test_store_operations_notify_watched_rows():
+    """
+    Test that vectorized store writes notify the watchers of attached stats.
+    """
+    pytest.importorskip("numpy")
+    store = StatsStore(capacity=2)
+    population = [CharacterStats(health=100, mana=10) for _ in range(3)]
+    population[0].mana = 2
+    calls = []
+    population[0].watch("mana", 5, record(calls), direction="above")
+    for stats in population:
+        store.attach(stats)
+    population[2].watch("health", 50, record(calls))
+
+    store.regenerate("mana", 5)
+    store.apply_deltas([(Character(name="Target", stats=population[2]), "health", -70)])
+    assert calls == [(2, 7), (100, 30)]
+
+def test_unknown_direction_raises(stats):
+    """
+    Test that watchers and triggers reject unknown directions.
+    """
+    with pytest.raises(ValueError):
+        stats.watch("health", 10, print, direction="sideways")
+    with pytest.raises(ValueError):
+        StatThresholdTrigger("hero", "health", 10, direction="sideways")
+
+def test_stat_threshold_trigger():
+    """
+    Test that the push-based trigger follows the stat without polling, and re-registers after pickling.
+    """
+    game_state = GameState()
+    hero = Character(name="Hero", stats=CharacterStats(health=100), id="hero")
+    game_state.add_character(hero)
+    low_health = StatThresholdTrigger("hero", "health", 30)
+    crossed = StatThresholdTrigger("hero", "health", 30, direction="crossing")
+
+    assert not low_health.evaluate(game_state) and not crossed.evaluate(game_state)
+    hero.health = 20
+    assert low_health.evaluate(game_state) and low_health.evaluate(game_state)
+    assert crossed.evaluate(game_state) and not crossed.evaluate(game_state)
+    hero.health = 60
+    assert not low_health.evaluate(game_state)
+    assert crossed.evaluate(game_state)
+
+    restored = pickle.loads(pickle.dumps(game_state))
+    restored_trigger = pickle.loads(pickle.dumps(low_health))
+    restored.characters["hero"].health = 10
+    assert restored_trigger.evaluate(restored)
+    assert not low_health.evaluate(game_state)
@@ -0,0 +1,106 @@
+import copy
+import pickle
+import pytest
+from rpg_world import (
+    CharacterStats,
+    Mage,
+    SimpleChangeFormula,
+    Spell,
+    SpellEffect,
+    Stats,
+    StatsSnapshot
+)
+
+@pytest.fixture(params=[Stats, CharacterStats])
+def stats(request):
+    """
+    Fixture providing plain and character stats with the same attributes.
+    """
+    if request.param is Stats:
+        return Stats(health=100, max_health=100, mana=50, luck=3)
+    return CharacterStats(health=100, mana=50, luck=3)
+
+def test_reads_fall_through_and_writes_stay_in_delta(stats):
+    """
+    Test that a snapshot reads its parent until an attribute is written, and never writes the parent.
+    """
+    snapshot = stats.snapshot()
+    assert isinstance(snapshot, StatsSnapshot)
+    assert snapshot.health == 100 and snapshot.get("luck") == 3
+    assert snapshot.get("missing") is None and "missing" not in snapshot
+
+    snapshot.modify("health", -30)
+    snapshot.luck = 7
+    snapshot.set("charm", 1)
+    assert snapshot.health == 70 and snapshot.luck == 7 and snapshot.charm == 1
+    assert stats.health == 100 and stats.luck == 3 and "charm" not in stats
+    assert snapshot.changes == {"health": 70, "luck": 7, "charm": 1}
+    assert dict(snapshot.attributes) == {**dict(stats.attributes), "health": 70, "luck": 7, "charm": 1}
+
+    stats.set("mana", 20)
+    assert snapshot.mana == 20
+
+def test_commit_and_discard(stats):
+    """
+    Test that commit writes the delta into the parent with new versions, and discard drops it.
+    """
+    snapshot = stats.snapshot()
+    snapshot.modify_many({"health": 50, "mana": -10})
+    assert snapshot.health == 100 and snapshot.mana == 40  # Limited by max_health, as on the parent
+
+    snapshot.discard()
+    assert snapshot.changes == {} and snapshot.mana == 50
+
+    stats.drain_dirty()
+    snapshot.modify("mana", -10)
+    version = snapshot.version("mana")
+    assert stats.version("mana") < version
+    snapshot.commit()
+    assert stats.mana == 40 and stats.dirty == {"mana"}
+    assert stats.version("mana") > version
+    assert snapshot.changes == {} and snapshot.version("mana") == stats.version("mana")
+
+def test_nested_snapshots(stats):
+    """
+    Test that a snapshot of a snapshot commits into its parent snapshot only.
+    """
+    outer = stats.snapshot()
+    outer.modify("health", -10)
+    inner = outer.snapshot()
+    inner.modify("health", -10)
+    assert (stats.health, outer.health, inner.health) == (100, 90, 80)
+
+    inner.commit()
+    assert (stats.health, outer.health) == (100, 80)
+    outer.commit()
+    assert stats.health == 80
+
+def test_snapshot_copy_and_pickle():
+    """
+    Test that copied and pickled snapshots keep their parent values and delta.
+    """
+    snapshot = CharacterStats(health=30).snapshot()
+    snapshot.health = 10
+    for restored in (copy.deepcopy(snapshot), pickle.loads(pickle.dumps(snapshot))):
+        assert restored.health == 10 and restored.parent.health == 30
+        restored.commit()
+        assert restored.parent.health == 10
+    assert snapshot.parent.health == 30
+
+def test_mage_overlay_casts_without_side_effects():
+    """
+    Test that a spell cast through overlays changes neither the real characters nor the real spell cooldown.
+    """
+    fireball = Spell("Fireball", 30, 10, [SpellEffect("health", SimpleChangeFormula(-25))])
+    caster = Mage("Caster", spells=[fireball])
+    target = Mage("Target")
+
+    caster_what_if, target_what_if = caster.overlay(), target.overlay()
+    caster_what_if.cast_spell("Fireball", target_what_if, current_time=1)
+    assert caster_what_if.mana == 70 and target_what_if.health == 75
+    assert target_what_if.is_alive()
+    assert caster.mana == 100 and target.health == 100
+    assert fireball.last_cast_time is None
+
+    caster.cast_spell("Fireball", target, current_time=1)
+    assert target.health == 75
@@ -0,0 +1,213 @@
+import copy
+import pickle
+import pytest
+from rpg_world import (
+    Character,
+    CharacterStats,
+    Effect,
+    GameState,
+    SimpleChangeFormula,
+    Stats,
+    StatsStore
+)
+
+pytest.importorskip("numpy")
+
+@pytest.fixture
+def store():
+    """
+    Fixture providing a small store so that growth is exercised.
+    """
+    return StatsStore(capacity=2)
+
+def test_attached_stats_are_row_views(store):
+    """
+    Test that attached stats read and write their row, and the per-object API keeps working.
+    """
+    stats = CharacterStats(health=80, mana=40, luck=3)
+    row = store.attach(stats)
+
+    assert isinstance(stats, CharacterStats)
+    assert stats.health == 80 and stats.get("max_mana") == 40 and stats.luck == 3
+
+    stats.modify("health", -30)
+    stats.mana = 10
+    assert store.column("health")[row] == 50
+    assert store.column("mana")[row] == 10
+
+    store.column("focus")[row] = 7
+    assert stats.focus == 7
+    assert dict(stats.attributes)["focus"] == 7
+
+def test_attached_int_stats_stay_ints(store):
+    """
+    Test that integer stats read and detach as integers while whole, and float stats stay floats.
+    """
+    stats = CharacterStats(health=100, mana=40.0)
+    text = str(stats)
+    store.attach(stats)
+
+    assert str(stats) == text
+    assert type(stats.health) is int and type(stats.mana) is float
+    stats.modify("health", -2.5)
+    assert stats.health == 97.5
+
+    store.detach(stats)
+    assert str(stats).startswith("Stats(health: 97.5, max_health: 100, mana: 40.0,")
+    stats.set("health", 90)
+    store.attach(stats)
+    store.regenerate("health", 5)
+    store.detach(stats)
+    assert type(stats.health) is int and stats.health == 95
+
+def test_store_grows_and_reuses_rows(store):
+    """
+    Test that the store grows past its initial capacity and reuses freed rows.
+    """
+    stats = [CharacterStats(health=i + 1) for i in range(5)]
+    rows = [store.attach(s) for s in stats]
+    assert rows == [0, 1, 2, 3, 4]
+    assert store.capacity >= 5 and len(store) == 5
+    assert [s.health for s in stats] == [1, 2, 3, 4, 5]
+
+    store.detach(stats[1])
+    assert type(stats[1]) is CharacterStats
+    assert stats[1].health == 2
+    assert len(store) == 4
+
+    newcomer = CharacterStats(health=9)
+    assert store.attach(newcomer) == 1
+    assert store.attach(newcomer) == 1
+
+def test_attach_to_second_store_raises(store):
+    """
+    Test that stats cannot be views of two stores at once.
+    """
+    stats = CharacterStats()
+    store.attach(stats)
+    with pytest.raises(ValueError):
+        StatsStore().attach(stats)
+    with pytest.raises(ValueError):
+        StatsStore().detach(stats)
+
+def test_vectorized_regenerate_clamp_and_alive_mask(store):
+    """
+    Test population-wide regeneration, clamping to [0, max] and the alive mask.
+    """
+    stats = [CharacterStats(health=100, mana=50) for _ in range(4)]
+    for s in stats:
+        store.attach(s)
+    stats[0].health = 0
+    stats[1].mana = 10
+    stats[2].health = 150
+    stats[3].mana = -5
+
+    store.clamp_to_max()
+    assert [s.health for s in stats] == [0, 100, 100, 100]
+    assert stats[3].mana == 0
+
+    store.regenerate("mana", 45)
+    assert [s.mana for s in stats] == [50, 50, 50, 45]
+
+    assert store.alive_mask().tolist() == [False, True, True, True]
+    store.detach(stats[3])
+    assert store.alive_mask().tolist() == [False, True, True, False]
+
+def test_effects_work_on_attached_characters(store):
+    """
+    Test that effects and characters use the store transparently.
+    """
+    hero = Character(name="Hero", stats=CharacterStats(health=120))
+    store.attach(hero.stats)
+
+    Effect("health", SimpleChangeFormula(-20)).apply(hero)
+    assert hero.health == 100
+    assert hero.is_alive()
+
+def test_copy_and_pickle_attached_stats(store):
+    """
+    Test that copies of attached stats are detached CharacterStats with the same values.
+    """
+    stats = CharacterStats(health=30, luck=2)
+    store.attach(stats)
+    stats.health = 12
+
+    for restored in (copy.deepcopy(stats), pickle.loads(pickle.dumps(stats))):
+        assert type(restored) is CharacterStats
+        assert dict(restored.attributes) == dict(stats.attributes)
+
+def test_game_state_stats_store():
+    """
+    Test that the game state attaches existing and new characters, and again after pickling.
+    """
+    game_state = GameState()
+    first = Character(name="First", stats=CharacterStats(health=10), id="first")
+    second = Character(name="Second", stats=CharacterStats(health=20), id="second")
+    game_state.add_character(first)
+
+    store = game_state.enable_stats_store()
+    game_state.add_character(second)
+    assert store.column("health").tolist() == [10, 20]
+
+    restored = pickle.loads(pickle.dumps(game_state))
+    assert restored.stats_store.column("health").tolist() == [10, 20]
+    restored.stats_store.regenerate("health", -5)
+    assert restored.characters["second"].health == 15
+
+def test_apply_deltas_matches_per_object_batch(store):
+    """
+    Test that the vectorized apply_deltas gives the same result as Stats.apply_deltas.
+    """
+    def population():
+        characters = [Character(name=f"Goblin {i}", stats=CharacterStats(health=30, mana=20, luck=1)) for i in range(4)]
+        characters[0].stats.health = 10
+        return characters
+
+    def batch(characters):
+        return [
+            (characters[0], "health", -15),
+            (characters[1], "health", 50),
+            (characters[2], "mana", -5),
+            (characters[2], "mana", -5),
+            (characters[3], "armor", -2),
+            (characters[3], "luck", 2),
+        ]
+
+    plain = population()
+    expected = Stats.apply_deltas(batch(plain))
+
+    stored = population()
+    for character in stored:
+        store.attach(character.stats)
+    applied = store.apply_deltas(batch(stored))
+
+    index = {id(character): i for i, character in enumerate(stored)}
+    assert {(index[id(c)], a): d for (c, a), d in applied.items()} == \
+        {(plain.index(c), a): d for (c, a), d in expected.items()}
+    assert [dict(c.stats.attributes) for c in stored] == [dict(c.stats.attributes) for c in plain]
+
+def test_store_operations_update_versions(store):
+    """
+    Test that vectorized writes give the written rows new versions, which survive detaching.
+    """
+    stats = [CharacterStats(health=100, mana=50) for _ in range(3)]
+    for s in stats:
+        store.attach(s)
+    stats[0].health = 0
+    for s in stats:
+        s.drain_dirty()
+
+    before = [s.version("mana") for s in stats]
+    store.regenerate("mana", -10)
+    after = [s.version("mana") for s in stats]
+    assert after[0] == before[0]
+    assert after[1] > before[1] and after[2] > before[2]
+    assert [s.drain_dirty() for s in stats] == [set(), {"mana"}, {"mana"}]
+
+    store.apply_deltas([(Character(name="Ghost", stats=stats[2]), "health", 5)])
+    assert stats[2].dirty == {"health"}  # Already at max health, but the row was still written
+    assert stats[2].version("health") > stats[1].version("health")
+
+    version = stats[1].version("mana")
+    store.detach(stats[1])
+    assert stats[1].version("mana") == version
@@ -0,0 +1,115 @@
+import pytest
+from rpg_world import (
+    Journal,
+    JournalEvent,
+    JournalReader,
+    Mage,
+    Spell,
+    SpellEffect,
+    SimpleChangeFormula,
+    World,
+    Location
+)
+
+@pytest.fixture
+def journal(tmp_path):
+    """
+    Fixture that starts a journal in a temporary directory and stops it afterwards.
+    """
+    journal = Journal.start(str(tmp_path / "game.journal"), buffer_records=4)
+    yield journal
+    Journal.stop()
+
+def test_records_have_fixed_size(journal):
+    """
+    Test that every record takes exactly Journal.RECORD.size bytes on disk.
+    """
+    for i in range(10):
+        journal.record(JournalEvent.EFFECT_APPLIED, None, "Hero", "health", -i)
+    journal.flush()
+
+    with open(journal.path, "rb") as journal_file:
+        assert len(journal_file.read()) == 10 * Journal.RECORD.size
+    assert journal.records_written == 10
+
+def test_names_written_once(journal):
+    """
+    Test that each name is written to the sidecar file only once.
+    """
+    journal.record(JournalEvent.EFFECT_APPLIED, None, "Hero", "health", -5)
+    journal.record(JournalEvent.EFFECT_APPLIED, None, "Hero", "health", -5)
+    journal.flush()
+
+    names = JournalReader(journal.path).names()
+    assert sorted(names.values()) == ["Hero", "health"]
+    assert names[journal.name_id("Hero")] == "Hero"
+
+def test_colliding_names_get_distinct_ids(journal):
+    """
+    Test that names get distinct ids even when their CRC-32 hashes collide, and that a journal
+    appending to an existing file continues from the ids in its sidecar.
+    """
+    journal.record(JournalEvent.EVENT_TRIGGERED, "plumless", "buckeroo")
+    assert journal.name_id("plumless") != journal.name_id("buckeroo")
+    Journal.stop()
+
+    with Journal(journal.path) as appended:
+        assert appended.name_id("buckeroo") == journal.name_id("buckeroo")
+        appended.record(JournalEvent.EVENT_TRIGGERED, "Hero")
+
+    names = JournalReader(journal.path).names()
+    assert sorted(names.values()) == ["Hero", "buckeroo", "plumless"]
+    assert len(names) == 3
+
+def test_spell_cast_is_journaled(journal):
+    """
+    Test that casting a spell records the cast and each spell effect.
+    """
+    fireball = Spell(
+        name="Fireball",
+        mana_cost=10,
+        cooldown=0,
+        effects=[SpellEffect("health", SimpleChangeFormula(-30))]
+    )
+    merlin = Mage("Merlin", spells=[fireball])
+    goblin = Mage("Goblin")
+
+    merlin.cast_spell("Fireball", goblin, 0.0)
+    Journal.stop()
+
+    records = list(JournalReader(journal.path))
+    assert [record.kind for record in records] == [JournalEvent.SPELL_CAST, JournalEvent.SPELL_EFFECT_APPLIED]
+
+    names = JournalReader(journal.path).names()
+    effect = records[1]
+    assert names[effect.source] == "Merlin"
+    assert names[effect.target] == "Goblin"
+    assert names[effect.attribute] == "health"
+    assert effect.delta == -30
+
+def test_location_change_is_journaled(journal):
+    """
+    Test that moving between locations records a location change.
+    """
+    world = World("Overworld", id="overworld")
+    world.add_location(Location("Village", "A quiet village.", connected_locations=["Forest"]))
+    world.add_location(Location("Forest", "A dark forest."))
+    world.set_starting_location("Village")
+
+    world.move_to_location("Forest")
+    Journal.stop()
+
+    records = list(JournalReader(journal.path))
+    assert len(records) == 1
+    assert records[0].kind == JournalEvent.LOCATION_CHANGED
+    assert records[0].source == journal.name_id("overworld")
+    assert records[0].target == journal.name_id("Forest")
+
+def test_nothing_recorded_without_journal():
+    """
+    Test that instrumented code does nothing when no journal is started.
+    """
+    assert Journal.current is None
+    goblin = Mage("Goblin")
+    SpellEffect("health", SimpleChangeFormula(-1)).apply(goblin, goblin)
+    assert goblin.health == 99
@@ -0,0 +1,75 @@
+import pytest
+from rpg_world import Journal, JournalEvent, JournalReader
+from rpg_world.telemetry import journal_reader
+from rpg_world.telemetry.cli import main
+
+@pytest.fixture
+def journal_path(tmp_path):
+    """
+    Fixture that writes a small journal and returns its path.
+    """
+    path = str(tmp_path / "game.journal")
+    with Journal(path) as journal:
+        for i in range(100):
+            journal.record(JournalEvent.SPELL_EFFECT_APPLIED, "Merlin", f"Goblin {i % 4}", "health", -float(i))
+        journal.record(JournalEvent.EVENT_TRIGGERED, "Ambush")
+    return path
+
+@pytest.fixture(params=["numpy", "struct"])
+def reader(request, journal_path, monkeypatch):
+    """
+    Fixture providing a reader that uses either the NumPy or the pure-Python filtering path.
+    """
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(journal_reader, "np", None)
+    return JournalReader(journal_path, chunk_records=7)
+
+def test_reader_streams_all_records(reader):
+    """
+    Test that iterating the reader yields every record in order.
+    """
+    records = list(reader)
+    assert len(records) == 101
+    assert records[5].delta == -5.0
+    assert records[-1].kind == JournalEvent.EVENT_TRIGGERED
+
+def test_reader_filters(reader):
+    """
+    Test filtering by kind, entity names and attribute.
+    """
+    assert reader.count(kind=JournalEvent.EVENT_TRIGGERED) == 1
+    assert reader.count(source="Ambush") == 1
+    assert reader.count(target="Goblin 1") == 25
+    assert reader.count(source="Merlin", target="Goblin 2", attribute="health") == 25
+
+    deltas = [record.delta for record in reader.query(target="Goblin 3")]
+    assert deltas == [-float(i) for i in range(3, 100, 4)]
+    assert reader.count(target="Goblin 4") == 0
+    assert list(reader.query(source="Nobody")) == []
+
+def test_reader_time_filters(reader):
+    """
+    Test filtering by timestamp range.
+    """
+    timestamps = [record.timestamp for record in reader]
+    assert reader.count(since=timestamps[0]) == 101
+    assert reader.count(until=timestamps[0]) == 0
+
+def test_cli_count(journal_path, capsys):
+    """
+    Test the query CLI in count mode.
+    """
+    assert main([journal_path, "--kind", "spell_effect_applied", "--target", "Goblin 0", "--count"]) == 0
+    assert capsys.readouterr().out.strip() == "25"
+
+def test_cli_lists_records_with_names(journal_path, capsys):
+    """
+    Test that the query CLI prints records with names resolved.
+    """
+    main([journal_path, "--source", "Merlin", "--limit", "2"])
+    lines = capsys.readouterr().out.strip().splitlines()
+
+    assert len(lines) == 2
+    assert lines[1].split("\t")[1:] == ["spell_effect_applied", "Merlin", "Goblin 1", "health", "-1"]
@@ -0,0 +1,86 @@
+import subprocess
+import sys
+import pytest
+import rpg_world
+
+def run_python(code, *options):
+    """
+    Run a snippet in a fresh interpreter and return its (stdout, stderr).
+    """
+    result = subprocess.run([sys.executable, *options, "-c", code], capture_output=True, text=True, check=True)
+    return result.stdout, result.stderr
+
+def cumulative_import_time(stderr, module):
+    """
+    Return the cumulative import time in microseconds reported by `-X importtime` for a module,
+    or 0 if the module was not imported by the snippet (e.g. it was already imported by another one).
+    """
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and line.split("|")[-1].strip() == module:
+            return int(line.split("|")[1])
+    return 0
+
+def test_import_does_not_load_subpackages():
+    """
+    Test that importing the package does not import any subpackage.
+    """
+    stdout, _ = run_python("import sys, rpg_world; print(sorted(m for m in sys.modules if m.startswith('rpg_world')))")
+    assert stdout.strip() == "['rpg_world', 'rpg_world.__version__']"
+
+def test_from_import_loads_only_what_is_needed():
+    """
+    Test that importing one name only imports the subpackage that defines it.
+    """
+    stdout, _ = run_python(
+        "import sys; from rpg_world import Stats, Formula; "
+        "print(any(m.startswith(('rpg_world.save_load', 'rpg_world.game', 'rpg_world.utils')) for m in sys.modules))"
+    )
+    assert stdout.strip() == "False"
+
+@pytest.mark.parametrize("names", ["Formula, SimpleChangeFormula", "Character, SpellEffect"])
+def test_imports_do_not_load_numpy(names):
+    """
+    Test that characters, effects and formulas only import StatsStore, and with it NumPy, when stats kept in a store are used.
+    """
+    stdout, _ = run_python(f"import sys; from rpg_world import {names}; print('numpy' in sys.modules)")
+    assert stdout.strip() == "False"
+
+def test_import_time_benchmark():
+    """
+    Benchmark `import rpg_world` with `python -X importtime` against importing every subpackage.
+    """
+    subpackages = sorted({module.split(".")[1] for module in rpg_world._EXPORTS.values()})
+    _, lazy = run_python("import rpg_world", "-X", "importtime")
+    _, eager = run_python(f"import rpg_world, {', '.join('rpg_world.' + name for name in subpackages)}", "-X", "importtime")
+
+    lazy_us = cumulative_import_time(lazy, "rpg_world")
+    eager_us = cumulative_import_time(eager, "rpg_world") + sum(
+        cumulative_import_time(eager, f"rpg_world.{name}") for name in subpackages
+    )
+    print(f"import rpg_world: {lazy_us} us lazy, {eager_us} us with every subpackage imported")
+
+    assert 0 < lazy_us < eager_us
+
+def test_public_names_resolve():
+    """
+    Test that every public name can be imported and is cached after first access.
+    """
+    for name in rpg_world.__all__:
+        assert getattr(rpg_world, name) is not None
+        assert name in vars(rpg_world)
+
+    assert set(rpg_world.__all__) <= set(dir(rpg_world))
+
+def test_unknown_name_raises():
+    """
+    Test that unknown attributes still raise AttributeError.
+    """
+    with pytest.raises(AttributeError):
+        rpg_world.NotAClass
+
+def test_subpackages_resolve_as_attributes():
+    """
+    Test that subpackages are reachable as attributes of the package without importing them first.
+    """
+    stdout, _ = run_python("import rpg_world; print(rpg_world.stats.CharacterStats.__name__, rpg_world.combat.__name__)")
+    assert stdout.strip() == "CharacterStats rpg_world.combat"
@@ -0,0 +1,118 @@
+import logging
+import threading
+import pytest
+from rpg_world import AsyncLogBackend, Logger, Game
+
+class BlockingHandler(logging.Handler):
+    """
+    Handler that records messages and holds the writer thread on the first record until released.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def emit(self, record):
+        self.started.set()
+        self.release.wait(5)
+        self.messages.append(record.getMessage())
+
+@pytest.fixture
+def blocking_logger():
+    """Fixture providing an isolated logger with a blocking handler."""
+    logger = logging.getLogger("test_async_backend")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    handler = BlockingHandler()
+    logger.addHandler(handler)
+    yield logger, handler
+    handler.release.set()
+    logger.removeHandler(handler)
+
+def make_record(logger, message):
+    return logger.makeRecord(logger.name, logging.INFO, __file__, 0, message, None, None)
+
+def fill_queue(backend, logger, handler, count):
+    """Queue one record for the writer thread to block on, then `count` more."""
+    backend.put(make_record(logger, "0"))
+    assert handler.started.wait(5)
+    for i in range(1, count + 1):
+        backend.put(make_record(logger, str(i)))
+
+def test_backend_writes_records_in_order(blocking_logger):
+    """Test that queued records are all written, in order, after a flush."""
+    logger, handler = blocking_logger
+    handler.release.set()
+    backend = AsyncLogBackend(max_size=100)
+
+    for i in range(50):
+        backend.put(make_record(logger, str(i)))
+
+    assert backend.flush(5)
+    backend.stop()
+    assert handler.messages == [str(i) for i in range(50)]
+    assert backend.dropped == 0
+
+def test_backend_drop_newest(blocking_logger):
+    """Test that the drop_newest policy discards incoming records when full."""
+    logger, handler = blocking_logger
+    backend = AsyncLogBackend(max_size=2, overflow_policy=AsyncLogBackend.DROP_NEWEST)
+
+    fill_queue(backend, logger, handler, 3)
+    handler.release.set()
+    backend.stop()
+
+    assert handler.messages == ["0", "1", "2"]
+    assert backend.dropped_newest == 1
+    assert backend.dropped_oldest == 0
+
+def test_backend_drop_oldest(blocking_logger):
+    """Test that the drop_oldest policy discards the oldest queued record when full."""
+    logger, handler = blocking_logger
+    backend = AsyncLogBackend(max_size=2, overflow_policy=AsyncLogBackend.DROP_OLDEST)
+
+    fill_queue(backend, logger, handler, 3)
+    handler.release.set()
+    backend.stop()
+
+    assert handler.messages == ["0", "2", "3"]
+    assert backend.dropped_oldest == 1
+    assert backend.dropped == 1
+
+def test_backend_block(blocking_logger):
+    """Test that the block policy makes the producer wait for room instead of dropping."""
+    logger, handler = blocking_logger
+    backend = AsyncLogBackend(max_size=2, overflow_policy=AsyncLogBackend.BLOCK)
+
+    fill_queue(backend, logger, handler, 2)
+    producer = threading.Thread(target=backend.put, args=(make_record(logger, "3"),))
+    producer.start()
+    producer.join(0.1)
+    assert producer.is_alive()
+
+    handler.release.set()
+    producer.join(5)
+    backend.stop()
+
+    assert handler.messages == ["0", "1", "2", "3"]
+    assert backend.dropped == 0
+
+def test_backend_rejects_unknown_policy():
+    """Test that an unknown overflow policy raises a ValueError."""
+    with pytest.raises(ValueError):
+        AsyncLogBackend(overflow_policy="ignore")
+
+def test_game_stop_flushes_async_logger(mocker, caplog):
+    """Test that stopping the game flushes records queued by the asynchronous backend."""
+    mocker.patch.object(Game, 'init_game')
+    game = Game(game_state='mock_game_state')
+
+    Logger.enable_async()
+    try:
+        with caplog.at_level(logging.INFO):
+            game.stop()
+            assert "Game stopped." in caplog.text
+    finally:
+        Logger.disable_async()
@@ -63,3 +63,185 @@ def test_logger_critical_message(setup_logger, caplog):
     # Check that the message was logged
     assert "Critical message for testing." in caplog.text
     assert "CRITICAL" in caplog.text
+
+def test_logger_handlers_are_shared(tmp_path):
+    """Test that handlers are created once per log file and level."""
+    log_file = str(tmp_path / "shared.log")
+
+    handlers = Logger.get_handlers(log_file, logging.INFO)
+
+    assert Logger.get_handlers(log_file, logging.INFO) is handlers
+    assert Logger.get_handlers(log_file, logging.DEBUG) is not handlers
+
+def test_logger_file_opened_lazily(tmp_path):
+    """Test that the shared log file is only created once a record is emitted."""
+    log_file = tmp_path / "logs" / "lazy.log"
+
+    file_handler, _ = Logger.get_handlers(str(log_file), logging.INFO)
+    assert not log_file.exists()
+
+    record = logging.LogRecord("lazy", logging.INFO, __file__, 0, "Lazy message.", None, None)
+    file_handler.handle(record)
+    file_handler.flush()
+
+    assert "Lazy message." in log_file.read_text()
+
+def test_logger_configured_once():
+    """Test that wrapping the same logger again does not reset its level."""
+    Logger(name="configured_once_logger", log_level=logging.DEBUG)
+    logger = Logger(name="configured_once_logger", log_level=logging.ERROR)
+
+    assert logger.logger.level == logging.DEBUG
+
+def test_logger_formats_arguments(setup_logger, caplog):
+    """Test that %-style arguments are merged into the message."""
+    logger = setup_logger
+
+    with caplog.at_level(logging.INFO):
+        logger.info("%s has %d health.", "Conan", 100)
+
+    assert "Conan has 100 health." in caplog.text
+
+def test_logger_callable_message(setup_logger, caplog):
+    """Test that callable messages are only evaluated when the level is enabled."""
+    logger = setup_logger
+    calls = []
+
+    def build_message():
+        calls.append(True)
+        return "Built message."
+
+    logger.logger.setLevel(logging.WARNING)
+    try:
+        logger.info(build_message)
+        assert not calls
+        assert not logger.is_enabled_for(logging.INFO)
+        assert logger.is_enabled_for(logging.WARNING)
+    finally:
+        logger.logger.setLevel(logging.DEBUG)
+
+    with caplog.at_level(logging.INFO):
+        logger.info(build_message)
+
+    assert calls == [True]
+    assert "Built message." in caplog.text
+
+def test_logger_context_formatted():
+    """Test that structured context is appended to formatted lines."""
+    from rpg_world.utils.logger import ContextFormatter
+
+    record = logging.LogRecord("rpg_world.item", logging.INFO, __file__, 0, "Item used.", None, None)
+    record.context = {"entity": "Consumable", "name": "Potion"}
+
+    assert ContextFormatter("%(name)s - %(message)s").format(record) == "rpg_world.item - Item used. [entity=Consumable name=Potion]"
+
+def test_logger_registry_bounded_for_named_entities():
+    """Test that spawning many uniquely named entities does not grow the logging registry."""
+    from rpg_world import Character, CharacterStats, Consumable, Position
+
+    # Create one of each entity first so their shared loggers already exist
+    Character("Warmup", CharacterStats())
+    Consumable("Warmup", "", 0, [])
+    Position("Warmup", 0, 0)
+    registry_size = len(logging.Logger.manager.loggerDict)
+
+    logging.disable(logging.CRITICAL)
+    try:
+        for i in range(100_000):
+            if i % 3 == 0:
+                Character(f"NPC {i}", CharacterStats())
+            elif i % 3 == 1:
+                Consumable(f"Potion {i}", "", 0, [])
+            else:
+                Position(f"Position {i}", i, i)
+    finally:
+        logging.disable(logging.NOTSET)
+
+    assert len(logging.Logger.manager.loggerDict) == registry_size
+
+def test_logger_set_output_level(tmp_path):
+    """Test that the output level overrides the level of the shared handlers."""
+    handlers = Logger.get_handlers(str(tmp_path / "output.log"), logging.INFO)
+
+    Logger.set_output_level(logging.WARNING)
+    try:
+        assert all(handler.level == logging.WARNING for handler in handlers)
+    finally:
+        Logger.set_output_level(None)
+
+    assert all(handler.level == logging.INFO for handler in handlers)
+
+def test_logger_rate_limit(setup_logger, caplog, mocker):
+    """Test that a call site is limited per second and reports what it suppressed."""
+    logger = setup_logger
+    now = mocker.patch("rpg_world.utils.logger.time.monotonic", return_value=100.0)
+
+    with caplog.at_level(logging.INFO):
+        for i in range(10):
+            logger.info("Polling %d at 100%%.", i, rate_limit=2)
+        assert caplog.messages == ["Polling 0 at 100%.", "Polling 1 at 100%."]
+
+        now.return_value = 101.0
+        logger.info("Polling %d at 100%%.", 10, rate_limit=2)
+
+    assert caplog.messages[-1] == "Polling 10 at 100%. (8 similar messages suppressed)"
+
+def test_logger_rate_limit_is_per_entity(caplog, mocker):
+    """Test that one entity hitting the limit does not suppress the same message from another entity."""
+    mocker.patch("rpg_world.utils.logger.time.monotonic", return_value=100.0)
+    first = Logger("test_logger", context={"name": "Goblin 1"})
+    second = Logger("test_logger", context={"name": "Goblin 2"})
+
+    with caplog.at_level(logging.INFO):
+        for _ in range(5):
+            first.info("Spell is on cooldown.", rate_limit=1)
+        second.info("Spell is on cooldown.", rate_limit=1)
+
+    assert [record.context["name"] for record in caplog.records] == ["Goblin 1", "Goblin 2"]
+
+def test_logger_flush_reports_pending_suppressed(setup_logger, caplog, mocker):
+    """Test that suppressed counts of a call site that went quiet are reported on flush, once."""
+    logger = setup_logger
+    mocker.patch("rpg_world.utils.logger.time.monotonic", return_value=100.0)
+    Logger.flush_rate_limits()
+
+    with caplog.at_level(logging.INFO):
+        for i in range(5):
+            logger.info("Polling %d.", i, rate_limit=1)
+        Logger.flush()
+        Logger.flush()
+
+    assert caplog.messages == ["Polling 0.", "Polling 4. (3 similar messages suppressed)"]
+
+def test_logger_rate_limit_is_thread_safe(setup_logger, caplog, mocker):
+    """Test that concurrent calls from one call site are neither lost nor double counted."""
+    import threading
+    logger = setup_logger
+    mocker.patch("rpg_world.utils.logger.time.monotonic", return_value=100.0)
+
+    def spam():
+        for _ in range(2000):
+            logger.info("Threaded message.", rate_limit=3)
+
+    Logger.flush_rate_limits()
+    with caplog.at_level(logging.INFO):
+        threads = [threading.Thread(target=spam) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        Logger.flush()
+
+    assert len(caplog.messages) == 4
+    assert caplog.messages[-1] == "Threaded message. (7996 similar messages suppressed)"
+
+def test_logger_sample_rate(setup_logger, caplog, mocker):
+    """Test that sampled messages are only logged when the random draw falls below the rate."""
+    logger = setup_logger
+    mocker.patch("rpg_world.utils.logger.random.random", side_effect=[0.2, 0.7])
+
+    with caplog.at_level(logging.INFO):
+        logger.info("Sampled message.", sample_rate=0.5)
+        logger.info("Dropped message.", sample_rate=0.5)
+
+    assert caplog.messages == ["Sampled message."]
@@ -0,0 +1,82 @@
+import logging
+import pytest
+from rpg_world import Logger, RingBufferHandler, SaveManager
+
+def make_record(message, level=logging.INFO):
+    return logging.LogRecord("rpg_world.test", level, __file__, 0, message, None, None)
+
+def test_ring_buffer_keeps_last_records():
+    """Test that only the most recent records are kept, oldest first."""
+    handler = RingBufferHandler(capacity=3)
+
+    for i in range(5):
+        handler.handle(make_record(str(i)))
+
+    assert [record.getMessage() for record in handler.records()] == ["2", "3", "4"]
+
+def test_ring_buffer_dumps_on_error(tmp_path):
+    """Test that an error record dumps the buffer, including the error, and empties it."""
+    dump_file = tmp_path / "dump.log"
+    handler = RingBufferHandler(capacity=10, dump_file=str(dump_file))
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+
+    handler.handle(make_record("Before the failure.", logging.DEBUG))
+    handler.handle(make_record("Something broke.", logging.ERROR))
+
+    lines = dump_file.read_text().splitlines()
+    assert lines[1:] == ["DEBUG Before the failure.", "ERROR Something broke."]
+    assert handler.records() == []
+    assert handler.dumps == 1
+
+def test_ring_buffer_freezes_arguments(tmp_path):
+    """Test that a dump shows arguments as they were when logged, not as they are when dumped."""
+    dump_file = tmp_path / "dump.log"
+    handler = RingBufferHandler(capacity=10, dump_file=str(dump_file))
+    stats = {"health": 100}
+    record = logging.LogRecord("rpg_world.test", logging.INFO, __file__, 0, "Stats: %s", (stats,), None)
+
+    handler.handle(record)
+    stats["health"] = 0
+    handler.dump()
+
+    assert dump_file.read_text().splitlines()[1:] == ["Stats: {'health': 100}"]
+
+def test_ring_buffer_rejects_zero_capacity():
+    """Test that a ring buffer needs room for at least one record."""
+    with pytest.raises(ValueError):
+        RingBufferHandler(capacity=0)
+
+def test_logger_ring_buffer_captures_below_output_level(tmp_path):
+    """Test that the ring buffer gets debug records and is dumped when saving fails."""
+    dump_file = tmp_path / "crash.log"
+    save_manager = SaveManager(save_directory=str(tmp_path), file_name='save.pkl')
+    save_manager.save_path = str(tmp_path / "missing" / "save.pkl")
+
+    Logger.enable_ring_buffer(capacity=100, dump_file=str(dump_file))
+    try:
+        assert save_manager.logger.is_enabled_for(logging.DEBUG)
+        save_manager.logger.debug("Preparing to save.")
+        save_manager.save_game({"level": 1})
+    finally:
+        Logger.disable_ring_buffer()
+
+    dump = dump_file.read_text()
+    assert "Preparing to save." in dump
+    assert "Error saving game" in dump
+    assert not save_manager.logger.is_enabled_for(logging.DEBUG)
+
+def test_logger_dump_ring_buffer_on_demand(tmp_path):
+    """Test dumping the ring buffer on demand."""
+    dump_file = tmp_path / "on_demand.log"
+    logger = Logger("rpg_world.test")
+
+    assert Logger.dump_ring_buffer() == 0
+
+    Logger.enable_ring_buffer(capacity=10)
+    try:
+        logger.info("Kept in memory.")
+        assert Logger.dump_ring_buffer(str(dump_file)) == 1
+    finally:
+        Logger.disable_ring_buffer()
+
+    assert "Kept in memory." in dump_file.read_text()